@@ -16,6 +16,8 @@ from PyQt6.QtCore import Qt
 # Ajouter le répertoire racine au PYTHONPATH
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from config import creer_dossiers
+
 # Import de la fenêtre de login
 from src.ui.login_window import LoginWindow
 
@@ -216,6 +218,9 @@ class FSSTApplication:
 def main():
     """Fonction principale"""
     
+    # Dossiers du projet (data, exports, ...)
+    creer_dossiers()
+    
     # Créer et lancer l'application
     app = FSSTApplication()
     sys.exit(app.run())
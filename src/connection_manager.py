@@ -0,0 +1,147 @@
+# src/connection_manager.py
+"""
+Gestionnaire de connexions SQLite pour Database
+Une connexion réutilisable par thread + transactions explicites
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class _ConnexionPartagee:
+    """
+    Enveloppe d'une connexion partagée du thread courant.
+    Les méthodes CRUD existantes appellent conn.close() et conn.commit() :
+    - close() ne ferme plus la connexion, il annule seulement ce qui n'a pas été validé
+    - commit() est différé tant qu'une transaction explicite est ouverte
+    """
+
+    def __init__(self, gestionnaire, connexion):
+        self._gestionnaire = gestionnaire
+        self._connexion = connexion
+
+    def __getattr__(self, nom):
+        return getattr(self._connexion, nom)
+
+    def commit(self):
+        if not self._gestionnaire.en_transaction():
+            self._connexion.commit()
+
+    def rollback(self):
+        if not self._gestionnaire.en_transaction():
+            self._connexion.rollback()
+
+    def close(self):
+        # Même comportement qu'une vraie fermeture : le travail non validé est perdu
+        if not self._gestionnaire.en_transaction() and self._connexion.in_transaction:
+            self._connexion.rollback()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+class ConnectionManager:
+    """Garde une connexion SQLite par thread et gère les transactions"""
+
+    def __init__(self, db_path, pragmas=None):
+        """
+        Args:
+            db_path: Chemin du fichier de base
+            pragmas: {nom: valeur} appliqués à chaque nouvelle connexion
+                     (voir config.DATABASE_PRAGMAS)
+        """
+        self.db_path = db_path
+        self.pragmas = dict(pragmas or {})
+        self._local = threading.local()
+
+    def _connexion_thread(self):
+        """Retourne (et crée si besoin) la connexion brute du thread courant"""
+        connexion = getattr(self._local, 'connexion', None)
+        if connexion is None:
+            # Attente sur verrou aussi pendant l'ouverture (avant les PRAGMA)
+            attente = self.pragmas.get('busy_timeout', 5000) / 1000
+            connexion = sqlite3.connect(self.db_path, timeout=attente)
+            # Accès par index (row[0]) ET par nom (row['nom'])
+            connexion.row_factory = sqlite3.Row
+            self._appliquer_pragmas(connexion)
+            self._local.connexion = connexion
+            self._local.profondeur = 0
+            self._local.data_version = None
+        return connexion
+
+    def _appliquer_pragmas(self, connexion):
+        """Applique le profil de connexion (journal_mode en premier)"""
+        for nom in sorted(self.pragmas, key=lambda nom: nom != 'journal_mode'):
+            valeur = self.pragmas[nom]
+            try:
+                resultat = connexion.execute(f'PRAGMA {nom} = {valeur}').fetchone()
+            except sqlite3.OperationalError as e:
+                # Base verrouillée par un autre processus : le réglage attendra la prochaine connexion
+                print(f"⚠️ PRAGMA {nom} non appliqué : {e}")
+                continue
+            if nom == 'journal_mode' and resultat and str(resultat[0]).lower() != str(valeur).lower():
+                # Ex. base en mémoire ou système de fichiers sans mémoire partagée
+                print(f"⚠️ journal_mode {valeur} indisponible, mode {resultat[0]} conservé")
+
+    def en_transaction(self):
+        """Indique si une transaction explicite est ouverte dans ce thread"""
+        return getattr(self._local, 'profondeur', 0) > 0
+
+    def base_modifiee_ailleurs(self):
+        """
+        Indique si une autre connexion (autre thread ou autre processus) a validé
+        des modifications depuis le dernier appel dans ce thread
+        (toujours vrai au premier appel sur une nouvelle connexion)
+        """
+        connexion = self._connexion_thread()
+        data_version = connexion.execute('PRAGMA data_version').fetchone()[0]
+        modifiee = data_version != self._local.data_version
+        self._local.data_version = data_version
+        return modifiee
+
+    def get_connection(self):
+        """Retourne la connexion partagée du thread courant"""
+        return _ConnexionPartagee(self, self._connexion_thread())
+
+    @contextmanager
+    def transaction(self):
+        """
+        Ouvre une transaction : tout ce qui est exécuté dans le bloc
+        (y compris par les méthodes CRUD) est validé en une seule fois,
+        ou annulé si une exception est levée. Les blocs imbriqués
+        rejoignent la transaction englobante.
+        """
+        connexion = self._connexion_thread()
+        if self._local.profondeur == 0 and connexion.in_transaction:
+            connexion.commit()
+
+        self._local.profondeur += 1
+        try:
+            yield _ConnexionPartagee(self, connexion)
+        except BaseException:
+            self._local.profondeur -= 1
+            if self._local.profondeur == 0:
+                connexion.rollback()
+            raise
+        else:
+            self._local.profondeur -= 1
+            if self._local.profondeur == 0:
+                connexion.commit()
+
+    def fermer(self):
+        """Ferme la connexion du thread courant (elle sera recréée au besoin)"""
+        connexion = getattr(self._local, 'connexion', None)
+        if connexion is not None:
+            if connexion.in_transaction:
+                connexion.rollback()
+            connexion.close()
+            self._local.connexion = None
+            self._local.profondeur = 0
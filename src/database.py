@@ -2,20 +2,185 @@
 import sqlite3
 import hashlib
 import os
-import shutil
-from datetime import datetime
-from config import DATABASE_PATH
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from config import DATABASE_PATH, DATABASE_PRAGMAS, SAUVEGARDE_CONFIG, CONTRAINTES, creer_dossiers
+from src.connection_manager import ConnectionManager
+from src.reference_cache import CacheReference
+from src.logic.conflict_detector import ConflictDetector
+from src.logic.workload_ledger import WorkloadLedger
+
+# Minutes depuis minuit d'une heure "HH:MM" (NULL si illisible)
+def _minutes_sql(colonne):
+    return (f"CASE WHEN instr({colonne}, ':') > 1 THEN "
+            f"CAST(substr({colonne}, 1, instr({colonne}, ':') - 1) AS INTEGER) * 60 "
+            f"+ CAST(substr({colonne}, instr({colonne}, ':') + 1) AS INTEGER) END")
+
+
+def _colonnes_horaires(table):
+    """Colonnes générées (virtuelles) : début/fin en minutes et numéro du jour"""
+    return [
+        f'ALTER TABLE {table} ADD COLUMN debut_min INTEGER '
+        f'GENERATED ALWAYS AS ({_minutes_sql("heure_debut")}) VIRTUAL',
+        f'ALTER TABLE {table} ADD COLUMN fin_min INTEGER '
+        f'GENERATED ALWAYS AS ({_minutes_sql("heure_fin")}) VIRTUAL',
+        f'ALTER TABLE {table} ADD COLUMN jour INTEGER '
+        f'GENERATED ALWAYS AS (CAST(julianday(date) AS INTEGER)) VIRTUAL',
+    ]
+
+
+# ═══════════════════════════════════════════════════════════
+# MIGRATIONS DU SCHÉMA
+# ═══════════════════════════════════════════════════════════
+# Chaque étape (version, [requêtes]) est appliquée une seule fois.
+# La version atteinte est enregistrée dans PRAGMA user_version.
+
+MIGRATIONS = [
+    # Version 1 : index composites pour les recherches par ressource et date
+    (1, [
+        'CREATE INDEX IF NOT EXISTS idx_seances_groupe_date '
+        'ON seances (groupe_id, date, heure_debut)',
+        'CREATE INDEX IF NOT EXISTS idx_seances_enseignant_date '
+        'ON seances (enseignant_id, date, heure_debut)',
+        'CREATE INDEX IF NOT EXISTS idx_seances_salle_date '
+        'ON seances (salle_id, date, heure_debut)',
+        'CREATE INDEX IF NOT EXISTS idx_seances_date '
+        'ON seances (date, heure_debut)',
+        'CREATE INDEX IF NOT EXISTS idx_reservations_statut '
+        'ON reservations (statut, date_demande)',
+        'CREATE INDEX IF NOT EXISTS idx_reservations_enseignant_statut '
+        'ON reservations (enseignant_id, statut)',
+        'CREATE INDEX IF NOT EXISTS idx_reservations_salle_date '
+        'ON reservations (salle_id, date)',
+        'CREATE INDEX IF NOT EXISTS idx_disponibilites_enseignant '
+        'ON disponibilites (enseignant_id, date_debut)',
+        'CREATE INDEX IF NOT EXISTS idx_utilisateurs_type '
+        'ON utilisateurs (type_user)',
+        'CREATE INDEX IF NOT EXISTS idx_groupes_nom '
+        'ON groupes (nom)',
+    ]),
+    # Version 2 : horaires en minutes entières pour la détection des conflits
+    # en SQL (une plage indexée par ressource et par jour)
+    (2, _colonnes_horaires('seances') + _colonnes_horaires('reservations') + [
+        'CREATE INDEX IF NOT EXISTS idx_seances_salle_creneau '
+        'ON seances (salle_id, jour, debut_min)',
+        'CREATE INDEX IF NOT EXISTS idx_seances_enseignant_creneau '
+        'ON seances (enseignant_id, jour, debut_min)',
+        'CREATE INDEX IF NOT EXISTS idx_seances_groupe_creneau '
+        'ON seances (groupe_id, jour, debut_min)',
+        'CREATE INDEX IF NOT EXISTS idx_reservations_salle_creneau '
+        'ON reservations (salle_id, jour, debut_min) WHERE statut = \'validee\'',
+        'CREATE INDEX IF NOT EXISTS idx_reservations_enseignant_creneau '
+        'ON reservations (enseignant_id, jour, debut_min) WHERE statut = \'validee\'',
+    ]),
+]
 
 class Database:
     """Classe pour gérer la base de données SQLite - FSTT"""
     
     def __init__(self):
+        creer_dossiers()
         self.db_path = DATABASE_PATH
+        self.connexions = ConnectionManager(self.db_path, DATABASE_PRAGMAS)
+        self.cache = CacheReference()
+        # Charge des enseignants (séances + réservations validées), construite au premier usage
+        self._registre_charge = None
+        # Session de sauvegarde en cours (par thread), cf. session_sauvegarde()
+        self._session_sauvegarde = threading.local()
         self.init_database()
     
     def get_connection(self):
-        """Retourne une connexion à la base de données"""
-        return sqlite3.connect(self.db_path)
+        """Retourne la connexion (réutilisée) du thread courant"""
+        return self.connexions.get_connection()
+    
+    def transaction(self):
+        """
+        Context manager de transaction : les méthodes CRUD appelées dans le bloc
+        partagent la même connexion et sont validées en un seul commit
+        
+        Exemple :
+            with db.transaction():
+                db.ajouter_salle(...)
+                db.ajouter_groupe(...)
+        """
+        return self.connexions.transaction()
+    
+    def fermer_connexion(self):
+        """Ferme la connexion du thread courant"""
+        self.connexions.fermer()
+    
+    def _lire_reference(self, table, cle, requete, params=()):
+        """
+        Lecture d'une table de référence à travers le cache
+        (relue en base si la table a été modifiée depuis)
+        """
+        self._verifier_modifications_externes()
+        
+        version = self.cache.version(table)
+        lignes = self.cache.lire(table, cle, version)
+        if lignes is not None:
+            return list(lignes)
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(requete, params)
+        lignes = cursor.fetchall()
+        # Ne jamais mettre en cache des données pas encore validées
+        if not self.connexions.en_transaction() and not conn.in_transaction:
+            self.cache.stocker(table, cle, version, lignes)
+        conn.close()
+        return lignes
+    
+    def _verifier_modifications_externes(self):
+        """Écriture validée par une autre connexion : on ne sait pas quelle table"""
+        if self.connexions.base_modifiee_ailleurs():
+            self.cache.invalider()
+            self._registre_charge = None
+    
+    def _charge(self):
+        """
+        Registre de charge des enseignants (minutes par jour et par semaine ISO),
+        construit en une requête puis tenu à jour par les écritures de séances
+        et de réservations
+        """
+        self._verifier_modifications_externes()
+        registre = self._registre_charge
+        if registre is not None:
+            return registre
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT enseignant_id, date, heure_debut, heure_fin FROM seances
+            WHERE enseignant_id IS NOT NULL
+            UNION ALL
+            SELECT enseignant_id, date, heure_debut, heure_fin FROM reservations
+            WHERE statut = 'validee'
+        ''')
+        registre = WorkloadLedger(dict(row) for row in cursor.fetchall())
+        # Ne jamais garder des données pas encore validées
+        if not self.connexions.en_transaction() and not conn.in_transaction:
+            self._registre_charge = registre
+        conn.close()
+        return registre
+    
+    def _mettre_a_jour_charge(self, retirees=(), ajoutees=()):
+        """
+        Reporte une écriture validée dans le registre de charge.
+        Dans une transaction explicite (qui peut encore être annulée),
+        le registre est simplement reconstruit au prochain usage.
+        """
+        registre = self._registre_charge
+        if registre is None:
+            return
+        if self.connexions.en_transaction():
+            self._registre_charge = None
+            return
+        for seance in retirees:
+            registre.remove(seance)
+        for seance in ajoutees:
+            registre.add(seance)
     
     def hash_password(self, password):
         """Hash un mot de passe avec SHA-256"""
@@ -140,28 +305,145 @@ class Database:
         
         conn.commit()
         conn.close()
+        
+        self.appliquer_migrations()
+        
         print("✅ Base de données initialisée avec succès!")
         print(f"📁 Fichier : {self.db_path}")
         print(f"📊 Tables créées : 8 tables")
+        print(f"🔢 Version du schéma : {self.get_version_schema()}")
+    
+    def get_version_schema(self):
+        """Retourne la version du schéma enregistrée dans la base"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('PRAGMA user_version')
+        version = cursor.fetchone()[0]
+        
+        conn.close()
+        return version
+    
+    def appliquer_migrations(self):
+        """Applique les migrations dont la version dépasse celle de la base"""
+        version_actuelle = self.get_version_schema()
+        
+        for version, requetes in MIGRATIONS:
+            if version <= version_actuelle:
+                continue
+            
+            # Chaque étape est atomique : requêtes + nouvelle version
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                for requete in requetes:
+                    cursor.execute(requete)
+                cursor.execute(f'PRAGMA user_version = {int(version)}')
+            
+            version_actuelle = version
+            print(f"🔧 Migration du schéma appliquée : version {version}")
+        
+        return version_actuelle
     
     # ═══════════════════════════════════════════════════════════
     # SÉCURITÉ ET BACKUP
     # ═══════════════════════════════════════════════════════════
 
     def sauvegarder_bdd(self):
-        """Crée une sauvegarde de sécurité de la base de données"""
-        if os.path.exists(self.db_path):
-            backup_dir = os.path.join(os.path.dirname(self.db_path), 'backups')
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"backup_fstt_{timestamp}.db"
-            backup_path = os.path.join(backup_dir, backup_name)
-            
-            shutil.copy2(self.db_path, backup_path)
-            print(f"🛡️ Sauvegarde créée : {backup_path}")
-            return backup_path
-        return None
+        """
+        Crée une sauvegarde de sécurité de la base de données.
+        Copie en ligne par l'API de sauvegarde SQLite, par paquets de pages :
+        les autres connexions continuent de lire et d'écrire pendant la copie,
+        et la sauvegarde est cohérente. Dans une session_sauvegarde(), seul
+        le premier appel copie la base, les suivants renvoient la même sauvegarde.
+        """
+        session = getattr(self._session_sauvegarde, 'etat', None)
+        if session is not None and session['chemin']:
+            return session['chemin']
+        if not os.path.exists(self.db_path):
+            return None
+        
+        backup_dir = self.dossier_sauvegardes()
+        os.makedirs(backup_dir, exist_ok=True)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_path = os.path.join(backup_dir, f"backup_fstt_{timestamp}.db")
+        numero = 2
+        while os.path.exists(backup_path):
+            backup_path = os.path.join(backup_dir, f"backup_fstt_{timestamp}_{numero}.db")
+            numero += 1
+        
+        # Écrite sous un nom temporaire : une copie interrompue n'est jamais prise pour une sauvegarde
+        temporaire = backup_path + '.part'
+        source = sqlite3.connect(self.db_path, timeout=DATABASE_PRAGMAS.get('busy_timeout', 5000) / 1000)
+        destination = sqlite3.connect(temporaire)
+        try:
+            source.backup(destination, pages=SAUVEGARDE_CONFIG['pages_par_etape'],
+                          sleep=SAUVEGARDE_CONFIG['pause_entre_etapes'])
+        finally:
+            destination.close()
+            source.close()
+        os.replace(temporaire, backup_path)
+        
+        print(f"🛡️ Sauvegarde créée : {backup_path}")
+        if session is not None:
+            session['chemin'] = backup_path
+        self.nettoyer_sauvegardes()
+        return backup_path
+    
+    @contextmanager
+    def session_sauvegarde(self):
+        """
+        Regroupe plusieurs opérations (ex. les 4 imports CSV) derrière une seule
+        sauvegarde : sauvegarder_bdd() ne copie la base qu'une fois dans le bloc.
+        Les blocs imbriqués rejoignent la session englobante.
+        """
+        if getattr(self._session_sauvegarde, 'etat', None) is not None:
+            yield
+            return
+        self._session_sauvegarde.etat = {'chemin': None}
+        try:
+            yield
+        finally:
+            self._session_sauvegarde.etat = None
+    
+    def dossier_sauvegardes(self):
+        return os.path.join(os.path.dirname(self.db_path), 'backups')
+    
+    def nettoyer_sauvegardes(self):
+        """
+        Rotation du dossier des sauvegardes (SAUVEGARDE_CONFIG) : garde les
+        `nombre_recentes` plus récentes, plus la dernière de chaque jour sur
+        `jours_conserves` jours. Retourne les fichiers supprimés.
+        """
+        backup_dir = self.dossier_sauvegardes()
+        if not os.path.isdir(backup_dir):
+            return []
+        
+        sauvegardes = []
+        for nom in os.listdir(backup_dir):
+            if nom.startswith('backup_fstt_') and nom.endswith('.db'):
+                chemin = os.path.join(backup_dir, nom)
+                sauvegardes.append((os.path.getmtime(chemin), chemin))
+        sauvegardes.sort(reverse=True)
+        
+        a_garder = {chemin for _, chemin in sauvegardes[:SAUVEGARDE_CONFIG['nombre_recentes']]}
+        limite = datetime.now().date() - timedelta(days=SAUVEGARDE_CONFIG['jours_conserves'])
+        jours_vus = set()
+        for date_modif, chemin in sauvegardes:
+            jour = datetime.fromtimestamp(date_modif).date()
+            if jour > limite and jour not in jours_vus:
+                jours_vus.add(jour)
+                a_garder.add(chemin)
+        
+        supprimees = []
+        for _, chemin in sauvegardes:
+            if chemin not in a_garder:
+                try:
+                    os.remove(chemin)
+                    supprimees.append(chemin)
+                except OSError:
+                    pass
+        return supprimees
     
     # ═══════════════════════════════════════════════════════════
     # MÉTHODES CRUD - UTILISATEURS
@@ -182,6 +464,7 @@ class Database:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ''', (nom, prenom, email, mot_de_passe_hash, type_user, specialite, 
                   groupe_id, duree_max_jour))
+            self.cache.invalider('utilisateurs')
             
             conn.commit()
             user_id = cursor.lastrowid
@@ -192,6 +475,37 @@ class Database:
         finally:
             conn.close()
     
+    def ajouter_utilisateurs_en_masse(self, utilisateurs):
+        """
+        Ajoute plusieurs utilisateurs en une seule transaction (import CSV)
+        
+        Args:
+            utilisateurs: liste de tuples (nom, prenom, email, mot_de_passe, type_user,
+                          specialite, groupe_id, duree_max_jour), mot de passe en clair
+        
+        Returns:
+            int: nombre d'utilisateurs réellement insérés (emails en double ignorés)
+        """
+        # Les imports utilisent un mot de passe par défaut : un seul hash par valeur
+        hashes = {}
+        lignes = []
+        for nom, prenom, email, mot_de_passe, type_user, specialite, groupe_id, duree_max_jour in utilisateurs:
+            if mot_de_passe not in hashes:
+                hashes[mot_de_passe] = self.hash_password(mot_de_passe)
+            lignes.append((nom, prenom, email, hashes[mot_de_passe], type_user,
+                           specialite, groupe_id, duree_max_jour))
+        
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            avant = conn.total_changes
+            cursor.executemany('''
+                INSERT OR IGNORE INTO utilisateurs (nom, prenom, email, mot_de_passe, type_user,
+                                                    specialite, groupe_id, duree_max_jour)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', lignes)
+            self.cache.invalider('utilisateurs')
+            return conn.total_changes - avant
+    
     def verifier_connexion(self, email, mot_de_passe):
         """Vérifie les identifiants de connexion"""
         conn = self.get_connection()
@@ -215,6 +529,9 @@ class Database:
         cursor = conn.cursor()
         
         cursor.execute('DELETE FROM utilisateurs WHERE type_user = ?', (type_user,))
+        self.cache.invalider('utilisateurs')
+        # Séances et réservations des enseignants supprimés (ON DELETE si clés étrangères actives)
+        self._registre_charge = None
         nb_supprime = cursor.rowcount
         
         conn.commit()
@@ -224,18 +541,10 @@ class Database:
     
     def get_tous_utilisateurs(self, type_user=None):
         """Récupère tous les utilisateurs (optionnel : filtré par type)"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         if type_user:
-            cursor.execute('SELECT * FROM utilisateurs WHERE type_user = ?', (type_user,))
-        else:
-            cursor.execute('SELECT * FROM utilisateurs')
-        
-        utilisateurs = cursor.fetchall()
-        conn.close()
-        
-        return utilisateurs
+            return self._lire_reference('utilisateurs', type_user,
+                                        'SELECT * FROM utilisateurs WHERE type_user = ?', (type_user,))
+        return self._lire_reference('utilisateurs', None, 'SELECT * FROM utilisateurs')
 
     def get_utilisateur_by_id(self, user_id):
         """Récupère un utilisateur par son ID"""
@@ -300,6 +609,7 @@ class Database:
         
         try:
             cursor.execute(requete, valeurs)
+            self.cache.invalider('utilisateurs')
             conn.commit()
             return True
         except sqlite3.IntegrityError as e:
@@ -314,6 +624,8 @@ class Database:
         cursor = conn.cursor()
         
         cursor.execute('DELETE FROM utilisateurs WHERE id = ?', (user_id,))
+        self.cache.invalider('utilisateurs')
+        self._registre_charge = None
         nb_supprime = cursor.rowcount
         
         conn.commit()
@@ -350,6 +662,7 @@ class Database:
             SET duree_max_jour = ?
             WHERE id = ? AND type_user = 'enseignant'
         ''', (duree_minutes, enseignant_id))
+        self.cache.invalider('utilisateurs')
         
         conn.commit()
         nb_modif = cursor.rowcount
@@ -358,27 +671,16 @@ class Database:
         return nb_modif > 0
 
     def calculer_duree_journee_enseignant(self, enseignant_id, date):
-        """Calcule le total d'heures d'un enseignant pour une date donnée"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT heure_debut, heure_fin 
-            FROM seances 
-            WHERE enseignant_id = ? AND date = ?
-        ''', (enseignant_id, date))
-        
-        seances = cursor.fetchall()
-        conn.close()
-        
-        total_minutes = 0
-        for seance in seances:
-            heure_debut = seance[0]
-            heure_fin = seance[1]
-            duree = self.calculer_duree_minutes(heure_debut, heure_fin)
-            total_minutes += duree
-        
-        return total_minutes
+        """Calcule le total (en minutes) d'un enseignant pour une date donnée"""
+        return self._charge().day_minutes(enseignant_id, date)
+
+    def calculer_duree_semaine_enseignant(self, enseignant_id, date):
+        """Total (en minutes) de la semaine ISO (lundi-dimanche) contenant la date"""
+        return self._charge().week_minutes(enseignant_id, date)
+
+    def calculer_duree_periode_enseignant(self, enseignant_id, date_debut, date_fin):
+        """Total (en minutes) du date_debut au date_fin inclus"""
+        return self._charge().period_minutes(enseignant_id, date_debut, date_fin)
 
     def calculer_duree_minutes(self, heure_debut, heure_fin):
         """Calcule la durée en minutes entre deux heures (format HH:MM)"""
@@ -392,11 +694,16 @@ class Database:
         return int(duree)
 
     def peut_ajouter_seance_enseignant(self, enseignant_id, date, duree_seance):
-        """Vérifie si on peut ajouter une séance sans dépasser la durée max"""
-        duree_actuelle = self.calculer_duree_journee_enseignant(enseignant_id, date)
-        duree_max = self.get_duree_max_enseignant(enseignant_id)
-        
-        return (duree_actuelle + duree_seance) <= duree_max
+        """
+        Vérifie si on peut ajouter une séance sans dépasser la durée max
+        du jour (duree_max_jour) ni celle de la semaine
+        (CONTRAINTES['duree_max_semaine_enseignant'])
+        """
+        return self._charge().fits(
+            enseignant_id, date, duree_seance,
+            max_day=self.get_duree_max_enseignant(enseignant_id),
+            max_week=CONTRAINTES['duree_max_semaine_enseignant']
+        )
     
     # ═══════════════════════════════════════════════════════════
     # MÉTHODES CRUD - FILIÈRES
@@ -411,6 +718,7 @@ class Database:
             INSERT INTO filieres (nom, niveau)
             VALUES (?, ?)
         ''', (nom, niveau))
+        self.cache.invalider('filieres')
         
         conn.commit()
         filiere_id = cursor.lastrowid
@@ -420,14 +728,7 @@ class Database:
     
     def get_toutes_filieres(self):
         """Récupère toutes les filières"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM filieres ORDER BY niveau, nom')
-        filieres = cursor.fetchall()
-        
-        conn.close()
-        return filieres
+        return self._lire_reference('filieres', None, 'SELECT * FROM filieres ORDER BY niveau, nom')
     
     def get_filiere_by_nom(self, nom):
         """Récupère une filière par son nom"""
@@ -453,6 +754,7 @@ class Database:
             INSERT INTO groupes (nom, effectif, filiere_id)
             VALUES (?, ?, ?)
         ''', (nom, effectif, filiere_id))
+        self.cache.invalider('groupes')
         
         conn.commit()
         groupe_id = cursor.lastrowid
@@ -460,16 +762,29 @@ class Database:
         
         return groupe_id
     
+    def ajouter_groupes_en_masse(self, groupes):
+        """
+        Ajoute plusieurs groupes en une seule transaction
+        
+        Args:
+            groupes: liste de tuples (nom, effectif, filiere_id)
+        
+        Returns:
+            int: nombre de groupes insérés
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            avant = conn.total_changes
+            cursor.executemany('''
+                INSERT OR IGNORE INTO groupes (nom, effectif, filiere_id)
+                VALUES (?, ?, ?)
+            ''', groupes)
+            self.cache.invalider('groupes')
+            return conn.total_changes - avant
+    
     def get_tous_groupes(self):
         """Récupère tous les groupes"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM groupes')
-        groupes = cursor.fetchall()
-        
-        conn.close()
-        return groupes
+        return self._lire_reference('groupes', None, 'SELECT * FROM groupes')
     
     def get_groupe_by_nom_filiere(self, nom_groupe, filiere_id):
         """Récupère un groupe par nom et filière"""
@@ -503,6 +818,9 @@ class Database:
         cursor = conn.cursor()
         
         cursor.execute('DELETE FROM groupes')
+        self.cache.invalider('groupes')
+        # Séances des groupes supprimés (ON DELETE CASCADE si clés étrangères actives)
+        self._registre_charge = None
         nb_supprime = cursor.rowcount
         
         conn.commit()
@@ -524,6 +842,7 @@ class Database:
                 INSERT INTO salles (nom, capacite, type_salle, equipements)
                 VALUES (?, ?, ?, ?)
             ''', (nom, capacite, type_salle, equipements))
+            self.cache.invalider('salles')
             
             conn.commit()
             salle_id = cursor.lastrowid
@@ -534,16 +853,29 @@ class Database:
         finally:
             conn.close()
     
+    def ajouter_salles_en_masse(self, salles):
+        """
+        Ajoute plusieurs salles en une seule transaction
+        
+        Args:
+            salles: liste de tuples (nom, capacite, type_salle, equipements)
+        
+        Returns:
+            int: nombre de salles insérées (noms déjà existants ignorés)
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            avant = conn.total_changes
+            cursor.executemany('''
+                INSERT OR IGNORE INTO salles (nom, capacite, type_salle, equipements)
+                VALUES (?, ?, ?, ?)
+            ''', salles)
+            self.cache.invalider('salles')
+            return conn.total_changes - avant
+    
     def get_toutes_salles(self):
         """Récupère toutes les salles"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM salles ORDER BY nom')
-        salles = cursor.fetchall()
-        
-        conn.close()
-        return salles
+        return self._lire_reference('salles', None, 'SELECT * FROM salles ORDER BY nom')
     
     def supprimer_toutes_salles(self):
         """Supprime toutes les salles (pour import)"""
@@ -551,6 +883,9 @@ class Database:
         cursor = conn.cursor()
         
         cursor.execute('DELETE FROM salles')
+        self.cache.invalider('salles')
+        # Réservations des salles supprimées (ON DELETE CASCADE si clés étrangères actives)
+        self._registre_charge = None
         nb_supprime = cursor.rowcount
         
         conn.commit()
@@ -578,6 +913,10 @@ class Database:
             
             conn.commit()
             seance_id = cursor.lastrowid
+            self._mettre_a_jour_charge(ajoutees=[{
+                'enseignant_id': enseignant_id, 'date': date,
+                'heure_debut': heure_debut, 'heure_fin': heure_fin
+            }])
             return seance_id
         except Exception as e:
             print(f"❌ Erreur ajout séance : {e}")
@@ -585,6 +924,35 @@ class Database:
         finally:
             conn.close()
 
+    def deplacer_seance(self, seance_id, date, heure_debut, heure_fin, salle_id):
+        """Déplace une séance existante (nouveau créneau et/ou nouvelle salle)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT enseignant_id, date, heure_debut, heure_fin FROM seances WHERE id = ?',
+                           (seance_id,))
+            avant = cursor.fetchone()
+            cursor.execute('''
+                UPDATE seances
+                SET date = ?, heure_debut = ?, heure_fin = ?, salle_id = ?
+                WHERE id = ?
+            ''', (date, heure_debut, heure_fin, salle_id, seance_id))
+            
+            conn.commit()
+            if avant is not None:
+                avant = dict(avant)
+                self._mettre_a_jour_charge(
+                    retirees=[avant],
+                    ajoutees=[dict(avant, date=date, heure_debut=heure_debut, heure_fin=heure_fin)]
+                )
+            return cursor.rowcount > 0
+        except Exception as e:
+            print(f"❌ Erreur déplacement séance : {e}")
+            return False
+        finally:
+            conn.close()
+
     def get_seances_by_groupe(self, groupe_id, date_debut=None, date_fin=None):
         """Récupère les séances d'un groupe"""
         conn = self.get_connection()
@@ -647,60 +1015,74 @@ class Database:
         
         return seances
 
-    def verifier_conflit_seance(self, date, heure_debut, heure_fin, 
-                               salle_id=None, enseignant_id=None, groupe_id=None):
-        """Vérifie s'il y a un conflit pour une séance"""
+    def rechercher_conflits(self, date, heure_debut, heure_fin, salle_id=None,
+                            enseignant_id=None, groupe_id=None, exclure_seance_id=None,
+                            pause=None):
+        """
+        Séances et réservations validées qui occupent la salle, l'enseignant
+        ou le groupe sur le créneau, pause comprise (ConflictDetector.PAUSE_MINUTES).
+        Une seule requête : chaque branche est une recherche de plage sur
+        l'index (ressource, jour, debut_min).
+        
+        Retourne des dictionnaires de séance avec 'ressource' ('salle',
+        'enseignant' ou 'groupe') et 'source' ('seance' ou 'reservation').
+        """
+        pause = ConflictDetector.PAUSE_MINUTES if pause is None else pause
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        conflits = []
-        
-        # Conflit salle
-        if salle_id:
-            cursor.execute('''
-                SELECT * FROM seances 
-                WHERE salle_id = ? AND date = ? 
-                AND ((heure_debut < ? AND heure_fin > ?) OR 
-                     (heure_debut < ? AND heure_fin > ?) OR
-                     (heure_debut >= ? AND heure_fin <= ?))
-            ''', (salle_id, date, heure_fin, heure_debut, 
-                  heure_fin, heure_debut, heure_debut, heure_fin))
-            
-            if cursor.fetchone():
-                conflits.append("Salle déjà occupée")
-        
-        # Conflit enseignant
-        if enseignant_id:
-            cursor.execute('''
-                SELECT * FROM seances 
-                WHERE enseignant_id = ? AND date = ? 
-                AND ((heure_debut < ? AND heure_fin > ?) OR 
-                     (heure_debut < ? AND heure_fin > ?) OR
-                     (heure_debut >= ? AND heure_fin <= ?))
-            ''', (enseignant_id, date, heure_fin, heure_debut, 
-                  heure_fin, heure_debut, heure_debut, heure_fin))
-            
-            if cursor.fetchone():
-                conflits.append("Enseignant déjà occupé")
-        
-        # Conflit groupe
-        if groupe_id:
-            cursor.execute('''
-                SELECT * FROM seances 
-                WHERE groupe_id = ? AND date = ? 
-                AND ((heure_debut < ? AND heure_fin > ?) OR 
-                     (heure_debut < ? AND heure_fin > ?) OR
-                     (heure_debut >= ? AND heure_fin <= ?))
-            ''', (groupe_id, date, heure_fin, heure_debut, 
-                  heure_fin, heure_debut, heure_debut, heure_fin))
-            
-            if cursor.fetchone():
-                conflits.append("Groupe déjà occupé")
+        colonnes = "id, date, heure_debut, heure_fin, salle_id, enseignant_id"
+        creneau = ("jour = CAST(julianday(:date) AS INTEGER) "
+                   "AND debut_min < demande.fin + :pause AND fin_min + :pause > demande.debut")
+        cursor.execute(f'''
+            WITH demande(debut, fin) AS (
+                SELECT {_minutes_sql(':heure_debut')}, {_minutes_sql(':heure_fin')}
+            )
+            SELECT 'salle' AS ressource, 'seance' AS source, {colonnes}, groupe_id, titre
+            FROM seances, demande
+            WHERE salle_id = :salle AND {creneau} AND id IS NOT :exclure
+            UNION ALL
+            SELECT 'salle', 'reservation', {colonnes}, NULL, motif
+            FROM reservations, demande
+            WHERE salle_id = :salle AND statut = 'validee' AND {creneau}
+            UNION ALL
+            SELECT 'enseignant', 'seance', {colonnes}, groupe_id, titre
+            FROM seances, demande
+            WHERE enseignant_id = :enseignant AND {creneau} AND id IS NOT :exclure
+            UNION ALL
+            SELECT 'enseignant', 'reservation', {colonnes}, NULL, motif
+            FROM reservations, demande
+            WHERE enseignant_id = :enseignant AND statut = 'validee' AND {creneau}
+            UNION ALL
+            SELECT 'groupe', 'seance', {colonnes}, groupe_id, titre
+            FROM seances, demande
+            WHERE groupe_id = :groupe AND {creneau} AND id IS NOT :exclure
+        ''', {
+            'date': date, 'heure_debut': heure_debut, 'heure_fin': heure_fin,
+            'pause': pause, 'salle': salle_id, 'enseignant': enseignant_id,
+            'groupe': groupe_id, 'exclure': exclure_seance_id
+        })
+        conflits = [dict(row) for row in cursor.fetchall()]
         
         conn.close()
-        
         return conflits
     
+    def verifier_conflit_seance(self, date, heure_debut, heure_fin, 
+                               salle_id=None, enseignant_id=None, groupe_id=None):
+        """Vérifie s'il y a un conflit pour une séance (pause comprise)"""
+        messages = {
+            'salle': "Salle déjà occupée",
+            'enseignant': "Enseignant déjà occupé",
+            'groupe': "Groupe déjà occupé"
+        }
+        occupees = {
+            conflit['ressource']
+            for conflit in self.rechercher_conflits(date, heure_debut, heure_fin,
+                                                    salle_id, enseignant_id, groupe_id)
+        }
+        return [message for ressource, message in messages.items() if ressource in occupees]
+    
     # ═══════════════════════════════════════════════════════════
     # MÉTHODES CRUD - RÉSERVATIONS
     # ═══════════════════════════════════════════════════════════
@@ -744,6 +1126,9 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        cursor.execute('SELECT enseignant_id, date, heure_debut, heure_fin, statut '
+                       'FROM reservations WHERE id = ?', (reservation_id,))
+        avant = cursor.fetchone()
         cursor.execute('''
             UPDATE reservations 
             SET statut = ?
@@ -753,8 +1138,80 @@ class Database:
         conn.commit()
         conn.close()
         
+        # Seules les réservations validées comptent dans la charge
+        if avant is not None and (avant['statut'] == 'validee') != (statut == 'validee'):
+            if statut == 'validee':
+                self._mettre_a_jour_charge(ajoutees=[dict(avant)])
+            else:
+                self._mettre_a_jour_charge(retirees=[dict(avant)])
+        
         return True
     
+    # ═══════════════════════════════════════════════════════════
+    # MÉTHODES CRUD - INDISPONIBILITÉS ENSEIGNANTS
+    # ═══════════════════════════════════════════════════════════
+    # date_debut / date_fin : "YYYY-MM-DD HH:MM" pour un créneau,
+    # "YYYY-MM-DD" pour des journées entières (saisie de l'espace enseignant)
+    
+    def ajouter_disponibilite(self, enseignant_id, date, heure_debut, heure_fin, motif=""):
+        """Déclare un créneau d'indisponibilité d'un enseignant"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO disponibilites (enseignant_id, date_debut, date_fin, motif)
+            VALUES (?, ?, ?, ?)
+        ''', (enseignant_id, f"{date} {heure_debut}", f"{date} {heure_fin}", motif))
+        
+        conn.commit()
+        dispo_id = cursor.lastrowid
+        conn.close()
+        
+        return dispo_id
+    
+    def get_dispo_prof(self, enseignant_id):
+        """Récupère les indisponibilités d'un enseignant"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM disponibilites
+            WHERE enseignant_id = ?
+            ORDER BY date_debut
+        ''', (enseignant_id,))
+        
+        dispos = cursor.fetchall()
+        conn.close()
+        return dispos
+    
+    def get_indisponibilites_periode(self, enseignant_id, date_debut, date_fin):
+        """Indisponibilités d'un enseignant qui touchent les jours date_debut à date_fin ("YYYY-MM-DD")"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM disponibilites
+            WHERE enseignant_id = ? AND date_debut < date(?, '+1 day') AND date_fin >= ?
+            ORDER BY date_debut
+        ''', (enseignant_id, date_fin, date_debut))
+        
+        dispos = cursor.fetchall()
+        conn.close()
+        return dispos
+    
+    def supprimer_disponibilite(self, dispo_id):
+        """Supprime une indisponibilité"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM disponibilites WHERE id = ?', (dispo_id,))
+        supprime = cursor.rowcount > 0
+        
+        conn.commit()
+        conn.close()
+        
+        return supprime
+    
     # ═══════════════════════════════════════════════════════════
     # HISTORIQUE IMPORTS
     # ═══════════════════════════════════════════════════════════
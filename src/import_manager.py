@@ -2,13 +2,26 @@
 import csv
 import os
 from src.database import Database
+from src.logic.csv_import_service import CSVImportService
 from config import COLONNES_ETUDIANTS, COLONNES_ENSEIGNANTS, COLONNES_SALLES, COLONNES_GROUPES
 
 class ImportManager:
     """Classe pour gérer les imports massifs CSV de la FSTT"""
     
-    def __init__(self):
+    def __init__(self, en_masse=True, admin_id=None):
+        """
+        Args:
+            en_masse: True = lignes validées en mémoire puis insérées en une seule
+                      transaction (executemany), False = une insertion par ligne
+            admin_id: Administrateur enregistré dans l'historique des imports
+        """
         self.db = Database()
+        self.en_masse = en_masse
+        self.admin_id = admin_id
+        # Validation et insertion en masse partagées avec CSVImportService
+        # (ici : filière inconnue = groupe refusé, mot de passe enseignant "prof123")
+        self.service = CSVImportService(self.db, create_filieres=False,
+                                        passwords={'enseignant': 'prof123'})
     
     def parse_csv(self, fichier_path):
         """Lit un fichier CSV et retourne une liste de dictionnaires"""
@@ -45,23 +58,27 @@ class ImportManager:
         # 1. Sauvegarde de sécurité
         self.db.sauvegarder_bdd()
         
-        # 2. Nettoyage
-        self.db.supprimer_toutes_salles()
-        
-        # 3. Insertion
-        succes = 0
-        for ligne in donnees:
-            res = self.db.ajouter_salle(
-                ligne['nom'], 
-                int(ligne['capacite']), 
-                ligne['type_salle'], 
-                ligne.get('equipements', '')
-            )
-            if res: 
-                succes += 1
+        if self.en_masse:
+            # 2 + 3. Nettoyage et insertion dans la même transaction
+            succes = self._importer_en_masse(self.service.bulk_import_salles, donnees)
+        else:
+            # 2. Nettoyage
+            self.db.supprimer_toutes_salles()
+            
+            # 3. Insertion
+            succes = 0
+            for ligne in donnees:
+                res = self.db.ajouter_salle(
+                    ligne['nom'], 
+                    int(ligne['capacite']), 
+                    ligne['type_salle'], 
+                    ligne.get('equipements', '')
+                )
+                if res: 
+                    succes += 1
             
-        # 4. Historique (ID 1 par défaut pour l'admin système)
-        self.db.ajouter_historique_import("Salles", succes, os.path.basename(fichier_path), 1)
+        # 4. Historique
+        self.db.ajouter_historique_import("Salles", succes, os.path.basename(fichier_path), self.admin_id)
         print(f"✅ Import réussi : {succes} salles ajoutées.")
         return True
 
@@ -84,6 +101,18 @@ class ImportManager:
 
         self.db.sauvegarder_bdd()
         
+        if self.en_masse:
+            if mode == 'remplacer':
+                print("🗑️  Anciennes données supprimées")
+            else:
+                print("➕ Mode fusion : ajout sans suppression")
+            succes = self._importer_en_masse(self.service.bulk_import_users, donnees,
+                                             'enseignant', replace=(mode == 'remplacer'))
+            
+            self.db.ajouter_historique_import("Enseignants", succes, os.path.basename(fichier_path), self.admin_id)
+            print(f"✅ Import réussi : {succes} enseignants ajoutés.")
+            return True
+        
         if mode == 'remplacer':
             self.db.supprimer_tous_utilisateurs_type('enseignant')
             print("🗑️  Anciennes données supprimées")
@@ -108,7 +137,7 @@ class ImportManager:
             if res: 
                 succes += 1
             
-        self.db.ajouter_historique_import("Enseignants", succes, os.path.basename(fichier_path), 1)
+        self.db.ajouter_historique_import("Enseignants", succes, os.path.basename(fichier_path), self.admin_id)
         print(f"✅ Import réussi : {succes} enseignants ajoutés.")
         return True
 
@@ -124,6 +153,12 @@ class ImportManager:
             return False
 
         self.db.sauvegarder_bdd()
+        
+        if self.en_masse:
+            succes = self._importer_en_masse(self.service.bulk_import_groupes, donnees)
+            erreurs = len(donnees) - succes
+            return self._terminer_import_groupes(fichier_path, succes, erreurs)
+        
         self.db.supprimer_tous_groupes()
         
         succes = 0
@@ -150,7 +185,11 @@ class ImportManager:
             else:
                 erreurs += 1
         
-        self.db.ajouter_historique_import("Groupes", succes, os.path.basename(fichier_path), 1)
+        return self._terminer_import_groupes(fichier_path, succes, erreurs)
+
+    def _terminer_import_groupes(self, fichier_path, succes, erreurs):
+        """Historique + résumé de l'import des groupes"""
+        self.db.ajouter_historique_import("Groupes", succes, os.path.basename(fichier_path), self.admin_id)
         
         if erreurs > 0:
             print(f"⚠️ Import partiel : {succes} groupes ajoutés, {erreurs} erreurs.")
@@ -171,6 +210,12 @@ class ImportManager:
             return False
 
         self.db.sauvegarder_bdd()
+        
+        if self.en_masse:
+            succes = self._importer_en_masse(self.service.bulk_import_users, donnees, 'etudiant')
+            erreurs = len(donnees) - succes
+            return self._terminer_import_etudiants(fichier_path, succes, erreurs)
+        
         self.db.supprimer_tous_utilisateurs_type('etudiant')
         
         succes = 0
@@ -201,7 +246,11 @@ class ImportManager:
             else:
                 erreurs += 1
         
-        self.db.ajouter_historique_import("Étudiants", succes, os.path.basename(fichier_path), 1)
+        return self._terminer_import_etudiants(fichier_path, succes, erreurs)
+
+    def _terminer_import_etudiants(self, fichier_path, succes, erreurs):
+        """Historique + résumé de l'import des étudiants"""
+        self.db.ajouter_historique_import("Étudiants", succes, os.path.basename(fichier_path), self.admin_id)
         
         if erreurs > 0:
             print(f"⚠️ Import partiel : {succes} étudiants ajoutés, {erreurs} erreurs.")
@@ -210,6 +259,18 @@ class ImportManager:
         
         return True
 
+    # ═══════════════════════════════════════════════════════════
+    # MODE EN MASSE (CSVImportService)
+    # ═══════════════════════════════════════════════════════════
+
+    def _importer_en_masse(self, fonction, donnees, *args, **kwargs):
+        """Valide et insère via le service en une transaction ; affiche les lignes ignorées"""
+        self.service.warnings = []
+        succes = fonction(donnees, *args, **kwargs)
+        for avertissement in self.service.warnings:
+            print(f"⚠️ {avertissement}")
+        return succes
+
     def import_tous_fichiers(self, dossier_templates):
         """Importe automatiquement tous les CSV du dossier templates"""
         print("🚀 Lancement de l'import complet...")
@@ -223,15 +284,17 @@ class ImportManager:
         
         resultats = {}
         
-        for nom_fichier, fonction_import in fichiers.items():
-            chemin = os.path.join(dossier_templates, nom_fichier)
-            
-            if os.path.exists(chemin):
-                print(f"\n📄 Import de {nom_fichier}...")
-                resultats[nom_fichier] = fonction_import(chemin)
-            else:
-                print(f"⚠️ Fichier {nom_fichier} introuvable, ignoré.")
-                resultats[nom_fichier] = False
+        # Une seule sauvegarde pour tout l'import (chaque import en demande une)
+        with self.db.session_sauvegarde():
+            for nom_fichier, fonction_import in fichiers.items():
+                chemin = os.path.join(dossier_templates, nom_fichier)
+                
+                if os.path.exists(chemin):
+                    print(f"\n📄 Import de {nom_fichier}...")
+                    resultats[nom_fichier] = fonction_import(chemin)
+                else:
+                    print(f"⚠️ Fichier {nom_fichier} introuvable, ignoré.")
+                    resultats[nom_fichier] = False
         
         print("\n" + "="*50)
         print("📊 RÉSUMÉ DE L'IMPORT")
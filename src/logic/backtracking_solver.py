@@ -0,0 +1,451 @@
+# src/logic/backtracking_solver.py
+"""
+Constraint-satisfaction engine for whole-faculty timetable generation
+Backtracking with most-constrained-first variable ordering and
+forward checking on room, teacher and group domains
+"""
+
+import time
+from typing import List, Dict, Optional, Tuple
+import config
+from src.logic.conflict_detector import ConflictDetector
+from src.logic.occupancy_grid import OccupancyGrid
+from src.logic.time_utils import TimeUtils
+from src.logic.workload_ledger import WorkloadLedger
+
+
+class BacktrackingSolver:
+    """
+    Places every weekly session of a list of courses.
+
+    Variables are the sessions to place (one per course and per weekly
+    occurrence). Their domain is a set of time options (date, start, end);
+    the room is chosen when a value is tried. Constraints:
+    - a room, a teacher or a group holds one session at a time (pause included)
+    - sessions of the same course are on different days
+    - rooms must fit the group (effectif <= capacite)
+    - a teacher does not teach more than their daily limit (duree_max_jour)
+    - existing sessions and approved reservations are left untouched
+    """
+
+    # Room type preferred by session type (soft constraint, used to order rooms)
+    PREFERRED_ROOM_TYPES = {
+        'Cours': 'Amphithéâtre',
+        'TP': 'Laboratoire'
+    }
+
+    def __init__(self, rooms: List[Dict], dates: List[str],
+                 time_slots: List[Tuple[str, str]],
+                 existing_seances: List[Dict] = None,
+                 max_iterations: int = 10000,
+                 timeout_secondes: float = 300,
+                 prefer_room_types: bool = True,
+                 teacher_day_limits: Optional[Dict[int, int]] = None):
+        """
+        Args:
+            rooms: Room dictionaries (id, capacite, type_salle)
+            dates: Candidate dates "YYYY-MM-DD"
+            time_slots: Candidate (start, end) slots, only the start is used
+            existing_seances: Fixed commitments (sessions and approved reservations)
+            max_iterations: Maximum number of value assignments tried
+            timeout_secondes: Wall-clock budget for the search
+            prefer_room_types: Try amphitheatres for Cours and labs for TP first
+            teacher_day_limits: Minutes a teacher may teach per day
+                                (default: CONTRAINTES['duree_max_jour_enseignant'])
+        """
+        self.rooms = sorted(rooms, key=lambda r: (r['capacite'], r['id']))
+        self.dates = list(dates)
+        self.time_slots = list(time_slots)
+        self.occupancy = OccupancyGrid(existing_seances)
+        self.workload = WorkloadLedger(existing_seances)
+        self.teacher_day_limits = teacher_day_limits or {}
+        self.pause = ConflictDetector.PAUSE_MINUTES
+        self.max_iterations = max_iterations
+        self.timeout_secondes = timeout_secondes
+        self.prefer_room_types = prefer_room_types
+
+    # ═══════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════
+
+    def solve(self, courses: List[Dict]) -> Dict:
+        """
+        Args:
+            courses: Course dictionaries with groupe_id, effectif, enseignant_id,
+                     matiere, type_seance, duree_heures, nb_seances_semaine
+                     (and optionally dates_exclues, dates not to use)
+        Returns:
+            Dict with 'success', 'sessions' (placed, not saved),
+            'unscheduled' (courses with at least one session not placed),
+            'iterations' and 'timed_out'
+        """
+        self._build_problem(courses)
+
+        assignment = self._search()
+
+        sessions = []
+        placed = set()
+        for var, (option, salle_id) in sorted(assignment.items()):
+            course = self.courses[self.var_course[var]]
+            date, heure_debut, heure_fin = self.options[option][:3]
+            sessions.append({
+                'titre': course['matiere'],
+                'type_seance': course['type_seance'],
+                'date': date,
+                'heure_debut': heure_debut,
+                'heure_fin': heure_fin,
+                'salle_id': salle_id,
+                'enseignant_id': course['enseignant_id'],
+                'groupe_id': course['groupe_id']
+            })
+            placed.add(var)
+
+        unscheduled = []
+        for index, course in enumerate(self.courses):
+            missing = sum(1 for var in self.course_vars[index] if var not in placed)
+            if missing:
+                unscheduled.append(dict(course, sessions_manquantes=missing))
+
+        return {
+            'success': not unscheduled,
+            'sessions': sessions,
+            'unscheduled': unscheduled,
+            'iterations': self.iterations,
+            'timed_out': self.timed_out
+        }
+
+    # ═══════════════════════════════════════════════════════════
+    # PROBLEM CONSTRUCTION
+    # ═══════════════════════════════════════════════════════════
+
+    def _get_option(self, date_index: int, start: int, end: int) -> int:
+        key = (date_index, start, end)
+        option = self.option_ids.get(key)
+        if option is None:
+            option = len(self.options)
+            self.option_ids[key] = option
+            self.options.append((self.dates[date_index],
+                                 self._format_minutes(start), self._format_minutes(end),
+                                 date_index, start, end))
+            self.overlaps.append([])
+        return option
+
+    @staticmethod
+    def _format_minutes(minutes: int) -> str:
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+    def _build_problem(self, courses: List[Dict]):
+        self.courses = list(courses)
+        self.options: List[Tuple] = []
+        self.option_ids: Dict[Tuple[int, int, int], int] = {}
+        self.overlaps: List[List[int]] = []
+
+        starts = []
+        for heure_debut, _ in self.time_slots:
+            start = TimeUtils.time_to_minutes(heure_debut)
+            if start is not None:
+                starts.append(start)
+
+        # Variables
+        self.var_course: List[int] = []
+        self.course_vars: List[List[int]] = []
+        self.domains: List[set] = []
+        self.var_rooms: List[List[int]] = []
+        self.var_duration: List[int] = []
+        for index, course in enumerate(self.courses):
+            duree = int(round(course['duree_heures'] * 60))
+            budget = self._day_limit(course['enseignant_id'])
+            # Days already used by this course (e.g. sessions kept by a repair pass)
+            dates_exclues = set(course.get('dates_exclues', ()))
+            date_indexes = [i for i, date in enumerate(self.dates) if date not in dates_exclues]
+            nb = min(course['nb_seances_semaine'], len(date_indexes))
+            options = []
+            for date_index in date_indexes:
+                # Day already full for the teacher with existing commitments
+                if self.workload.day_minutes(course['enseignant_id'], self.dates[date_index]) + duree > budget:
+                    continue
+                for start in starts:
+                    if duree > 0 and start + duree < 24 * 60:
+                        options.append(self._get_option(date_index, start, start + duree))
+
+            rooms = self._rooms_for(course)
+            vars_of_course = []
+            for _ in range(nb):
+                var = len(self.var_course)
+                self.var_course.append(index)
+                self.domains.append(set(options) if rooms else set())
+                self.var_rooms.append(rooms)
+                self.var_duration.append(duree)
+                vars_of_course.append(var)
+            self.course_vars.append(vars_of_course)
+
+        # Time options overlapping each other (same date, pause included)
+        by_date: Dict[int, List[int]] = {}
+        for option, (_, _, _, date_index, _, _) in enumerate(self.options):
+            by_date.setdefault(date_index, []).append(option)
+        for options in by_date.values():
+            for a in options:
+                start_a, end_a = self.options[a][4], self.options[a][5]
+                for b in options:
+                    start_b, end_b = self.options[b][4], self.options[b][5]
+                    if start_a < end_b + self.pause and start_b < end_a + self.pause:
+                        self.overlaps[a].append(b)
+        self.same_date = by_date
+
+        # Neighbours sharing a teacher or a group, and siblings of the same course
+        by_resource: Dict[Tuple[str, int], List[int]] = {}
+        for var, index in enumerate(self.var_course):
+            course = self.courses[index]
+            by_resource.setdefault(('enseignant', course['enseignant_id']), []).append(var)
+            by_resource.setdefault(('groupe', course['groupe_id']), []).append(var)
+        self.teacher_vars: List[List[int]] = [
+            [other for other in by_resource[('enseignant', self.courses[index]['enseignant_id'])] if other != var]
+            for var, index in enumerate(self.var_course)
+        ]
+        self.neighbours: List[set] = [set() for _ in self.var_course]
+        for members in by_resource.values():
+            for var in members:
+                self.neighbours[var].update(members)
+        for var in range(len(self.var_course)):
+            self.neighbours[var].discard(var)
+        self.siblings = [
+            [other for other in self.course_vars[index] if other != var]
+            for var, index in enumerate(self.var_course)
+        ]
+
+        # Rooms already busy for each time option (existing commitments)
+        option_masks = [self.occupancy.mask(start, end) for (_, _, _, _, start, end) in self.options]
+        self.busy_rooms: List[set] = [
+            self.occupancy.busy_resources('salle', option[0], option_masks[index])
+            for index, option in enumerate(self.options)
+        ]
+
+        # Teachers and groups already busy: prune domains up front
+        for var, index in enumerate(self.var_course):
+            course = self.courses[index]
+            for option in list(self.domains[var]):
+                date, mask = self.options[option][0], option_masks[option]
+                if (not self.occupancy.is_free('enseignant', course['enseignant_id'], date, mask)
+                        or not self.occupancy.is_free('groupe', course['groupe_id'], date, mask)
+                        or not self._has_free_room(var, option)):
+                    self.domains[var].discard(option)
+
+        self.vars_with_option: List[set] = [set() for _ in self.options]
+        for var, domain in enumerate(self.domains):
+            for option in domain:
+                self.vars_with_option[option].add(var)
+
+        # Number of sessions of each group per date (day balancing)
+        self.group_load: Dict[Tuple[int, int], int] = {}
+        # Minutes placed for each teacher per date (daily limit)
+        self.teacher_load: Dict[Tuple[int, int], int] = {}
+
+    def _day_limit(self, enseignant_id: int) -> int:
+        limit = self.teacher_day_limits.get(enseignant_id)
+        return limit if limit is not None else config.CONTRAINTES['duree_max_jour_enseignant']
+
+    def _rooms_for(self, course: Dict) -> List[int]:
+        """Fitting rooms, preferred type first, then smallest capacity (best fit)"""
+        effectif = course.get('effectif', 0) or 0
+        preferred = self.PREFERRED_ROOM_TYPES.get(course['type_seance']) if self.prefer_room_types else None
+        fitting = [r for r in self.rooms if r['capacite'] >= effectif]
+        fitting.sort(key=lambda r: (r['type_salle'] != preferred, r['capacite'], r['id']))
+        return [r['id'] for r in fitting]
+
+    def _has_free_room(self, var: int, option: int) -> bool:
+        busy = self.busy_rooms[option]
+        return any(salle_id not in busy for salle_id in self.var_rooms[var])
+
+    # ═══════════════════════════════════════════════════════════
+    # SEARCH
+    # ═══════════════════════════════════════════════════════════
+
+    def _select_variable(self, assignment: Dict, excluded: set = frozenset()) -> Optional[int]:
+        """Most constrained first: smallest domain, then most neighbours"""
+        best = None
+        best_key = None
+        for var in range(len(self.var_course)):
+            if var in assignment or var in excluded:
+                continue
+            key = (len(self.domains[var]), -len(self.neighbours[var]))
+            if best_key is None or key < best_key:
+                best, best_key = var, key
+                if key[0] == 0:
+                    break
+        return best
+
+    def _ordered_values(self, var: int):
+        """Yields (option, salle_id): least loaded day for the group, earliest slot, best-fit room"""
+        groupe_id = self.courses[self.var_course[var]]['groupe_id']
+        options = sorted(
+            self.domains[var],
+            key=lambda o: (self.group_load.get((groupe_id, self.options[o][3]), 0),
+                           self.options[o][3], self.options[o][4])
+        )
+        for option in options:
+            # The domain may have shrunk since the generator was created
+            if option not in self.domains[var]:
+                continue
+            busy = self.busy_rooms[option]
+            for salle_id in self.var_rooms[var]:
+                if salle_id not in busy:
+                    yield option, salle_id
+                    break
+
+    def _remove(self, var: int, option: int, trail: List) -> bool:
+        """Removes an option from a domain; returns False on domain wipe-out"""
+        if option in self.domains[var]:
+            self.domains[var].discard(option)
+            self.vars_with_option[option].discard(var)
+            trail.append(('domain', var, option))
+        return bool(self.domains[var])
+
+    def _assign(self, var: int, option: int, salle_id: int,
+                assignment: Dict, trail: List) -> bool:
+        """Assigns a value and forward-checks the unassigned variables"""
+        assignment[var] = (option, salle_id)
+        groupe_id = self.courses[self.var_course[var]]['groupe_id']
+        date_index = self.options[option][3]
+        key = (groupe_id, date_index)
+        self.group_load[key] = self.group_load.get(key, 0) + 1
+        trail.append(('load', key))
+        enseignant_id = self.courses[self.var_course[var]]['enseignant_id']
+        teacher_key = (enseignant_id, date_index)
+        self.teacher_load[teacher_key] = self.teacher_load.get(teacher_key, 0) + self.var_duration[var]
+        trail.append(('teacher', teacher_key, self.var_duration[var]))
+
+        # Room: busy for every overlapping option
+        for other in self.overlaps[option]:
+            if salle_id not in self.busy_rooms[other]:
+                self.busy_rooms[other].add(salle_id)
+                trail.append(('room', other, salle_id))
+
+        # Teacher and group: no overlapping option left for the neighbours
+        for neighbour in self.neighbours[var]:
+            if neighbour in assignment:
+                continue
+            for other in self.overlaps[option]:
+                if not self._remove(neighbour, other, trail):
+                    return False
+
+        # Teacher daily limit: that date is closed to sessions that no longer fit
+        remaining = (self._day_limit(enseignant_id) - self.teacher_load[teacher_key]
+                     - self.workload.day_minutes(enseignant_id, self.dates[date_index]))
+        for other_var in self.teacher_vars[var]:
+            if other_var in assignment or self.var_duration[other_var] <= remaining:
+                continue
+            for other in self.same_date[date_index]:
+                if not self._remove(other_var, other, trail):
+                    return False
+
+        # Same course: one session per day
+        for sibling in self.siblings[var]:
+            if sibling in assignment:
+                continue
+            for other in self.same_date[date_index]:
+                if not self._remove(sibling, other, trail):
+                    return False
+
+        # Room forward checking: options left without any fitting free room
+        for other in self.overlaps[option]:
+            for candidate in list(self.vars_with_option[other]):
+                if candidate in assignment:
+                    continue
+                if not self._has_free_room(candidate, other):
+                    if not self._remove(candidate, other, trail):
+                        return False
+        return True
+
+    def _undo(self, trail: List, mark: int):
+        while len(trail) > mark:
+            entry = trail.pop()
+            if entry[0] == 'domain':
+                _, var, option = entry
+                self.domains[var].add(option)
+                self.vars_with_option[option].add(var)
+            elif entry[0] == 'room':
+                _, option, salle_id = entry
+                self.busy_rooms[option].discard(salle_id)
+            elif entry[0] == 'teacher':
+                _, key, minutes = entry
+                self.teacher_load[key] -= minutes
+            else:
+                self.group_load[entry[1]] -= 1
+
+    def _search(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Iterative backtracking bounded by max_iterations / timeout_secondes.
+        Returns a complete assignment, or the deepest partial assignment
+        found, completed greedily with whatever still fits.
+        """
+        self.iterations = 0
+        self.timed_out = False
+        deadline = time.monotonic() + self.timeout_secondes
+
+        assignment: Dict[int, Tuple[int, int]] = {}
+        best: Dict[int, Tuple[int, int]] = {}
+        trail: List = []
+
+        # Sessions without any possible value are reported, not searched
+        impossible = {var for var, domain in enumerate(self.domains) if not domain}
+
+        first = self._select_variable(assignment, impossible)
+        if first is None:
+            return assignment
+        # Frames: [variable, value iterator, trail mark of the current try]
+        stack = [[first, self._ordered_values(first), None]]
+
+        while stack:
+            if self.iterations >= self.max_iterations or time.monotonic() > deadline:
+                self.timed_out = True
+                break
+
+            frame = stack[-1]
+            var = frame[0]
+            if frame[2] is not None:
+                # Undo the previous value tried for this variable
+                self._undo(trail, frame[2])
+                del assignment[var]
+                frame[2] = None
+
+            value = next(frame[1], None)
+            if value is None:
+                stack.pop()
+                continue
+
+            self.iterations += 1
+            frame[2] = len(trail)
+            if not self._assign(var, value[0], value[1], assignment, trail):
+                continue
+
+            if len(assignment) > len(best):
+                best = dict(assignment)
+
+            following = self._select_variable(assignment, impossible)
+            if following is None:
+                return assignment
+            stack.append([following, self._ordered_values(following), None])
+
+        # No complete solution: replay the deepest partial assignment
+        self._undo(trail, 0)
+        assignment.clear()
+        for var, (option, salle_id) in best.items():
+            self._assign(var, option, salle_id, assignment, trail)
+        self._complete_greedily(assignment, trail, impossible)
+        return assignment
+
+    def _complete_greedily(self, assignment: Dict, trail: List, excluded: set):
+        """Places the remaining variables first-fit, skipping those that cannot be placed"""
+        failed = set(excluded)
+        while True:
+            var = self._select_variable(assignment, failed)
+            if var is None:
+                return
+            for option, salle_id in self._ordered_values(var):
+                mark = len(trail)
+                if self._assign(var, option, salle_id, assignment, trail):
+                    break
+                self._undo(trail, mark)
+                del assignment[var]
+            else:
+                failed.add(var)
@@ -4,9 +4,55 @@ Conflict detection logic for scheduling
 Detects conflicts between teachers, rooms, groups, and time slots
 """
 
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple
 # Import absolu pour éviter les erreurs de chemin
-from src.logic.time_utils import TimeSlot, TimeUtils
+from src.logic.time_utils import CompactSlot, TimeSlot, TimeUtils
+
+
+class _IntervalBucket:
+    """
+    Sorted intervals (in minutes) of one resource for one day.
+    max_ends[i] is the latest end among intervals 0..i, which lets a query
+    stop scanning as soon as no earlier interval can reach the new slot.
+    """
+
+    __slots__ = ('starts', 'ends', 'max_ends', 'seances')
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.max_ends: List[int] = []
+        self.seances: List[Dict] = []
+
+    def add(self, start: int, end: int, seance: Dict):
+        pos = bisect_left(self.starts, start)
+        self.starts.insert(pos, start)
+        self.ends.insert(pos, end)
+        self.seances.insert(pos, seance)
+        self.max_ends.insert(pos, end)
+        # Recompute the prefix maximum from the insertion point
+        previous = self.max_ends[pos - 1] if pos > 0 else end
+        for i in range(pos, len(self.ends)):
+            previous = max(previous, self.ends[i])
+            self.max_ends[i] = previous
+
+    def find_overlaps(self, start: int, end: int, min_pause: int,
+                      exclude_seance_id: Optional[int] = None) -> List[Dict]:
+        """Returns the sessions overlapping [start, end) with the pause, in start order"""
+        overlaps = []
+        # Only intervals starting before end + pause can overlap
+        i = bisect_left(self.starts, end + min_pause) - 1
+        while i >= 0:
+            if self.max_ends[i] + min_pause <= start:
+                break
+            if self.ends[i] + min_pause > start:
+                seance = self.seances[i]
+                if exclude_seance_id is None or seance.get('id') != exclude_seance_id:
+                    overlaps.append(seance)
+            i -= 1
+        overlaps.reverse()
+        return overlaps
 
 
 class ConflictDetector:
@@ -15,6 +61,13 @@ class ConflictDetector:
     # [MODIFICATION] La durée de la pause obligatoire entre deux séances (en minutes)
     PAUSE_MINUTES = 10
 
+    # Resource kinds indexed by the detector and the session key holding their id
+    RESOURCE_KEYS = {
+        'salle': 'salle_id',
+        'enseignant': 'enseignant_id',
+        'groupe': 'groupe_id'
+    }
+
     def __init__(self, existing_seances: List[Dict]):
         """
         Initialize the conflict detector with existing sessions
@@ -22,6 +75,87 @@ class ConflictDetector:
             existing_seances: List of existing session dictionaries
         """
         self.existing_seances = existing_seances or []
+
+        # Index {(resource_kind, resource_id, date): _IntervalBucket}
+        self._index: Dict[Tuple[str, int, str], _IntervalBucket] = {}
+        # Index {date: _IntervalBucket} for resource-independent queries
+        self._by_date: Dict[str, _IntervalBucket] = {}
+        # Every session of a resource for a day, in insertion order, for the
+        # availability listings (sessions with unparseable times included)
+        self._listed: Dict[Tuple[str, int, str], List[Dict]] = {}
+        for seance in self.existing_seances:
+            self._index_seance(seance)
+
+    def _index_seance(self, seance: Dict):
+        """Adds one session to the per-resource and per-date indexes"""
+        date = seance.get('date', '')
+        for kind, key in self.RESOURCE_KEYS.items():
+            resource_id = seance.get(key)
+            if resource_id is not None:
+                self._listed.setdefault((kind, resource_id, date), []).append(seance)
+
+        slot = CompactSlot.from_seance(seance)
+        if slot is None:
+            # Unparseable sessions never overlap (same as TimeSlot.overlaps_with)
+            return
+
+        self._by_date.setdefault(date, _IntervalBucket()).add(slot.start, slot.end, seance)
+        for kind, key in self.RESOURCE_KEYS.items():
+            resource_id = seance.get(key)
+            if resource_id is not None:
+                self._index.setdefault((kind, resource_id, date), _IntervalBucket()).add(
+                    slot.start, slot.end, seance
+                )
+
+    def add_seance(self, seance: Dict):
+        """
+        Registers a new session (e.g. one just generated) so that
+        subsequent queries take it into account
+        """
+        self.existing_seances.append(seance)
+        self._index_seance(seance)
+
+    def _find_conflicting_seances(self, kind: str, resource_id: int, date: str,
+                                  heure_debut: str, heure_fin: str,
+                                  exclude_seance_id: Optional[int] = None) -> List[Dict]:
+        """Bisects the resource's intervals for the day (considering pause time)"""
+        bucket = self._index.get((kind, resource_id, date))
+        if bucket is None:
+            return []
+
+        start = TimeUtils.time_to_minutes(heure_debut)
+        end = TimeUtils.time_to_minutes(heure_fin)
+        if start is None or end is None:
+            return []
+
+        return bucket.find_overlaps(start, end, self.PAUSE_MINUTES, exclude_seance_id)
+
+    @staticmethod
+    def _slot_of(seance: Dict) -> TimeSlot:
+        return TimeSlot(
+            seance.get('date', ''),
+            seance.get('heure_debut', ''),
+            seance.get('heure_fin', '')
+        )
+
+    @classmethod
+    def conflict_message(cls, kind: str, resource_id: int, other: Dict) -> str:
+        """Message reported when a resource is taken by another session"""
+        if kind == 'salle':
+            return (f"Salle occupée: La salle {resource_id} est prise ou en pause ({cls.PAUSE_MINUTES}min) "
+                    f"autour de {cls._slot_of(other)}")
+        if kind == 'enseignant':
+            return (f"Professeur occupé: L'enseignant {resource_id} a un cours ou une pause "
+                    f"autour de {cls._slot_of(other)}")
+        return (f"Groupe occupé: Le groupe {resource_id} a un cours ou une pause "
+                f"autour de {cls._slot_of(other)}")
+
+    def get_intervals(self, kind: str, resource_id: int, date: str) -> List[Tuple[int, int, Dict]]:
+        """(start, end, session) of a resource for a day, sorted by start"""
+        bucket = self._index.get((kind, resource_id, date))
+        if bucket is None:
+            return []
+        return list(zip(bucket.starts, bucket.ends, bucket.seances))
     
     def detect_all_conflicts(self, date: str, heure_debut: str, heure_fin: str,
                             salle_id: Optional[int] = None,
@@ -68,103 +202,59 @@ class ConflictDetector:
     def detect_room_conflict(self, date: str, heure_debut: str, heure_fin: str,
                            salle_id: int, exclude_seance_id: Optional[int] = None) -> Optional[str]:
         """Detect if a room is already occupied (considering pause time)"""
-        new_slot = TimeSlot(date, heure_debut, heure_fin)
-        
-        for seance in self.existing_seances:
-            if exclude_seance_id is not None and seance.get('id') == exclude_seance_id:
-                continue
-            
-            if seance.get('salle_id') == salle_id:
-                existing_slot = TimeSlot(
-                    seance.get('date', ''),
-                    seance.get('heure_debut', ''),
-                    seance.get('heure_fin', '')
-                )
-                
-                # [MODIF] On passe min_pause ici
-                if new_slot.overlaps_with(existing_slot, min_pause=self.PAUSE_MINUTES):
-                    return (f"Salle occupée: La salle {salle_id} est prise ou en pause ({self.PAUSE_MINUTES}min) "
-                            f"autour de {existing_slot}")
+        overlaps = self._find_conflicting_seances(
+            'salle', salle_id, date, heure_debut, heure_fin, exclude_seance_id
+        )
+        if overlaps:
+            return self.conflict_message('salle', salle_id, overlaps[0])
         return None
     
     def detect_teacher_conflict(self, date: str, heure_debut: str, heure_fin: str,
                                enseignant_id: int, exclude_seance_id: Optional[int] = None) -> Optional[str]:
         """Detect if a teacher is already occupied (considering pause time)"""
-        new_slot = TimeSlot(date, heure_debut, heure_fin)
-        
-        for seance in self.existing_seances:
-            if exclude_seance_id is not None and seance.get('id') == exclude_seance_id:
-                continue
-            
-            if seance.get('enseignant_id') == enseignant_id:
-                existing_slot = TimeSlot(
-                    seance.get('date', ''),
-                    seance.get('heure_debut', ''),
-                    seance.get('heure_fin', '')
-                )
-                
-                # [MODIF] On passe min_pause ici
-                if new_slot.overlaps_with(existing_slot, min_pause=self.PAUSE_MINUTES):
-                    return (f"Professeur occupé: L'enseignant {enseignant_id} a un cours ou une pause "
-                            f"autour de {existing_slot}")
+        overlaps = self._find_conflicting_seances(
+            'enseignant', enseignant_id, date, heure_debut, heure_fin, exclude_seance_id
+        )
+        if overlaps:
+            return self.conflict_message('enseignant', enseignant_id, overlaps[0])
         return None
     
     def detect_group_conflict(self, date: str, heure_debut: str, heure_fin: str,
                             groupe_id: int, exclude_seance_id: Optional[int] = None) -> Optional[str]:
         """Detect if a group is already occupied (considering pause time)"""
-        new_slot = TimeSlot(date, heure_debut, heure_fin)
-        
-        for seance in self.existing_seances:
-            if exclude_seance_id is not None and seance.get('id') == exclude_seance_id:
-                continue
-            
-            if seance.get('groupe_id') == groupe_id:
-                existing_slot = TimeSlot(
-                    seance.get('date', ''),
-                    seance.get('heure_debut', ''),
-                    seance.get('heure_fin', '')
-                )
-                
-                # [MODIF] On passe min_pause ici
-                if new_slot.overlaps_with(existing_slot, min_pause=self.PAUSE_MINUTES):
-                    return (f"Groupe occupé: Le groupe {groupe_id} a un cours ou une pause "
-                            f"autour de {existing_slot}")
+        overlaps = self._find_conflicting_seances(
+            'groupe', groupe_id, date, heure_debut, heure_fin, exclude_seance_id
+        )
+        if overlaps:
+            return self.conflict_message('groupe', groupe_id, overlaps[0])
         return None
     
     def detect_time_slot_conflict(self, date: str, heure_debut: str, heure_fin: str,
                                  exclude_seance_id: Optional[int] = None) -> List[Dict]:
         """Detect all sessions that conflict with a given time slot (considering pause)"""
-        new_slot = TimeSlot(date, heure_debut, heure_fin)
-        conflicts = []
+        bucket = self._by_date.get(date)
+        if bucket is None:
+            return []
         
-        for seance in self.existing_seances:
-            if exclude_seance_id is not None and seance.get('id') == exclude_seance_id:
-                continue
+        start = TimeUtils.time_to_minutes(heure_debut)
+        end = TimeUtils.time_to_minutes(heure_fin)
+        if start is None or end is None:
+            return []
             
-            existing_slot = TimeSlot(
-                seance.get('date', ''),
-                seance.get('heure_debut', ''),
-                seance.get('heure_fin', '')
-            )
-            
-            # [MODIF] Même ici, on respecte la pause
-            if new_slot.overlaps_with(existing_slot, min_pause=self.PAUSE_MINUTES):
-                conflicts.append(seance)
-        
-        return conflicts
+        # [MODIF] Même ici, on respecte la pause
+        return bucket.find_overlaps(start, end, self.PAUSE_MINUTES, exclude_seance_id)
 
     # Les méthodes get_availability restent les mêmes (elles servent juste à l'affichage)
+    def _get_availability(self, kind: str, resource_id: int, date: str) -> List[Tuple[str, str]]:
+        seances = sorted(self._listed.get((kind, resource_id, date), []),
+                         key=lambda s: s.get('heure_debut') or '')
+        return [(s.get('heure_debut', ''), s.get('heure_fin', '')) for s in seances]
+
     def get_room_availability(self, salle_id: int, date: str) -> List[Tuple[str, str]]:
-        room_sessions = [s for s in self.existing_seances if s.get('salle_id') == salle_id and s.get('date') == date]
-        room_sessions.sort(key=lambda s: s.get('heure_debut', ''))
-        return [(s.get('heure_debut', ''), s.get('heure_fin', '')) for s in room_sessions]
+        return self._get_availability('salle', salle_id, date)
     
     def get_teacher_availability(self, enseignant_id: int, date: str) -> List[Tuple[str, str]]:
-        teacher_sessions = [s for s in self.existing_seances if s.get('enseignant_id') == enseignant_id and s.get('date') == date]
-        teacher_sessions.sort(key=lambda s: s.get('heure_debut', ''))
-        return [(s.get('heure_debut', ''), s.get('heure_fin', '')) for s in teacher_sessions]
+        return self._get_availability('enseignant', enseignant_id, date)
     
     def get_group_availability(self, groupe_id: int, date: str) -> List[Tuple[str, str]]:
-        group_sessions = [s for s in self.existing_seances if s.get('groupe_id') == groupe_id and s.get('date') == date]
-        group_sessions.sort(key=lambda s: s.get('heure_debut', ''))
-        return [(s.get('heure_debut', ''), s.get('heure_fin', '')) for s in group_sessions]
\ No newline at end of file
+        return self._get_availability('groupe', groupe_id, date)
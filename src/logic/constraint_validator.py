@@ -73,7 +73,17 @@ class ConstraintValidator:
         )
         errors.extend(conflicts)
         
-        # 3. Check room capacity if group is specified
+        # 3-4. Room capacity and required fields
+        errors.extend(self._check_assignment(salle_id, enseignant_id, groupe_id))
+        
+        return len(errors) == 0, errors
+    
+    def _check_assignment(self, salle_id: Optional[int], enseignant_id: Optional[int],
+                          groupe_id: Optional[int]) -> List[str]:
+        """Room capacity (if group is specified) and required fields"""
+        errors = []
+        
+        # Check room capacity if group is specified
         if groupe_id is not None and salle_id is not None:
             groupe = self.groupes.get(groupe_id)
             salle = self.salles.get(salle_id)
@@ -88,7 +98,7 @@ class ConstraintValidator:
                         f"pour le groupe ({effectif} étudiants)."
                     )
         
-        # 4. Validate required fields
+        # Validate required fields
         if salle_id is None:
             errors.append("Une salle doit être assignée.")
         
@@ -98,7 +108,91 @@ class ConstraintValidator:
         if groupe_id is None:
             errors.append("Un groupe doit être assigné.")
         
-        return len(errors) == 0, errors
+        return errors
+    
+    def validate_many(self, sessions: List[Dict]) -> List[List[str]]:
+        """
+        Validate many proposals in one pass (e.g. a generated week)
+        Proposals and existing commitments are swept together per resource
+        and per day, so overlaps between two proposals are reported too
+        (on both of them). A proposal carrying an 'id' ignores the existing
+        session with the same id (it is being moved).
+        Args:
+            sessions: Session dicts with date, heure_debut, heure_fin,
+                      salle_id, enseignant_id, groupe_id (and optionally id)
+        Returns:
+            One list of errors per session, in the same order (empty if valid)
+        """
+        errors: List[List[str]] = [[] for _ in sessions]
+        pause = self.conflict_detector.PAUSE_MINUTES
+        
+        # 1. Parse every proposal once and group them per resource and day
+        timeline: Dict[Tuple[str, int, str], List[Tuple[int, int, int]]] = {}
+        for index, session in enumerate(sessions):
+            start = TimeUtils.time_to_minutes(session.get('heure_debut'))
+            end = TimeUtils.time_to_minutes(session.get('heure_fin'))
+            if start is None or end is None or start >= end:
+                errors[index].append("L'heure de début doit être avant l'heure de fin.")
+                continue
+            for kind, key in ConflictDetector.RESOURCE_KEYS.items():
+                resource_id = session.get(key)
+                if resource_id is not None:
+                    timeline.setdefault((kind, resource_id, session.get('date')), []).append(
+                        (start, end, index)
+                    )
+        
+        # 2. Sweep each resource/day: proposals merged with the sorted commitments
+        # {(session index, kind): (start of the earliest overlapping item, item)}
+        first_overlap: Dict[Tuple[int, str], Tuple[int, Dict]] = {}
+        
+        def record(index, kind, start, other):
+            key = (index, kind)
+            if key not in first_overlap or start < first_overlap[key][0]:
+                first_overlap[key] = (start, other)
+        
+        for (kind, resource_id, date), proposals in timeline.items():
+            items = [(start, end, index, sessions[index]) for start, end, index in proposals]
+            items.extend(
+                (start, end, None, seance)
+                for start, end, seance in self.conflict_detector.get_intervals(kind, resource_id, date)
+            )
+            items.sort(key=lambda item: item[0])
+            
+            active = []
+            for item in items:
+                start, _, index, seance = item
+                # Items still running (pause included) when this one starts
+                active = [other for other in active if other[1] + pause > start]
+                for other in active:
+                    other_index, other_seance = other[2], other[3]
+                    if index is None and other_index is None:
+                        continue  # Two existing commitments: not our concern
+                    if index is None or other_index is None:
+                        proposal = seance if index is not None else other_seance
+                        existing = other_seance if index is not None else seance
+                        if proposal.get('id') is not None and proposal.get('id') == existing.get('id'):
+                            continue
+                    if index is not None:
+                        record(index, kind, other[0], other_seance)
+                    if other_index is not None:
+                        record(other_index, kind, start, seance)
+                active.append(item)
+        
+        # 3. Same messages and order as validate_seance()
+        for index, session in enumerate(sessions):
+            if errors[index]:
+                continue
+            for kind, key in ConflictDetector.RESOURCE_KEYS.items():
+                overlap = first_overlap.get((index, kind))
+                if overlap is not None:
+                    errors[index].append(
+                        ConflictDetector.conflict_message(kind, session.get(key), overlap[1])
+                    )
+            errors[index].extend(self._check_assignment(
+                session.get('salle_id'), session.get('enseignant_id'), session.get('groupe_id')
+            ))
+        
+        return errors
     
     def validate_no_room_double_booking(self, date: str, heure_debut: str, heure_fin: str,
                                        salle_id: int,
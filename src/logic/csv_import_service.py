@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from src.logic.schedule_generator import ScheduleGenerator
 from src.logic.conflict_detector import ConflictDetector
+from config import TYPES_SALLES
 
 
 class CSVImportService:
@@ -22,13 +23,25 @@ class CSVImportService:
     COLUMNS_GROUPES = ['nom', 'effectif', 'filiere']
     COLUMNS_SALLES = ['nom', 'capacite', 'type_salle', 'equipements']
     
-    def __init__(self, db):
+    # Default passwords of imported accounts
+    DEFAULT_PASSWORDS = {'enseignant': 'enseignant123', 'etudiant': 'etudiant123'}
+    
+    def __init__(self, db, bulk: bool = True, create_filieres: bool = True,
+                 passwords: Optional[Dict[str, str]] = None):
         """
         Initialize the CSV import service
         Args:
             db: Database instance
+            bulk: Validate rows in memory and insert them in one transaction
+                  with executemany (False = one insert/commit per row)
+            create_filieres: Create the filieres named by groupes.csv that do
+                             not exist yet (False = skip those groups)
+            passwords: {type_user: password} overriding DEFAULT_PASSWORDS
         """
         self.db = db
+        self.bulk = bulk
+        self.create_filieres = create_filieres
+        self.passwords = dict(self.DEFAULT_PASSWORDS, **(passwords or {}))
         self.errors = []
         self.warnings = []
     
@@ -59,40 +72,42 @@ class CSVImportService:
             'salles': 0
         }
         
-        # Import in order: salles, groupes, enseignants, etudiants
-        # (dependencies first)
-        
-        # 1. Import salles
-        if os.path.exists(salles_path):
-            count = self._import_salles(salles_path)
-            if count is not None:
-                imported_counts['salles'] = count
-        else:
-            self.errors.append(f"Fichier introuvable: {salles_path}")
-        
-        # 2. Import groupes (needs filieres to exist)
-        if os.path.exists(groupes_path):
-            count = self._import_groupes(groupes_path)
-            if count is not None:
-                imported_counts['groupes'] = count
-        else:
-            self.errors.append(f"Fichier introuvable: {groupes_path}")
-        
-        # 3. Import enseignants
-        if os.path.exists(liste_enseignants_path):
-            count = self._import_enseignants(liste_enseignants_path)
-            if count is not None:
-                imported_counts['enseignants'] = count
-        else:
-            self.errors.append(f"Fichier introuvable: {liste_enseignants_path}")
-        
-        # 4. Import etudiants (needs groupes to exist)
-        if os.path.exists(liste_etudiants_path):
-            count = self._import_etudiants(liste_etudiants_path)
-            if count is not None:
-                imported_counts['etudiants'] = count
-        else:
-            self.errors.append(f"Fichier introuvable: {liste_etudiants_path}")
+        # One database backup for the whole run (each _import_* asks for one)
+        with self.db.session_sauvegarde():
+            # Import in order: salles, groupes, enseignants, etudiants
+            # (dependencies first)
+            
+            # 1. Import salles
+            if os.path.exists(salles_path):
+                count = self._import_salles(salles_path)
+                if count is not None:
+                    imported_counts['salles'] = count
+            else:
+                self.errors.append(f"Fichier introuvable: {salles_path}")
+            
+            # 2. Import groupes (needs filieres to exist)
+            if os.path.exists(groupes_path):
+                count = self._import_groupes(groupes_path)
+                if count is not None:
+                    imported_counts['groupes'] = count
+            else:
+                self.errors.append(f"Fichier introuvable: {groupes_path}")
+            
+            # 3. Import enseignants
+            if os.path.exists(liste_enseignants_path):
+                count = self._import_enseignants(liste_enseignants_path)
+                if count is not None:
+                    imported_counts['enseignants'] = count
+            else:
+                self.errors.append(f"Fichier introuvable: {liste_enseignants_path}")
+            
+            # 4. Import etudiants (needs groupes to exist)
+            if os.path.exists(liste_etudiants_path):
+                count = self._import_etudiants(liste_etudiants_path)
+                if count is not None:
+                    imported_counts['etudiants'] = count
+            else:
+                self.errors.append(f"Fichier introuvable: {liste_etudiants_path}")
         
         # Auto-generate timetable if requested
         generated_count = 0
@@ -149,6 +164,9 @@ class CSVImportService:
         # Backup database
         self.db.sauvegarder_bdd()
         
+        if self.bulk:
+            return self.bulk_import_salles(data)
+        
         # Delete existing rooms
         self.db.supprimer_toutes_salles()
         
@@ -180,6 +198,9 @@ class CSVImportService:
         # Backup database
         self.db.sauvegarder_bdd()
         
+        if self.bulk:
+            return self.bulk_import_groupes(data)
+        
         # Delete existing groups
         self.db.supprimer_tous_groupes()
         
@@ -220,6 +241,9 @@ class CSVImportService:
         # Backup database
         self.db.sauvegarder_bdd()
         
+        if self.bulk:
+            return self.bulk_import_users(data, 'enseignant')
+        
         # Delete existing teachers
         self.db.supprimer_tous_utilisateurs_type('enseignant')
         
@@ -230,12 +254,13 @@ class CSVImportService:
                 prenom = row['prenom'].strip()
                 email = row['email'].strip()
                 specialite = row['specialite'].strip()
+                duree_max = int(row.get('duree_max_jour') or 480)
                 
                 # Default password
-                password = "enseignant123"
+                password = self.passwords['enseignant']
                 
                 user_id = self.db.ajouter_utilisateur(
-                    nom, prenom, email, password, "enseignant", specialite, None
+                    nom, prenom, email, password, "enseignant", specialite, None, duree_max
                 )
                 if user_id:
                     imported += 1
@@ -256,6 +281,9 @@ class CSVImportService:
         # Backup database
         self.db.sauvegarder_bdd()
         
+        if self.bulk:
+            return self.bulk_import_users(data, 'etudiant')
+        
         # Delete existing students
         self.db.supprimer_tous_utilisateurs_type('etudiant')
         
@@ -276,7 +304,7 @@ class CSVImportService:
                     continue
                 
                 # Default password
-                password = "etudiant123"
+                password = self.passwords['etudiant']
                 
                 user_id = self.db.ajouter_utilisateur(
                     nom, prenom, email, password, "etudiant", None, groupe['id']
@@ -288,6 +316,148 @@ class CSVImportService:
         
         return imported
     
+    # ═══════════════════════════════════════════════════════════
+    # BULK MODE: validate in memory, insert in one transaction
+    # (also used by ImportManager)
+    # ═══════════════════════════════════════════════════════════
+    
+    def prepare_salles(self, data: List[Dict]) -> List[Tuple]:
+        """Valid room rows as (nom, capacite, type_salle, equipements) tuples"""
+        rows = []
+        seen = set()
+        for line_no, row in enumerate(data, start=2):
+            try:
+                nom = (row['nom'] or '').strip()
+                capacite = int(row['capacite'])
+                type_salle = (row['type_salle'] or '').strip()
+                equipements = (row.get('equipements') or '').strip()
+            except Exception as e:
+                self.warnings.append(f"Salle ligne {line_no}: {e}")
+                continue
+            
+            if not nom or capacite <= 0 or type_salle not in TYPES_SALLES:
+                self.warnings.append(f"Salle ligne {line_no}: '{nom}' invalide")
+                continue
+            if nom in seen:
+                self.warnings.append(f"Salle ligne {line_no}: '{nom}' en double")
+                continue
+            seen.add(nom)
+            rows.append((nom, capacite, type_salle, equipements))
+        return rows
+    
+    def prepare_users(self, data: List[Dict], type_user: str) -> List[Tuple]:
+        """
+        Valid user rows as ajouter_utilisateurs_en_masse tuples
+        Args:
+            type_user: 'enseignant' (specialite, duree_max_jour) or 'etudiant' (groupe)
+        """
+        groupes = {}
+        if type_user == 'etudiant':
+            # Pre-load groups once instead of one lookup per student
+            for groupe in self.db.get_tous_groupes():
+                groupes.setdefault(groupe['nom'], groupe['id'])
+        
+        rows = []
+        seen_emails = set()
+        for line_no, row in enumerate(data, start=2):
+            try:
+                nom = row['nom'].strip()
+                prenom = row['prenom'].strip()
+                email = (row['email'] or '').strip()
+                
+                if type_user == 'enseignant':
+                    specialite = row['specialite'].strip()
+                    groupe_id = None
+                    duree_max = int(row.get('duree_max_jour') or 480)
+                else:
+                    specialite = None
+                    groupe_nom = row['groupe'].strip()
+                    groupe_id = groupes.get(groupe_nom)
+                    duree_max = 480
+                    if groupe_id is None:
+                        self.warnings.append(
+                            f"Étudiant {nom} {prenom}: Groupe '{groupe_nom}' introuvable"
+                        )
+                        continue
+            except Exception as e:
+                self.warnings.append(f"{type_user.capitalize()} ligne {line_no}: {e}")
+                continue
+            
+            if not email or email in seen_emails:
+                self.warnings.append(f"{type_user.capitalize()} ligne {line_no}: email '{email}' vide ou en double")
+                continue
+            seen_emails.add(email)
+            rows.append((nom, prenom, email, self.passwords[type_user], type_user,
+                         specialite, groupe_id, duree_max))
+        return rows
+    
+    def bulk_import_salles(self, data: List[Dict]) -> int:
+        """Replaces all rooms with the valid CSV rows in a single transaction"""
+        rows = self.prepare_salles(data)
+        
+        with self.db.transaction():
+            self.db.supprimer_toutes_salles()
+            imported = self.db.ajouter_salles_en_masse(rows)
+        
+        if imported < len(rows):
+            self.warnings.append(f"Salles: {len(rows) - imported} ligne(s) rejetée(s) par la base")
+        return imported
+    
+    def bulk_import_groupes(self, data: List[Dict]) -> int:
+        """Replaces all groups in a single transaction (missing filieres are
+        created, or the group skipped when create_filieres is False)"""
+        parsed = []
+        for line_no, row in enumerate(data, start=2):
+            try:
+                parsed.append((row['nom'].strip(), int(row['effectif']), row['filiere'].strip()))
+            except Exception as e:
+                self.warnings.append(f"Groupe ligne {line_no}: {e}")
+        
+        with self.db.transaction():
+            # Pre-load filieres once instead of one lookup per row
+            filieres = {}
+            for filiere in self.db.get_toutes_filieres():
+                filieres.setdefault(filiere['nom'], filiere['id'])
+            
+            rows = []
+            for nom, effectif, filiere_nom in parsed:
+                if filiere_nom not in filieres:
+                    if not self.create_filieres:
+                        self.warnings.append(
+                            f"Groupe '{nom}': Filière '{filiere_nom}' introuvable"
+                        )
+                        continue
+                    # Create filiere (extract niveau from name or use default)
+                    niveau = "L3"  # Default, could be extracted from name
+                    filieres[filiere_nom] = self.db.ajouter_filiere(filiere_nom, niveau)
+                rows.append((nom, effectif, filieres[filiere_nom]))
+            
+            self.db.supprimer_tous_groupes()
+            imported = self.db.ajouter_groupes_en_masse(rows)
+        
+        if imported < len(rows):
+            self.warnings.append(f"Groupes: {len(rows) - imported} ligne(s) rejetée(s) par la base")
+        return imported
+    
+    def bulk_import_users(self, data: List[Dict], type_user: str, replace: bool = True) -> int:
+        """
+        Imports the users of a type (enseignant/etudiant) in a single transaction
+        Args:
+            replace: Delete the existing users of this type first (False = merge)
+        """
+        rows = self.prepare_users(data, type_user)
+        
+        with self.db.transaction():
+            if replace:
+                self.db.supprimer_tous_utilisateurs_type(type_user)
+            imported = self.db.ajouter_utilisateurs_en_masse(rows)
+        
+        if imported < len(rows):
+            self.warnings.append(
+                f"{type_user.capitalize()}: {len(rows) - imported} ligne(s) rejetée(s) par la base"
+            )
+        return imported
+    
     def _auto_generate_timetable(self, semaine_debut: str = None) -> int:
         """
         Auto-generates weekly timetable after CSV import
@@ -0,0 +1,153 @@
+# src/logic/export_cache.py
+"""
+Export result cache
+An exported file is reused as long as the hash of what it was rendered from
+(timetable data, format, export options) has not changed
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from config import CRENEAUX_HORAIRES, EXPORT_CONFIG, EXPORT_FOLDER
+
+
+class ExportCache:
+    """
+    Manifest of the files written by the export service: {path: hash, size,
+    last use}, kept as JSON in the export folder so that every process
+    (application, batch export) shares it.
+
+    Only files recorded in the manifest are ever evicted: exports made by
+    other means in the same folders are left alone.
+    """
+
+    MANIFEST = '.export_cache.json'
+
+    # Bumped when the rendering changes, so that old files are not reused
+    RENDER_VERSION = 1
+
+    def __init__(self, root: str = EXPORT_FOLDER, max_age_days: Optional[float] = None,
+                 max_size_mb: Optional[float] = None):
+        self.root = str(root)
+        self.max_age_days = (max_age_days if max_age_days is not None
+                             else EXPORT_CONFIG.get('cache_age_max_jours', 30))
+        self.max_size_mb = (max_size_mb if max_size_mb is not None
+                            else EXPORT_CONFIG.get('cache_taille_max_mo', 500))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def content_hash(cls, data: Dict, format_type: str) -> str:
+        """Hash of prepared timetable data plus the format and export options"""
+        payload = json.dumps(
+            [cls.RENDER_VERSION, format_type.lower(), data, EXPORT_CONFIG, CRENEAUX_HORAIRES],
+            sort_keys=True, default=str, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    # ═══════════════════════════════════════════════════════════
+    # MANIFEST
+    # ═══════════════════════════════════════════════════════════
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.root, self.MANIFEST)
+
+    def _key(self, filepath: str) -> str:
+        return os.path.relpath(os.path.abspath(filepath), os.path.abspath(self.root))
+
+    def _path(self, key: str) -> str:
+        return os.path.normpath(os.path.join(self.root, key))
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self._manifest_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Dict]):
+        os.makedirs(self.root, exist_ok=True)
+        temporary = f"{self._manifest_path()}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(temporary, self._manifest_path())
+
+    # ═══════════════════════════════════════════════════════════
+    # LOOKUP AND STORE
+    # ═══════════════════════════════════════════════════════════
+
+    def lookup(self, filepath: str, digest: str) -> bool:
+        """True if filepath exists and was rendered from content with this hash"""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(self._key(filepath))
+            if entry is None or entry['hash'] != digest:
+                return False
+            try:
+                if os.path.getsize(filepath) != entry['size']:
+                    return False
+            except OSError:
+                return False
+            # Last use is only needed to the hour: most hits write nothing
+            if time.time() - entry['used'] > 3600:
+                entry['used'] = time.time()
+                self._save(entries)
+            return True
+
+    def store(self, filepath: str, digest: str):
+        """Records a freshly written file, then evicts what is too old or too much"""
+        with self._lock:
+            entries = self._load()
+            entries[self._key(filepath)] = {
+                'hash': digest, 'size': os.path.getsize(filepath), 'used': time.time()
+            }
+            self._evict(entries, keep=self._key(filepath))
+            self._save(entries)
+
+    def evict(self) -> List[str]:
+        """Deletes stale cached files. Returns the deleted paths"""
+        with self._lock:
+            entries = self._load()
+            removed = self._evict(entries)
+            self._save(entries)
+            return removed
+
+    def _evict(self, entries: Dict[str, Dict], keep: Optional[str] = None) -> List[str]:
+        """
+        Age limit first, then least recently used files until under the size
+        limit (the `keep` entry, just written, is never evicted)
+        """
+        removed = []
+        now = time.time()
+        max_age = self.max_age_days * 86400 if self.max_age_days else None
+        max_size = self.max_size_mb * 1024 * 1024 if self.max_size_mb else None
+
+        for key in sorted(entries, key=lambda k: entries[k]['used']):
+            path = self._path(key)
+            if not os.path.exists(path):
+                # Deleted or moved by someone else
+                del entries[key]
+            elif max_age is not None and now - entries[key]['used'] > max_age:
+                self._remove(path, key, entries, removed)
+
+        if max_size is not None:
+            total = sum(entry['size'] for entry in entries.values())
+            for key in sorted(entries, key=lambda k: entries[k]['used']):
+                if total <= max_size:
+                    break
+                if key == keep:
+                    continue
+                total -= entries[key]['size']
+                self._remove(self._path(key), key, entries, removed)
+        return removed
+
+    @staticmethod
+    def _remove(path: str, key: str, entries: Dict[str, Dict], removed: List[str]):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        del entries[key]
+        removed.append(path)
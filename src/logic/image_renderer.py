@@ -0,0 +1,243 @@
+# src/logic/image_renderer.py
+"""
+Raster timetable renderer (PNG/JPEG) with PyQt6
+The static grid (days x CRENEAUX_HORAIRES, headers, logo) is drawn once per
+size and cached: each timetable is a copy of it plus its session blocks
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen
+from config import CRENEAUX_HORAIRES, EXPORT_CONFIG, GUI_CONFIG
+from src.logic.time_utils import TimeUtils
+
+# QPainter needs a GUI application for fonts, even without a window
+_application = None
+
+
+def _ensure_application():
+    global _application
+    if QGuiApplication.instance() is None:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        _application = QGuiApplication([])
+
+
+class TimetableImageRenderer:
+    """
+    Draws a weekly timetable (days as columns, time going down) on a QImage.
+
+    Sessions are placed by their real times on a fixed time axis going from
+    the start of the first slot to the end of the last one. Sessions that
+    overlap on the same day share the width of the column.
+    """
+
+    DAYS = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi"]
+
+    TYPE_COLORS = {
+        'Cours': GUI_CONFIG['color_secondary'],
+        'TD': GUI_CONFIG['color_success'],
+        'TP': GUI_CONFIG['color_warning'],
+        'Examen': GUI_CONFIG['color_danger'],
+        'Réservation': '#8b5cf6'
+    }
+    DEFAULT_COLOR = '#64748b'
+
+    # {(width, height, dpi, slots, logo): background image}, per process
+    _backgrounds: Dict[Tuple, QImage] = {}
+
+    def __init__(self, width: int = None, height: int = None, dpi: int = None,
+                 creneaux: Optional[List[Tuple]] = None, logo_path: str = None):
+        self.width = width or EXPORT_CONFIG.get('image_largeur', 1920)
+        self.height = height or EXPORT_CONFIG.get('image_hauteur', 1080)
+        self.dpi = dpi or EXPORT_CONFIG.get('image_dpi', 96)
+        self.creneaux = tuple((c[0], c[1]) for c in (creneaux or CRENEAUX_HORAIRES))
+        self.logo_path = str(logo_path or GUI_CONFIG.get('logo_path', ''))
+
+        # Layout in pixels, proportional to the image size
+        self.margin = round(min(self.width, self.height) * 0.02)
+        self.font_px = max(8, round(self.height / 72))
+        self.header_height = round(self.height * 0.11)
+        self.time_width = round(self.width * 0.07)
+        self.day_header_height = round(self.font_px * 2.4)
+        self.grid_left = self.margin + self.time_width
+        self.grid_top = self.margin + self.header_height + self.day_header_height
+        self.grid_width = self.width - self.grid_left - self.margin
+        self.grid_height = self.height - self.grid_top - self.margin
+        self.column_width = self.grid_width / len(self.DAYS)
+
+        # (heure_debut, heure_fin, start, end) of the valid slots
+        self.slots = [(a, b, TimeUtils.time_to_minutes(a), TimeUtils.time_to_minutes(b))
+                      for a, b in self.creneaux if TimeUtils.is_valid_time_range(a, b)]
+        self.day_start = min((slot[2] for slot in self.slots), default=8 * 60)
+        self.day_end = max((slot[3] for slot in self.slots), default=18 * 60)
+
+    # ═══════════════════════════════════════════════════════════
+    # STATIC BACKGROUND
+    # ═══════════════════════════════════════════════════════════
+
+    def _y(self, minutes: int) -> float:
+        minutes = min(max(minutes, self.day_start), self.day_end)
+        return self.grid_top + (minutes - self.day_start) / (self.day_end - self.day_start) * self.grid_height
+
+    def _font(self, scale: float = 1.0, bold: bool = False) -> QFont:
+        font = QFont("Helvetica")
+        font.setPixelSize(max(6, round(self.font_px * scale)))
+        font.setBold(bold)
+        return font
+
+    def background(self) -> QImage:
+        """The static grid for this size (drawn on first use)"""
+        key = (self.width, self.height, self.dpi, self.creneaux, self.logo_path)
+        image = self._backgrounds.get(key)
+        if image is None:
+            image = self._draw_background()
+            self._backgrounds[key] = image
+        return image
+
+    def _draw_background(self) -> QImage:
+        _ensure_application()
+        image = QImage(self.width, self.height, QImage.Format.Format_RGB32)
+        dots_per_meter = round(self.dpi / 0.0254)
+        image.setDotsPerMeterX(dots_per_meter)
+        image.setDotsPerMeterY(dots_per_meter)
+        image.fill(QColor('white'))
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        primary = QColor(GUI_CONFIG['color_primary'])
+
+        # Header band with the logo (the title is drawn per timetable)
+        painter.fillRect(QRectF(0, 0, self.width, self.margin + self.header_height),
+                         QColor(GUI_CONFIG['color_background']))
+        logo = QImage(self.logo_path) if os.path.exists(self.logo_path) else QImage()
+        if not logo.isNull():
+            logo = logo.scaledToHeight(self.header_height - self.margin,
+                                       Qt.TransformationMode.SmoothTransformation)
+            painter.drawImage(self.margin, self.margin, logo)
+
+        # Slot bands and their times
+        painter.setFont(self._font(0.9))
+        for heure_debut, heure_fin, start, end in self.slots:
+            top, bottom = self._y(start), self._y(end)
+            painter.fillRect(QRectF(self.grid_left, top, self.grid_width, bottom - top),
+                             QColor('#eef2ff'))
+            painter.setPen(QColor('#475569'))
+            painter.drawText(QRectF(self.margin, top, self.time_width - self.margin / 2, bottom - top),
+                             Qt.AlignmentFlag.AlignCenter,
+                             f"{heure_debut}\n{heure_fin}")
+
+        # Day headers and column separators
+        painter.setFont(self._font(1.1, bold=True))
+        top = self.grid_top - self.day_header_height
+        for index, day in enumerate(self.DAYS):
+            x = self.grid_left + index * self.column_width
+            painter.fillRect(QRectF(x, top, self.column_width, self.day_header_height), primary)
+            painter.setPen(QColor('white'))
+            painter.drawText(QRectF(x, top, self.column_width, self.day_header_height),
+                             Qt.AlignmentFlag.AlignCenter, day)
+        painter.setPen(QPen(QColor('#cbd5e1'), 1))
+        for index in range(len(self.DAYS) + 1):
+            x = self.grid_left + index * self.column_width
+            painter.drawLine(round(x), top, round(x), self.grid_top + self.grid_height)
+        painter.drawLine(self.grid_left, self.grid_top + self.grid_height,
+                         self.grid_left + self.grid_width, self.grid_top + self.grid_height)
+        painter.end()
+        return image
+
+    # ═══════════════════════════════════════════════════════════
+    # SESSIONS
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _lanes(blocks: List[Tuple[int, int, Dict]]) -> List[Tuple[int, int, Dict, int, int]]:
+        """
+        (start, end, session, lane, lane_count): overlapping sessions are put
+        side by side, lane_count being the lanes used by their overlap cluster
+        """
+        placed, cluster, lane_ends, cluster_end = [], [], [], 0
+
+        def close_cluster():
+            placed.extend((s, e, session, lane, len(lane_ends)) for s, e, session, lane in cluster)
+
+        for start, end, session in sorted(blocks, key=lambda b: (b[0], b[1])):
+            if cluster and start >= cluster_end:
+                close_cluster()
+                cluster, lane_ends = [], []
+            lane = next((i for i, lane_end in enumerate(lane_ends) if lane_end <= start), None)
+            if lane is None:
+                lane = len(lane_ends)
+                lane_ends.append(end)
+            else:
+                lane_ends[lane] = end
+            cluster.append((start, end, session, lane))
+            cluster_end = end if len(cluster) == 1 else max(cluster_end, end)
+        close_cluster()
+        return placed
+
+    def render(self, data: Dict) -> QImage:
+        """Timetable image of export data from TimetableExportService"""
+        image = self.background().copy()
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Title, to the right of the logo
+        text_left = self.margin + self.header_height
+        painter.setPen(QColor(GUI_CONFIG['color_primary']))
+        painter.setFont(self._font(1.8, bold=True))
+        painter.drawText(QRectF(text_left, self.margin / 2, self.width - text_left - self.margin,
+                                self.header_height / 2),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, data['title'])
+        painter.setPen(QColor('#334155'))
+        painter.setFont(self._font(1.0))
+        painter.drawText(QRectF(text_left, self.margin / 2 + self.header_height / 2,
+                                self.width - text_left - self.margin, self.header_height / 2),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"{data['subtitle']}  •  Période: {data['period']}")
+
+        # Group timetable: show the teacher; teacher timetable: show the group
+        other_key = 'teacher' if data.get('groupe_nom') else 'group'
+        padding = self.font_px * 0.3
+        for index, day in enumerate(self.DAYS):
+            blocks, seen = [], set()
+            for session in data['schedule'].get(day, []):
+                # Weekly view: a session repeated every week is drawn once
+                signature = (session['time'], session['course'], session['type'],
+                             session['room'], session[other_key])
+                if signature in seen:
+                    continue
+                seen.add(signature)
+                start, _, end = session['time'].partition(' - ')
+                start, end = TimeUtils.time_to_minutes(start), TimeUtils.time_to_minutes(end)
+                if start is not None and end is not None and end > start:
+                    blocks.append((start, end, session))
+
+            column_x = self.grid_left + index * self.column_width
+            for start, end, session, lane, lanes in self._lanes(blocks):
+                width = self.column_width / lanes
+                rect = QRectF(column_x + lane * width + 2, self._y(start) + 1,
+                              width - 4, max(self._y(end) - self._y(start) - 2, self.font_px))
+                color = QColor(self.TYPE_COLORS.get(session['type'], self.DEFAULT_COLOR))
+                fill = QColor(color)
+                fill.setAlpha(50)
+                painter.setPen(QPen(color, 2))
+                painter.setBrush(fill)
+                painter.drawRoundedRect(rect, self.font_px * 0.4, self.font_px * 0.4)
+
+                text_rect = rect.adjusted(padding, padding, -padding, -padding)
+                painter.setPen(QColor('#0f172a'))
+                painter.setFont(self._font(0.95, bold=True))
+                course = painter.boundingRect(text_rect, Qt.TextFlag.TextWordWrap, session['course'])
+                painter.drawText(text_rect, Qt.TextFlag.TextWordWrap, session['course'])
+                painter.setFont(self._font(0.85))
+                details = f"{session['type']} • {session['room']}\n{session[other_key]}"
+                painter.drawText(text_rect.adjusted(0, min(course.height(), text_rect.height()), 0, 0),
+                                 Qt.TextFlag.TextWordWrap, details)
+        painter.end()
+        return image
+
+    def save(self, data: Dict, filepath: str, format_type: str = None) -> bool:
+        """Renders and writes the image (PNG or JPEG, from format_type or the extension)"""
+        format_type = (format_type or EXPORT_CONFIG.get('image_format', 'PNG')).upper()
+        qt_format = 'JPG' if format_type in ('JPG', 'JPEG') else 'PNG'
+        return self.render(data).save(filepath, qt_format, 90 if qt_format == 'JPG' else -1)
@@ -0,0 +1,104 @@
+# src/logic/occupancy_grid.py
+"""
+Bitset occupancy grid for rooms, teachers and groups
+One integer per resource and per day, one bit per 5-minute cell
+"""
+
+from typing import List, Dict, Optional, Tuple, Iterable
+from src.logic.conflict_detector import ConflictDetector
+from src.logic.time_utils import CompactSlot, TimeUtils
+
+
+class OccupancyGrid:
+    """
+    Occupancy of every resource, day by day, as Python integer bitsets.
+
+    A session [start, end) occupies the cells covering [start, end + pause):
+    two sessions conflict (pause included) exactly when their masks share a
+    bit, so an availability check is a single bitwise AND. Times that are
+    not multiples of CELL_MINUTES are rounded outwards (never a missed conflict).
+    """
+
+    CELL_MINUTES = 5
+    CELLS_PER_DAY = 24 * 60 // CELL_MINUTES
+
+    RESOURCE_KEYS = ConflictDetector.RESOURCE_KEYS
+
+    def __init__(self, seances: Optional[List[Dict]] = None,
+                 pause_minutes: int = ConflictDetector.PAUSE_MINUTES):
+        """
+        Args:
+            seances: Sessions (or approved reservations) to mark as occupied
+            pause_minutes: Mandatory pause after each session
+        """
+        self.pause_minutes = pause_minutes
+        # {(resource_kind, date): {resource_id: bitset}}
+        self._days: Dict[Tuple[str, str], Dict[int, int]] = {}
+        for seance in seances or []:
+            self.add_seance(seance)
+
+    def mask(self, start: int, end: int) -> int:
+        """Bitset of the cells covering [start, end + pause), in minutes"""
+        first = max(0, start // self.CELL_MINUTES)
+        last = min(self.CELLS_PER_DAY, -(-(end + self.pause_minutes) // self.CELL_MINUTES))
+        if last <= first:
+            return 0
+        return ((1 << (last - first)) - 1) << first
+
+    def mask_for(self, heure_debut: str, heure_fin: str) -> int:
+        """Same as mask() from "HH:MM" strings (0 if a time is invalid)"""
+        start = TimeUtils.time_to_minutes(heure_debut)
+        end = TimeUtils.time_to_minutes(heure_fin)
+        if start is None or end is None:
+            return 0
+        return self.mask(start, end)
+
+    def occupy(self, kind: str, resource_id: int, date: str, mask: int):
+        day = self._days.setdefault((kind, date), {})
+        day[resource_id] = day.get(resource_id, 0) | mask
+
+    def add_seance(self, seance: Dict):
+        """Marks the room, teacher and group of a session as occupied"""
+        slot = CompactSlot.from_seance(seance)
+        mask = self.mask(slot.start, slot.end) if slot is not None else 0
+        if not mask:
+            return
+        date = seance.get('date', '')
+        for kind, key in self.RESOURCE_KEYS.items():
+            resource_id = seance.get(key)
+            if resource_id is not None:
+                self.occupy(kind, resource_id, date, mask)
+
+    def day_mask(self, kind: str, resource_id: int, date: str) -> int:
+        """Occupied cells of a resource for a day"""
+        return self._days.get((kind, date), {}).get(resource_id, 0)
+
+    def is_free(self, kind: str, resource_id: int, date: str, mask: int) -> bool:
+        return not (self.day_mask(kind, resource_id, date) & mask)
+
+    def is_slot_free(self, date: str, heure_debut: str, heure_fin: str,
+                     salle_id: Optional[int] = None,
+                     enseignant_id: Optional[int] = None,
+                     groupe_id: Optional[int] = None) -> bool:
+        """True if every given resource is free on the slot (pause included)"""
+        mask = self.mask_for(heure_debut, heure_fin)
+        if not mask:
+            return False
+        for kind, resource_id in (('salle', salle_id), ('enseignant', enseignant_id),
+                                  ('groupe', groupe_id)):
+            if resource_id is not None and self.day_mask(kind, resource_id, date) & mask:
+                return False
+        return True
+
+    def free_resources(self, kind: str, date: str, mask: int,
+                       resource_ids: Iterable[int]) -> List[int]:
+        """Resources among resource_ids with none of the mask's cells occupied"""
+        day = self._days.get((kind, date))
+        if not day:
+            return list(resource_ids)
+        return [rid for rid in resource_ids if not day.get(rid, 0) & mask]
+
+    def busy_resources(self, kind: str, date: str, mask: int) -> set:
+        """Ids of the resources of a kind having at least one occupied cell in the mask"""
+        day = self._days.get((kind, date), {})
+        return {rid for rid, occupied in day.items() if occupied & mask}
@@ -0,0 +1,238 @@
+# src/logic/pdf_writer.py
+"""
+Minimal streaming PDF writer (no external dependency)
+Each page is compressed and written to disk as soon as it is finished:
+memory use does not grow with the number of pages
+"""
+
+import unicodedata
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+
+# Advance widths (1/1000 em) of the printable ASCII characters 32..126
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584
+]
+
+
+class StreamingPdfWriter:
+    """
+    Writes a PDF page by page with the standard (base-14) fonts.
+
+    Coordinates are in points with the origin at the TOP-LEFT corner of the
+    page. Text is encoded in WinAnsi (cp1252), which covers French accents.
+    Only the byte offsets of the objects are kept in memory until close().
+
+    Usage:
+        with StreamingPdfWriter(path, 'A4', 'landscape', 'Helvetica') as pdf:
+            pdf.begin_page()
+            pdf.text(40, 40, "Emploi du temps", size=16, bold=True)
+            pdf.end_page()
+    """
+
+    PAGE_SIZES = {
+        'A3': (841.89, 1190.55),
+        'A4': (595.28, 841.89),
+        'A5': (419.53, 595.28),
+        'Letter': (612.0, 792.0)
+    }
+
+    # Police de config -> (regular, bold) base-14 fonts
+    FONTS = {
+        'Helvetica': ('Helvetica', 'Helvetica-Bold'),
+        'Times': ('Times-Roman', 'Times-Bold'),
+        'Times-Roman': ('Times-Roman', 'Times-Bold'),
+        'Courier': ('Courier', 'Courier-Bold')
+    }
+
+    # Fixed object numbers, page objects come after them
+    _CATALOG, _PAGES, _FONT_REGULAR, _FONT_BOLD = 1, 2, 3, 4
+
+    def __init__(self, path: str, page_format: str = 'A4', orientation: str = 'portrait',
+                 police: str = 'Helvetica'):
+        width, height = self.PAGE_SIZES.get(page_format, self.PAGE_SIZES['A4'])
+        if orientation == 'landscape':
+            width, height = height, width
+        self.width = width
+        self.height = height
+        self.font_names = self.FONTS.get(police, self.FONTS['Helvetica'])
+        self.path = path
+
+        self._file = open(path, 'wb')
+        self._offsets: Dict[int, int] = {}
+        self._page_ids: List[int] = []
+        self._next_id = self._FONT_BOLD + 1
+        self._content: Optional[List[str]] = None
+
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for object_id, font in ((self._FONT_REGULAR, self.font_names[0]),
+                                (self._FONT_BOLD, self.font_names[1])):
+            self._write_object(object_id, (
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} "
+                f"/Encoding /WinAnsiEncoding >>"
+            ).encode('ascii'))
+
+    # ═══════════════════════════════════════════════════════════
+    # LOW LEVEL
+    # ═══════════════════════════════════════════════════════════
+
+    def _write_object(self, object_id: int, body: bytes):
+        self._offsets[object_id] = self._file.tell()
+        self._file.write(f"{object_id} 0 obj\n".encode('ascii'))
+        self._file.write(body)
+        self._file.write(b"\nendobj\n")
+
+    def _new_id(self) -> int:
+        object_id = self._next_id
+        self._next_id += 1
+        return object_id
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    @staticmethod
+    def _color(rgb: Tuple[float, float, float]) -> str:
+        return ' '.join(f"{component:.3f}" for component in rgb)
+
+    # ═══════════════════════════════════════════════════════════
+    # PAGES
+    # ═══════════════════════════════════════════════════════════
+
+    def begin_page(self):
+        if self._content is not None:
+            self.end_page()
+        self._content = []
+
+    def end_page(self):
+        """Compresses the page and writes it to disk"""
+        if self._content is None:
+            return
+        stream = zlib.compress('\n'.join(self._content).encode('cp1252', errors='replace'))
+        self._content = None
+
+        content_id = self._new_id()
+        self._write_object(content_id, (
+            f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode('ascii')
+            + stream + b"\nendstream"
+        ))
+        page_id = self._new_id()
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent {self._PAGES} 0 R "
+            f"/MediaBox [0 0 {self.width:.2f} {self.height:.2f}] "
+            f"/Resources << /Font << /F1 {self._FONT_REGULAR} 0 R /F2 {self._FONT_BOLD} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>"
+        ).encode('ascii'))
+        self._page_ids.append(page_id)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_ids)
+
+    # ═══════════════════════════════════════════════════════════
+    # DRAWING
+    # ═══════════════════════════════════════════════════════════
+
+    def text(self, x: float, y: float, text: str, size: float = 10, bold: bool = False,
+             color: Tuple[float, float, float] = (0, 0, 0)):
+        """Draws text whose top-left corner is at (x, y)"""
+        baseline = self.height - y - size * 0.8
+        self._content.append(
+            f"BT /{'F2' if bold else 'F1'} {size:.1f} Tf {self._color(color)} rg "
+            f"{x:.2f} {baseline:.2f} Td ({self._escape(text)}) Tj ET"
+        )
+
+    def rect(self, x: float, y: float, width: float, height: float,
+             fill: Optional[Tuple[float, float, float]] = None,
+             stroke: Optional[Tuple[float, float, float]] = (0, 0, 0), line_width: float = 0.5):
+        """Rectangle whose top-left corner is at (x, y)"""
+        operator = {(True, True): 'B', (True, False): 'f', (False, True): 'S'}.get(
+            (fill is not None, stroke is not None))
+        if operator is None:
+            return
+        commands = [f"{line_width:.2f} w"]
+        if fill is not None:
+            commands.append(f"{self._color(fill)} rg")
+        if stroke is not None:
+            commands.append(f"{self._color(stroke)} RG")
+        commands.append(f"{x:.2f} {self.height - y - height:.2f} {width:.2f} {height:.2f} re {operator}")
+        self._content.append(' '.join(commands))
+
+    def line(self, x1: float, y1: float, x2: float, y2: float,
+             color: Tuple[float, float, float] = (0, 0, 0), line_width: float = 0.5):
+        self._content.append(
+            f"{line_width:.2f} w {self._color(color)} RG "
+            f"{x1:.2f} {self.height - y1:.2f} m {x2:.2f} {self.height - y2:.2f} l S"
+        )
+
+    def text_width(self, text: str, size: float, bold: bool = False) -> float:
+        """Width of a text in points (accented letters measured as their base letter)"""
+        if self.font_names[0] == 'Courier':
+            return len(text) * 0.6 * size
+        # Times is narrower than Helvetica: Helvetica widths are a safe upper bound
+        widths = _HELVETICA_BOLD_WIDTHS if bold else _HELVETICA_WIDTHS
+        total = 0
+        for char in text:
+            code = ord(unicodedata.normalize('NFD', char)[0])
+            total += widths[code - 32] if 32 <= code <= 126 else 556
+        return total * size / 1000
+
+    def fit_text(self, text: str, max_width: float, size: float, bold: bool = False) -> str:
+        """Text shortened with "..." to fit in max_width"""
+        if self.text_width(text, size, bold) <= max_width:
+            return text
+        while text and self.text_width(text + "...", size, bold) > max_width:
+            text = text[:-1]
+        return text + "..." if text else ""
+
+    # ═══════════════════════════════════════════════════════════
+    # END OF DOCUMENT
+    # ═══════════════════════════════════════════════════════════
+
+    def close(self):
+        """Writes the page tree, the cross-reference table and the trailer"""
+        if self._file.closed:
+            return
+        self.end_page()
+        if not self._page_ids:
+            # A PDF needs at least one page
+            self.begin_page()
+            self.end_page()
+
+        kids = ' '.join(f"{page_id} 0 R" for page_id in self._page_ids)
+        self._write_object(self._PAGES, (
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>"
+        ).encode('ascii'))
+        self._write_object(self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGES} 0 R >>".encode('ascii'))
+
+        xref_offset = self._file.tell()
+        size = self._next_id
+        self._file.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode('ascii'))
+        for object_id in range(1, size):
+            self._file.write(f"{self._offsets[object_id]:010d} 00000 n \n".encode('ascii'))
+        self._file.write((
+            f"trailer\n<< /Size {size} /Root {self._CATALOG} 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        ).encode('ascii'))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
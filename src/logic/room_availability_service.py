@@ -1,5 +1,7 @@
 # src/logic/room_availability_service.py
-from typing import List, Dict, Optional
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Optional, Tuple
+import config
 from src.logic.conflict_detector import ConflictDetector
 from src.logic.time_utils import TimeUtils
 
@@ -7,48 +9,103 @@ class RoomAvailabilityService:
     """
     Service de recherche des salles disponibles.
     """
-    
+
     def __init__(self, db):
         self.db = db
 
-    def find_available_rooms(self, date: str, heure_debut: str, heure_fin: str, 
+    def _filtrer_salles(self, min_capacite: int, type_salle: Optional[str]) -> List[Dict]:
+        """Salles ayant la capacité et le type demandés"""
+        return [
+            room for room in self.db.get_toutes_salles()
+            if room['capacite'] >= min_capacite
+            and (type_salle is None or room['type_salle'] == type_salle)
+        ]
+
+    def _occupations_du_jour(self, date: str) -> List[Tuple[int, int, int]]:
+        """
+        (salle_id, début, fin) en minutes de toutes les séances et réservations
+        validées du jour, triées par début (une requête par table)
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT salle_id, heure_debut, heure_fin FROM seances WHERE date = ?", (date,))
+        rows = cursor.fetchall()
+        cursor.execute(
+            "SELECT salle_id, heure_debut, heure_fin FROM reservations "
+            "WHERE date = ? AND statut = 'validee'", (date,)
+        )
+        rows.extend(cursor.fetchall())
+        conn.close()
+
+        occupations = []
+        for salle_id, heure_debut, heure_fin in rows:
+            start = TimeUtils.time_to_minutes(heure_debut)
+            end = TimeUtils.time_to_minutes(heure_fin)
+            if start is not None and end is not None:
+                occupations.append((salle_id, start, end))
+        occupations.sort(key=lambda occupation: occupation[1])
+        return occupations
+
+    def find_available_rooms(self, date: str, heure_debut: str, heure_fin: str,
                            min_capacite: int = 0, type_salle: Optional[str] = None) -> List[Dict]:
         """
         Trouve toutes les salles libres pour un créneau donné.
         Permet de filtrer par capacité minimale et type de salle.
         """
-        # 1. Récupérer toutes les salles depuis la base
-        all_rooms = self.db.get_toutes_salles()
-        
-        # Filtrer d'abord par capacité et type (Optimisation des performances)
-        candidate_rooms = []
-        for room in all_rooms:
-            if room['capacite'] >= min_capacite:
-                if type_salle is None or room['type_salle'] == type_salle:
-                    candidate_rooms.append(room)
-        
+        # 1. Filtrer d'abord par capacité et type (Optimisation des performances)
+        candidate_rooms = self._filtrer_salles(min_capacite, type_salle)
         if not candidate_rooms:
             return []
 
-        # 2. Récupérer toutes les séances de ce jour (pour la détection de conflit)
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM seances WHERE date = ?", (date,))
-        todays_seances = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        start = TimeUtils.time_to_minutes(heure_debut)
+        end = TimeUtils.time_to_minutes(heure_fin)
+        if start is None or end is None:
+            return []
+
+        # 2. Un seul passage sur les occupations du jour (pause comprise) :
+        # triées par début, on s'arrête dès qu'elles commencent après le créneau
+        pause = ConflictDetector.PAUSE_MINUTES
+        occupied = set()
+        for salle_id, occ_start, occ_end in self._occupations_du_jour(date):
+            if occ_start >= end + pause:
+                break
+            if occ_end + pause > start:
+                occupied.add(salle_id)
+
+        return [room for room in candidate_rooms if room['id'] not in occupied]
+
+    def find_available_rooms_by_slot(self, date: str, min_capacite: int = 0,
+                                     type_salle: Optional[str] = None,
+                                     creneaux: Optional[List[Tuple]] = None) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Salles libres pour chaque créneau de la journée en une seule fois.
+        Args:
+            creneaux: (heure_debut, heure_fin, ...) triés et disjoints
+                      (par défaut config.CRENEAUX_HORAIRES)
+        Returns:
+            {(heure_debut, heure_fin): [salles libres]}
+        """
+        creneaux = [c for c in (creneaux or config.CRENEAUX_HORAIRES)
+                    if TimeUtils.is_valid_time_range(c[0], c[1])]
+        creneaux.sort(key=lambda c: TimeUtils.time_to_minutes(c[0]))
+        candidate_rooms = self._filtrer_salles(min_capacite, type_salle)
+
+        pause = ConflictDetector.PAUSE_MINUTES
+        starts = [TimeUtils.time_to_minutes(c[0]) for c in creneaux]
+        # Fin élargie de la pause : les créneaux étant disjoints, elles sont croissantes
+        ends = [TimeUtils.time_to_minutes(c[1]) + pause for c in creneaux]
+
+        occupied = [set() for _ in creneaux]
+        if candidate_rooms:
+            for salle_id, occ_start, occ_end in self._occupations_du_jour(date):
+                # Créneaux touchés : fin + pause > début occupation
+                # et début < fin occupation + pause
+                first = bisect_right(ends, occ_start)
+                last = bisect_left(starts, occ_end + pause)
+                for index in range(first, last):
+                    occupied[index].add(salle_id)
 
-        detector = ConflictDetector(todays_seances)
-        
-        available_rooms = []
-        
-        # 3. Vérifier la disponibilité de chaque salle candidate
-        for room in candidate_rooms:
-            # detect_room_conflict retourne une chaîne si conflit, None si libre
-            conflict = detector.detect_room_conflict(
-                date, heure_debut, heure_fin, room['id']
-            )
-            
-            if conflict is None:
-                available_rooms.append(room)
-                
-        return available_rooms
\ No newline at end of file
+        return {
+            (creneau[0], creneau[1]): [room for room in candidate_rooms if room['id'] not in busy]
+            for creneau, busy in zip(creneaux, occupied)
+        }
@@ -4,12 +4,33 @@ Automatic schedule generation logic
 Generates timetables while respecting all constraints
 """
 
+import os
+import config
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+from src.logic.backtracking_solver import BacktrackingSolver
 from src.logic.conflict_detector import ConflictDetector
 from src.logic.constraint_validator import ConstraintValidator
+from src.logic.occupancy_grid import OccupancyGrid
 from src.logic.room_availability_service import RoomAvailabilityService
 from src.logic.time_utils import TimeUtils
+from src.logic.workload_ledger import WorkloadLedger
+
+
+def _solve_partition(params: Dict) -> Dict:
+    """Worker entry point: solves one partition in a separate process"""
+    solver = BacktrackingSolver(
+        rooms=params['rooms'],
+        dates=params['dates'],
+        time_slots=params['time_slots'],
+        existing_seances=params['existing_seances'],
+        max_iterations=params['max_iterations'],
+        timeout_secondes=params['timeout_secondes'],
+        prefer_room_types=params['prefer_room_types'],
+        teacher_day_limits=params.get('teacher_day_limits')
+    )
+    return solver.solve(params['courses'])
 
 
 class ScheduleGenerator:
@@ -38,12 +59,19 @@ class ScheduleGenerator:
             existing_reservations: List of existing reservations
         """
         self.db = db
-        self.constraint_validator = ConstraintValidator(db)
+        self.existing_seances = list(existing_seances or [])
+        self.existing_reservations = list(existing_reservations or [])
+        self.constraint_validator = ConstraintValidator(self.existing_seances,
+                                                        self.existing_reservations)
+        
+        # Sessions produced by the last generate_schedule() call
+        self.generated_sessions: List[Dict] = []
         
         # Combine seances and approved reservations
-        all_sessions = (existing_seances or [])
+        all_sessions = list(existing_seances or [])
+        self.approved_reservations: List[Dict] = []
         if existing_reservations:
-            approved_reservations = [
+            self.approved_reservations = [
                 {
                     'id': r.get('id'),
                     'date': r.get('date'),
@@ -56,10 +84,564 @@ class ScheduleGenerator:
                 for r in existing_reservations
                 if r.get('statut') == 'validee'
             ]
-            all_sessions.extend(approved_reservations)
+            all_sessions.extend(self.approved_reservations)
+        
+        self.all_sessions = all_sessions
+        self.conflict_detector = ConflictDetector(list(all_sessions))
+        self.occupancy = OccupancyGrid(all_sessions)
+        # Minutes per teacher per day / ISO week (existing + generated)
+        self.workload = WorkloadLedger(all_sessions)
+        self._day_limits: Dict[int, int] = {}
+        self.room_service = RoomAvailabilityService(db)
+    
+    def generate_schedule(self, courses: List[Dict], semaine_debut: str = None,
+                          teacher_weekly_hours: Dict[int, float] = None,
+                          parallel: Optional[bool] = None) -> Dict:
+        """
+        Generates the weekly timetable of many courses at once (whole faculty)
+        Uses config.GENERATION_CONFIG['algorithme']: 'backtracking' runs the
+        constraint-satisfaction engine, anything else the greedy first-fit.
+        Args:
+            courses: List of dicts with groupe_id, matiere, type_seance,
+                     duree_heures, enseignant_id, nb_seances_semaine
+            semaine_debut: Start week date "YYYY-MM-DD" (default: next Monday)
+            teacher_weekly_hours: Dict tracking teacher hours per week {teacher_id: hours}
+            parallel: Solve groups of filieres in worker processes (backtracking
+                      only; default: GENERATION_CONFIG['generation_parallele']).
+                      Meant for batch runs, not for the GUI process.
+        Returns:
+            Dict with 'success', 'sessions' (not yet saved to DB), 'unscheduled',
+            'algorithme', 'iterations' and 'timed_out'
+        """
+        if not semaine_debut:
+            semaine_debut = self._next_monday()
+        if teacher_weekly_hours is None:
+            teacher_weekly_hours = {}
+        
+        algorithme = config.GENERATION_CONFIG.get('algorithme', 'backtracking')
+        if parallel is None:
+            parallel = config.GENERATION_CONFIG.get('generation_parallele', False)
+        if algorithme == 'backtracking':
+            if parallel:
+                result = self._generate_parallel(courses, semaine_debut, teacher_weekly_hours)
+            else:
+                result = self._generate_with_solver(courses, semaine_debut, teacher_weekly_hours)
+        else:
+            result = self._generate_greedy(courses, semaine_debut, teacher_weekly_hours)
+        
+        result['algorithme'] = algorithme
+        self.generated_sessions = result['sessions']
+        return result
+    
+    def _accept_courses(self, courses: List[Dict], teacher_weekly_hours: Dict[int, float],
+                        semaine_debut: str = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Splits courses into those fitting the teacher workload (with the group's
+        effectif and filiere_id added) and those rejected up front
+        """
+        groupes = {g['id']: g for g in self.db.get_tous_groupes()}
+        max_week = config.CONTRAINTES['duree_max_semaine_enseignant']
+        
+        accepted = []
+        unscheduled = []
+        for course in courses:
+            # Same workload rule as the greedy path (8h/week for auto-generated)
+            current_hours = teacher_weekly_hours.get(course['enseignant_id'], 0.0)
+            hours_needed = course['duree_heures'] * course['nb_seances_semaine']
+            # Whole week, existing sessions and reservations included
+            week_minutes = (self.workload.week_minutes(course['enseignant_id'], semaine_debut)
+                            if semaine_debut else 0)
+            groupe = groupes.get(course['groupe_id'])
+            if (groupe is None or current_hours + hours_needed > self.MAX_TEACHER_HOURS_PER_WEEK
+                    or week_minutes + (current_hours + hours_needed) * 60 > max_week):
+                unscheduled.append(dict(course))
+                continue
+            teacher_weekly_hours[course['enseignant_id']] = current_hours + hours_needed
+            accepted.append(dict(course, effectif=groupe['effectif'], filiere_id=groupe['filiere_id']))
+        return accepted, unscheduled
+    
+    def _solver_params(self, courses: List[Dict], rooms: List[Dict], dates: List[str],
+                       existing_seances: List[Dict]) -> Dict:
+        """Arguments of one BacktrackingSolver run (plain data, picklable)"""
+        return {
+            'courses': courses,
+            'rooms': rooms,
+            'dates': dates,
+            'time_slots': self.DEFAULT_TIME_SLOTS,
+            'existing_seances': existing_seances,
+            'max_iterations': config.GENERATION_CONFIG.get('max_iterations', 10000),
+            'timeout_secondes': config.GENERATION_CONFIG.get('timeout_secondes', 300),
+            'prefer_room_types': (config.GENERATION_CONFIG.get('priorite_amphitheatre_cours', 5) <= 2
+                                  or config.GENERATION_CONFIG.get('priorite_laboratoire_tp', 5) <= 2),
+            'teacher_day_limits': {
+                course['enseignant_id']: self._day_limit(course['enseignant_id']) for course in courses
+            }
+        }
+    
+    def _day_limit(self, enseignant_id: int) -> int:
+        """Teacher's duree_max_jour (minutes), read once per generator"""
+        limit = self._day_limits.get(enseignant_id)
+        if limit is None:
+            limit = self.db.get_duree_max_enseignant(enseignant_id)
+            self._day_limits[enseignant_id] = limit
+        return limit
+    
+    def _generate_with_solver(self, courses: List[Dict], semaine_debut: str,
+                              teacher_weekly_hours: Dict[int, float]) -> Dict:
+        """Runs the backtracking engine on every course that fits the teacher workload"""
+        accepted, unscheduled = self._accept_courses(courses, teacher_weekly_hours, semaine_debut)
+        
+        result = _solve_partition(self._solver_params(
+            accepted,
+            [dict(room) for room in self.db.get_toutes_salles()],
+            self._get_week_dates(semaine_debut, 5),
+            self.all_sessions
+        ))
+        result['unscheduled'] = unscheduled + result['unscheduled']
+        result['success'] = not result['unscheduled']
+        
+        for session in result['sessions']:
+            self._register_session(session)
+        return result
+    
+    # ═══════════════════════════════════════════════════════════
+    # PARALLEL GENERATION
+    # ═══════════════════════════════════════════════════════════
+    
+    def _generate_parallel(self, courses: List[Dict], semaine_debut: str,
+                           teacher_weekly_hours: Dict[int, float]) -> Dict:
+        """
+        Solves groups of filieres in separate processes, then merges.
+        Each partition gets its own share of the rooms, so partitions only
+        collide on teachers shared between filieres; the merge keeps the
+        first session of each collision and a final sequential solve
+        (all rooms, everything merged so far fixed) re-places the rest.
+        """
+        max_workers = config.GENERATION_CONFIG.get('processus_max') or os.cpu_count() or 1
+        accepted, unscheduled = self._accept_courses(courses, teacher_weekly_hours, semaine_debut)
+        partitions = self._partition_courses(accepted, max_workers)
+        
+        dates = self._get_week_dates(semaine_debut, 5)
+        rooms = [dict(room) for room in self.db.get_toutes_salles()]
+        room_shares = self._split_rooms(rooms, partitions) if len(partitions) > 1 else [rooms]
+        params = [
+            self._solver_params(part, part_rooms, dates, self.all_sessions)
+            for part, part_rooms in zip(partitions, room_shares)
+        ]
+        results = self._run_partitions(params, max_workers)
+        return self._merge_partitions(partitions, results, unscheduled, rooms, dates)
+    
+    @staticmethod
+    def _course_load(courses: List[Dict]) -> float:
+        return sum(c['duree_heures'] * c['nb_seances_semaine'] for c in courses)
+    
+    @staticmethod
+    def _course_key(course: Dict) -> Tuple:
+        return (course['groupe_id'], course['enseignant_id'],
+                course.get('matiere', course.get('titre')), course['type_seance'])
+    
+    def _partition_courses(self, courses: List[Dict], max_workers: int) -> List[List[Dict]]:
+        """
+        Groups courses by filiere, then packs the filieres into at most
+        max_workers balanced partitions. Filieres sharing a teacher are kept
+        together whenever that still leaves enough independent blocks.
+        """
+        by_filiere: Dict[int, List[Dict]] = {}
+        for course in courses:
+            by_filiere.setdefault(course['filiere_id'], []).append(course)
+        if max_workers <= 1 or len(by_filiere) <= 1:
+            return [courses] if courses else []
+        
+        # Union-find of the filieres linked by a common teacher
+        parent = {filiere_id: filiere_id for filiere_id in by_filiere}
+        
+        def find(filiere_id):
+            while parent[filiere_id] != filiere_id:
+                parent[filiere_id] = parent[parent[filiere_id]]
+                filiere_id = parent[filiere_id]
+            return filiere_id
+        
+        teacher_filiere = {}
+        for filiere_id, filiere_courses in by_filiere.items():
+            for course in filiere_courses:
+                other = teacher_filiere.setdefault(course['enseignant_id'], filiere_id)
+                parent[find(filiere_id)] = find(other)
+        
+        components: Dict[int, List[Dict]] = {}
+        for filiere_id, filiere_courses in by_filiere.items():
+            components.setdefault(find(filiere_id), []).extend(filiere_courses)
+        
+        if len(components) >= min(max_workers, len(by_filiere)):
+            blocks = list(components.values())
+        else:
+            blocks = list(by_filiere.values())
+        
+        # Largest blocks first, each one into the least loaded partition
+        blocks.sort(key=self._course_load, reverse=True)
+        partitions = [[] for _ in range(min(max_workers, len(blocks)))]
+        loads = [0.0] * len(partitions)
+        for block in blocks:
+            index = loads.index(min(loads))
+            partitions[index].extend(block)
+            loads[index] += self._course_load(block)
+        return partitions
+    
+    def _split_rooms(self, rooms: List[Dict], partitions: List[List[Dict]]) -> List[List[Dict]]:
+        """
+        Deals the rooms between partitions, type by type and largest first,
+        each room going to the partition with the fewest rooms per hour of load
+        """
+        loads = [self._course_load(part) or 1.0 for part in partitions]
+        shares = [[] for _ in partitions]
+        by_type: Dict[str, List[Dict]] = {}
+        for room in rooms:
+            by_type.setdefault(room['type_salle'], []).append(room)
+        
+        for type_rooms in by_type.values():
+            given = [0] * len(partitions)
+            for room in sorted(type_rooms, key=lambda r: (-r['capacite'], r['id'])):
+                index = min(range(len(partitions)), key=lambda i: given[i] / loads[i])
+                shares[index].append(room)
+                given[index] += 1
+        return shares
+    
+    @staticmethod
+    def _run_partitions(params: List[Dict], max_workers: int) -> List[Dict]:
+        """Solves the partitions in a process pool (in-process if only one)"""
+        if len(params) < 2 or max_workers <= 1:
+            return [_solve_partition(p) for p in params]
+        try:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(params))) as pool:
+                return list(pool.map(_solve_partition, params))
+        except Exception as e:
+            # Pool unavailable, pickling error, worker failure...: same result sequentially
+            print(f"Génération parallèle indisponible ({e}), résolution séquentielle")
+            return [_solve_partition(p) for p in params]
+    
+    def _merge_partitions(self, partitions: List[List[Dict]], results: List[Dict],
+                          unscheduled: List[Dict], rooms: List[Dict], dates: List[str]) -> Dict:
+        """Merges the partition results and re-places sessions lost in the merge"""
+        courses_by_key = {}
+        for part in partitions:
+            for course in part:
+                courses_by_key[self._course_key(course)] = course
+        
+        grid = OccupancyGrid(self.all_sessions)
+        # Partitions sharing a teacher each stayed within the limits on their own
+        ledger = WorkloadLedger(self.all_sessions)
+        sessions = []
+        missing: Dict[Tuple, int] = {}
+        used_dates: Dict[Tuple, set] = {}
+        for result in results:
+            for course in result['unscheduled']:
+                key = self._course_key(course)
+                missing[key] = missing.get(key, 0) + course['sessions_manquantes']
+            for session in result['sessions']:
+                key = self._course_key(session)
+                enseignant_id = session['enseignant_id']
+                if (grid.is_slot_free(session['date'], session['heure_debut'], session['heure_fin'],
+                                      session['salle_id'], enseignant_id, session['groupe_id'])
+                        and ledger.fits(enseignant_id, session['date'], ledger.duration(session),
+                                        max_day=self._day_limit(enseignant_id))):
+                    grid.add_seance(session)
+                    ledger.add(session)
+                    sessions.append(session)
+                    used_dates.setdefault(key, set()).add(session['date'])
+                else:
+                    # Collision or teacher over the daily / weekly limit
+                    # with another partition (shared teacher)
+                    missing[key] = missing.get(key, 0) + 1
+        
+        iterations = sum(result['iterations'] for result in results)
+        timed_out = any(result['timed_out'] for result in results)
+        
+        # Conflict-repair pass: every room, everything merged so far is fixed
+        repair_courses = [
+            dict(courses_by_key[key], nb_seances_semaine=count,
+                 dates_exclues=sorted(used_dates.get(key, ())))
+            for key, count in missing.items() if count
+        ]
+        if repair_courses:
+            repair = _solve_partition(self._solver_params(
+                repair_courses, rooms, dates, self.all_sessions + sessions
+            ))
+            sessions.extend(repair['sessions'])
+            for course in repair['unscheduled']:
+                course.pop('dates_exclues', None)
+                unscheduled.append(course)
+            iterations += repair['iterations']
+            timed_out = timed_out or repair['timed_out']
+        
+        for session in sessions:
+            self._register_session(session)
+        
+        return {
+            'success': not unscheduled,
+            'sessions': sessions,
+            'unscheduled': unscheduled,
+            'iterations': iterations,
+            'timed_out': timed_out,
+            'partitions': len(partitions)
+        }
+    
+    def _generate_greedy(self, courses: List[Dict], semaine_debut: str,
+                         teacher_weekly_hours: Dict[int, float]) -> Dict:
+        """First-fit placement, one course after the other"""
+        sessions = []
+        unscheduled = []
+        for course in courses:
+            generated = self.generate_schedule_for_group(
+                course['groupe_id'], course['matiere'], course['type_seance'],
+                course['duree_heures'], course['enseignant_id'],
+                course['nb_seances_semaine'], semaine_debut, teacher_weekly_hours
+            )
+            # Later courses must see the sessions placed so far
+            for session in generated:
+                self._register_session(session)
+            sessions.extend(generated)
+            if len(generated) < min(course['nb_seances_semaine'], 5):
+                unscheduled.append(dict(course))
+        
+        return {
+            'success': not unscheduled,
+            'sessions': sessions,
+            'unscheduled': unscheduled,
+            'iterations': len(courses),
+            'timed_out': False
+        }
+    
+    def _register_session(self, session: Dict):
+        """Makes a generated session visible to later conflict checks"""
+        self.conflict_detector.add_seance(session)
+        self.occupancy.add_seance(session)
+        self.workload.add(session)
+    
+    def save_generated_schedule(self) -> int:
+        """Saves the sessions of the last generate_schedule() call in one transaction"""
+        saved = 0
+        with self.db.transaction():
+            for session in self.generated_sessions:
+                if self.db.ajouter_seance(**session):
+                    saved += 1
+        return saved
+    
+    # ═══════════════════════════════════════════════════════════
+    # INCREMENTAL REPAIR
+    # ═══════════════════════════════════════════════════════════
+    
+    def repair_schedule(self, seances: List[Dict], changement: Dict) -> Dict:
+        """
+        Re-places only the sessions invalidated by a single change instead
+        of regenerating the whole timetable
+        Args:
+            seances: Committed sessions (with their 'id')
+            changement: One of
+                {'type': 'indisponibilite', 'enseignant_id', 'date', 'heure_debut', 'heure_fin'}
+                {'type': 'salle_supprimee', 'salle_id'}
+                {'type': 'effectif_groupe', 'groupe_id', 'effectif'}
+                plus optionally 'indisponibilites': unavailabilities already
+                declared, [{'enseignant_id', 'date', 'heure_debut', 'heure_fin'}],
+                never used as a new slot
+        Returns:
+            Dict with 'success', 'moved' (sessions with their id and new
+            date/time/room, not yet saved), 'unscheduled' (sessions that could
+            not be re-placed) and 'affected' (number of invalidated sessions)
+        """
+        seances = [dict(seance) for seance in seances]
+        rooms = sorted((dict(room) for room in self.db.get_toutes_salles()),
+                       key=lambda r: (r['capacite'], r['id']))
+        effectifs = {g['id']: g['effectif'] for g in self.db.get_tous_groupes()}
+        # Unavailabilities occupy the teacher (not counted as teaching time)
+        blocking = [self._unavailability_block(block) for block in changement.get('indisponibilites', [])]
+        
+        type_changement = changement.get('type')
+        if type_changement == 'indisponibilite':
+            enseignant_id = changement['enseignant_id']
+            # The unavailability itself becomes a fixed occupation of the teacher
+            new_block = self._unavailability_block(changement)
+            blocking.append(new_block)
+            detector = ConflictDetector([new_block])
+            affected = [
+                i for i, seance in enumerate(seances)
+                if seance.get('enseignant_id') == enseignant_id
+                and detector.detect_teacher_conflict(seance['date'], seance['heure_debut'],
+                                                     seance['heure_fin'], enseignant_id)
+            ]
+        elif type_changement == 'salle_supprimee':
+            rooms = [room for room in rooms if room['id'] != changement['salle_id']]
+            affected = [i for i, seance in enumerate(seances)
+                        if seance.get('salle_id') == changement['salle_id']]
+        elif type_changement == 'effectif_groupe':
+            effectifs[changement['groupe_id']] = changement['effectif']
+            capacites = {room['id']: room['capacite'] for room in rooms}
+            affected = [
+                i for i, seance in enumerate(seances)
+                if seance.get('groupe_id') == changement['groupe_id']
+                and capacites.get(seance.get('salle_id'), 0) < changement['effectif']
+            ]
+        else:
+            raise ValueError(f"Type de changement inconnu : {type_changement}")
+        
+        if not affected:
+            return {'success': True, 'moved': [], 'unscheduled': [], 'affected': 0}
+        
+        affected_set = set(affected)
+        kept = [seance for i, seance in enumerate(seances) if i not in affected_set]
+        fixed = self.approved_reservations + blocking
+        grid = OccupancyGrid(kept + fixed)
+        
+        # 1. Room-only changes: same date and time, another room if possible
+        moved = []
+        pending = []
+        for i in affected:
+            seance = seances[i]
+            if type_changement != 'indisponibilite':
+                new_room = self._free_room_at(grid, seance, rooms, effectifs)
+                if new_room is not None:
+                    moved_seance = dict(seance, salle_id=new_room)
+                    grid.add_seance(moved_seance)
+                    moved.append(moved_seance)
+                    continue
+            pending.append(seance)
+        
+        # 2. Everything else: re-solve the affected week, then its neighbourhood
+        unscheduled = []
+        by_week: Dict[str, List[Dict]] = {}
+        for seance in pending:
+            by_week.setdefault(self._monday_of(seance['date']), []).append(seance)
+        
+        for monday, week_pending in by_week.items():
+            dates = self._get_week_dates(monday, 5)
+            week_kept = [s for s in kept if s['date'] in dates]
+            other_fixed = fixed + moved + [s for s in kept if s['date'] not in dates]
+            
+            placed, missing = self._replace_sessions(week_pending, week_kept, other_fixed,
+                                                     rooms, effectifs, dates)
+            if missing:
+                # Also free the sessions sharing a teacher or a group with the
+                # ones left out, and keep this wider attempt only if it is better
+                teachers = {s['enseignant_id'] for s in missing}
+                groups = {s['groupe_id'] for s in missing}
+                released = [s for s in week_kept
+                            if s['enseignant_id'] in teachers or s['groupe_id'] in groups]
+                if released:
+                    released_ids = {id(s) for s in released}
+                    remaining = [s for s in week_kept if id(s) not in released_ids]
+                    wide_placed, wide_missing = self._replace_sessions(
+                        week_pending + released, remaining, other_fixed, rooms, effectifs, dates
+                    )
+                    if len(wide_missing) < len(missing):
+                        placed, missing = wide_placed, wide_missing
+            
+            moved.extend(placed)
+            unscheduled.extend(missing)
+        
+        originals = {seance.get('id'): seance for seance in seances}
+        moved = [
+            seance for seance in moved
+            if any(seance[key] != originals.get(seance.get('id'), {}).get(key)
+                   for key in ('date', 'heure_debut', 'heure_fin', 'salle_id'))
+        ]
+        return {
+            'success': not unscheduled,
+            'moved': moved,
+            'unscheduled': unscheduled,
+            'affected': len(affected)
+        }
+    
+    @staticmethod
+    def _unavailability_block(block: Dict) -> Dict:
+        return {
+            'date': block['date'],
+            'heure_debut': block['heure_debut'],
+            'heure_fin': block['heure_fin'],
+            'salle_id': None,
+            'enseignant_id': block['enseignant_id'],
+            'groupe_id': None,
+            'indisponibilite': True
+        }
+    
+    @staticmethod
+    def _free_room_at(grid: OccupancyGrid, seance: Dict, rooms: List[Dict],
+                      effectifs: Dict[int, int]) -> Optional[int]:
+        """Smallest room fitting the group that is free at the session's time"""
+        mask = grid.mask_for(seance['heure_debut'], seance['heure_fin'])
+        if not mask:
+            return None
+        effectif = effectifs.get(seance.get('groupe_id'), 0)
+        free_rooms = grid.free_resources(
+            'salle', seance['date'], mask,
+            [room['id'] for room in rooms if room['capacite'] >= effectif]
+        )
+        return free_rooms[0] if free_rooms else None
+    
+    def _replace_sessions(self, to_place: List[Dict], week_kept: List[Dict],
+                          other_fixed: List[Dict], rooms: List[Dict],
+                          effectifs: Dict[int, int], dates: List[str]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Solves the placement of the given sessions (one course each, on a day
+        not already used by a kept session of the same course)
+        Returns: (placed sessions with their original id, sessions not placed)
+        """
+        kept_dates: Dict[Tuple, set] = {}
+        for seance in week_kept:
+            kept_dates.setdefault(self._course_key(seance), set()).add(seance['date'])
         
-        self.conflict_detector = ConflictDetector(all_sessions)
-        self.room_service = RoomAvailabilityService(db, existing_seances, existing_reservations)
+        courses = []
+        by_key: Dict[Tuple, List[Dict]] = {}
+        for seance in to_place:
+            key = self._course_key(seance)
+            by_key.setdefault(key, []).append(seance)
+            start = TimeUtils.time_to_minutes(seance['heure_debut']) or 0
+            end = TimeUtils.time_to_minutes(seance['heure_fin']) or 0
+            courses.append({
+                'groupe_id': seance['groupe_id'],
+                'effectif': effectifs.get(seance['groupe_id'], 0),
+                'enseignant_id': seance['enseignant_id'],
+                'matiere': seance['titre'],
+                'type_seance': seance['type_seance'],
+                'duree_heures': (end - start) / 60,
+                'nb_seances_semaine': 1,
+                'dates_exclues': sorted(kept_dates.get(key, ()))
+            })
+        
+        result = _solve_partition(self._solver_params(
+            courses, rooms, dates, week_kept + other_fixed
+        ))
+        
+        placed = []
+        for session in result['sessions']:
+            seance = by_key[self._course_key(session)].pop()
+            placed.append(dict(seance, date=session['date'], heure_debut=session['heure_debut'],
+                               heure_fin=session['heure_fin'], salle_id=session['salle_id']))
+        missing = [seance for group in by_key.values() for seance in group]
+        return placed, missing
+    
+    def save_repaired_schedule(self, repair: Dict) -> int:
+        """Moves the sessions of a repair_schedule() result in one transaction"""
+        saved = 0
+        with self.db.transaction():
+            for seance in repair['moved']:
+                if self.db.deplacer_seance(seance['id'], seance['date'], seance['heure_debut'],
+                                           seance['heure_fin'], seance['salle_id']):
+                    saved += 1
+        return saved
+    
+    @staticmethod
+    def _monday_of(date: str) -> str:
+        """Date "YYYY-MM-DD" of the Monday of the date's week"""
+        day = datetime.strptime(date, "%Y-%m-%d")
+        return (day - timedelta(days=day.weekday())).strftime("%Y-%m-%d")
+    
+    @staticmethod
+    def _next_monday() -> str:
+        """Date "YYYY-MM-DD" of next Monday"""
+        today = datetime.now()
+        days_ahead = (7 - today.weekday()) % 7
+        if days_ahead == 0:
+            days_ahead = 7
+        next_monday = today + timedelta(days=days_ahead)
+        return next_monday.strftime("%Y-%m-%d")
     
     def generate_schedule_for_group(self, groupe_id: int, matiere: str,
                                    type_seance: str, duree_heures: float,
@@ -82,12 +664,7 @@ class ScheduleGenerator:
         """
         if not semaine_debut:
             # Start from next Monday
-            today = datetime.now()
-            days_ahead = (7 - today.weekday()) % 7
-            if days_ahead == 0:
-                days_ahead = 7
-            next_monday = today + timedelta(days=days_ahead)
-            semaine_debut = next_monday.strftime("%Y-%m-%d")
+            semaine_debut = self._next_monday()
         
         # Initialize teacher hours tracking if not provided
         if teacher_weekly_hours is None:
@@ -181,6 +758,11 @@ class ScheduleGenerator:
         """
         Finds a suitable time slot and room for a session
         """
+        # Teacher's daily (duree_max_jour) and weekly limits
+        if not self.workload.fits(enseignant_id, date, duree_minutes,
+                                  max_day=self._day_limit(enseignant_id)):
+            return None
+        
         # Try each default time slot
         for heure_debut, heure_fin_base in self.DEFAULT_TIME_SLOTS:
             # Calculate actual end time based on duration
@@ -197,30 +779,28 @@ class ScheduleGenerator:
             if not TimeUtils.is_valid_time_range(heure_debut, heure_fin):
                 continue
             
-            # Try each available room
-            for room in available_rooms:
-                salle_id = room['id']
-                
-                # Check for conflicts
-                conflicts = self.conflict_detector.detect_all_conflicts(
-                    date, heure_debut, heure_fin,
-                    salle_id=salle_id,
-                    enseignant_id=enseignant_id,
-                    groupe_id=groupe_id
-                )
-                
-                if not conflicts:
-                    # Found a suitable slot!
-                    return {
-                        'titre': matiere,
-                        'type_seance': type_seance,
-                        'date': date,
-                        'heure_debut': heure_debut,
-                        'heure_fin': heure_fin,
-                        'salle_id': salle_id,
-                        'enseignant_id': enseignant_id,
-                        'groupe_id': groupe_id
-                    }
+            # Teacher and group must be free (one AND each on the occupancy grid)
+            mask = self.occupancy.mask(start_min, end_min)
+            if not (self.occupancy.is_free('enseignant', enseignant_id, date, mask)
+                    and self.occupancy.is_free('groupe', groupe_id, date, mask)):
+                continue
+            
+            # First available room with no conflict
+            free_rooms = self.occupancy.free_resources(
+                'salle', date, mask, [room['id'] for room in available_rooms]
+            )
+            if free_rooms:
+                # Found a suitable slot!
+                return {
+                    'titre': matiere,
+                    'type_seance': type_seance,
+                    'date': date,
+                    'heure_debut': heure_debut,
+                    'heure_fin': heure_fin,
+                    'salle_id': free_rooms[0],
+                    'enseignant_id': enseignant_id,
+                    'groupe_id': groupe_id
+                }
         
         return None
     
@@ -232,80 +812,39 @@ class ScheduleGenerator:
         Returns:
             (is_valid, list_of_errors)
         """
-        errors = []
-        
-        for session in sessions:
-            # Validate constraints
-            is_valid, constraint_errors = self.constraint_validator.validate_all_constraints(
-                session['date'],
-                session['heure_debut'],
-                session['heure_fin'],
-                salle_id=session.get('salle_id'),
-                groupe_id=session.get('groupe_id'),
-                is_reservation=False  # Not a reservation, so no advance notice required
-            )
-            
-            if not is_valid:
-                errors.extend(constraint_errors)
-            
-            # Check conflicts
-            conflict_errors = self.conflict_detector.detect_all_conflicts(
-                session['date'],
-                session['heure_debut'],
-                session['heure_fin'],
-                salle_id=session.get('salle_id'),
-                enseignant_id=session.get('enseignant_id'),
-                groupe_id=session.get('groupe_id')
-            )
-            
-            errors.extend(conflict_errors)
+        # One sweep over existing commitments and all proposals (overlaps
+        # between two generated sessions included)
+        errors = [
+            error
+            for session_errors in self.constraint_validator.validate_many(sessions)
+            for error in session_errors
+        ]
         
         return len(errors) == 0, errors
     
     def get_teacher_weekly_hours(self, enseignant_id: int, semaine_debut: str,
                                  existing_seances: List[Dict] = None) -> float:
         """
-        Calculates total hours for a teacher in a given week (auto-generated sessions only)
+        Calculates total hours for a teacher from semaine_debut to 6 days later
+        (sessions and approved reservations, whatever the starting weekday)
         Args:
             enseignant_id: Teacher ID
             semaine_debut: Start of week date "YYYY-MM-DD"
-            existing_seances: List of existing sessions (optional, for calculation)
+            existing_seances: List of existing sessions (optional, instead of the database)
         Returns:
             Total hours for the teacher in that week
         """
+        try:
+            start_date = datetime.strptime(semaine_debut, "%Y-%m-%d")
+        except ValueError:
+            return 0.0
+        semaine_fin = (start_date + timedelta(days=6)).strftime("%Y-%m-%d")
+        
         if not existing_seances:
-            # Get from database
-            try:
-                conn = self.db.get_connection()
-                cursor = conn.cursor()
-                
-                # Calculate week end date
-                start_date = datetime.strptime(semaine_debut, "%Y-%m-%d")
-                week_end = start_date + timedelta(days=6)
-                semaine_fin = week_end.strftime("%Y-%m-%d")
-                
-                cursor.execute('''
-                    SELECT * FROM seances
-                    WHERE enseignant_id = ? 
-                    AND date >= ? AND date <= ?
-                ''', (enseignant_id, semaine_debut, semaine_fin))
-                
-                existing_seances = [dict(row) for row in cursor.fetchall()]
-                conn.close()
-            except Exception as e:
-                print(f"Erreur lors du calcul des heures: {e}")
-                return 0.0
-        
-        # Calculate total hours
-        total_hours = 0.0
-        for seance in existing_seances:
-            if seance.get('enseignant_id') == enseignant_id:
-                # Calculate duration in hours
-                duree_minutes = TimeUtils.calculate_duration(
-                    seance.get('heure_debut', ''),
-                    seance.get('heure_fin', '')
-                )
-                total_hours += duree_minutes / 60.0
-        
-        return total_hours
+            # Database ledger: sessions + approved reservations
+            return self.db.calculer_duree_periode_enseignant(
+                enseignant_id, semaine_debut, semaine_fin) / 60.0
+        
+        ledger = WorkloadLedger(existing_seances)
+        return ledger.period_minutes(enseignant_id, semaine_debut, semaine_fin) / 60.0
 
@@ -8,6 +8,7 @@ from src.logic.reservation_validator import ReservationValidator
 from src.logic.room_availability_service import RoomAvailabilityService
 from src.logic.unavailability_service import UnavailabilityService
 from src.logic.schedule_generator import ScheduleGenerator
+from src.logic.time_utils import TimeUtils
 
 class ServiceFacade:
     """
@@ -26,13 +27,14 @@ class ServiceFacade:
     # === GESTION DES SÉANCES (Ajout manuel) ===
     def create_seance(self, data: Dict) -> Tuple[bool, List[str]]:
         """Créer une nouvelle séance avec validation complète des contraintes."""
-        # 1. Récupération des données nécessaires
-        all_seances = self.db.get_toutes_seances()
-        salles = self.db.get_toutes_salles()
-        groupes = self.db.get_tous_groupes()
+        # 1. Récupération des données nécessaires (seulement les engagements
+        # qui chevauchent le créneau, trouvés par la base)
+        seances, reservations = self._engagements_en_conflit(data, groupe_id=data['groupe_id'])
+        salles = [dict(salle) for salle in self.db.get_toutes_salles()]
+        groupes = [dict(groupe) for groupe in self.db.get_tous_groupes()]
         
         # 2. Validation (Conflits, Capacité, Horaires...)
-        validator = ConstraintValidator(all_seances, salles=salles, groupes=groupes)
+        validator = ConstraintValidator(seances, reservations, salles=salles, groupes=groupes)
         is_valid, errors = validator.validate_seance(
             date=data['date'],
             heure_debut=data['heure_debut'],
@@ -52,13 +54,32 @@ class ServiceFacade:
         except Exception as e:
             return False, [str(e)]
 
+    def _engagements_en_conflit(self, data: Dict,
+                                groupe_id: Optional[int] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Séances et réservations validées qui chevauchent le créneau demandé (requête SQL)"""
+        if not TimeUtils.is_valid_time_range(data['heure_debut'], data['heure_fin']):
+            return [], []
+        seances, reservations, vus = [], [], set()
+        for conflit in self.db.rechercher_conflits(
+                data['date'], data['heure_debut'], data['heure_fin'],
+                salle_id=data.get('salle_id'), enseignant_id=data.get('enseignant_id'),
+                groupe_id=groupe_id):
+            # Un engagement peut occuper plusieurs ressources demandées
+            if (conflit['source'], conflit['id']) in vus:
+                continue
+            vus.add((conflit['source'], conflit['id']))
+            if conflit['source'] == 'seance':
+                seances.append(conflit)
+            else:
+                reservations.append(dict(conflit, statut='validee'))
+        return seances, reservations
+
     # === GESTION DES RÉSERVATIONS (Demandes Profs) ===
     def request_reservation(self, data: Dict) -> Tuple[bool, List[str]]:
         """Soumettre une demande de réservation de salle."""
-        all_seances = self.db.get_toutes_seances()
-        existing_res = self.db.get_toutes_reservations()
+        seances, reservations = self._engagements_en_conflit(data)
         
-        validator = ReservationValidator(all_seances, existing_res)
+        validator = ReservationValidator(seances, reservations)
         is_valid, errors = validator.validate_reservation_request(
             enseignant_id=data['enseignant_id'],
             salle_id=data['salle_id'],
@@ -81,6 +102,10 @@ class ServiceFacade:
         """Délègue la recherche de salles au service dédié."""
         return self.room_service.find_available_rooms(date, start, end, capacity)
 
+    def find_free_rooms_by_slot(self, date: str, capacity: int = 0):
+        """Salles libres pour chaque créneau de la journée (CRENEAUX_HORAIRES)."""
+        return self.room_service.find_available_rooms_by_slot(date, capacity)
+
     # === GÉNÉRATION AUTOMATIQUE ===
     def generate_timetable(self, courses: List[Dict], start_date: str):
         """Lance l'algorithme de génération et sauvegarde si succès."""
@@ -0,0 +1,127 @@
+# src/logic/specialty_matcher.py
+"""
+Teacher specialite <-> subject matching
+All SPECIALITE_KEYWORDS are compiled once into an Aho-Corasick automaton:
+the specialites of a subject name are found in one pass over the name,
+whatever the number of keywords
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from src.logic.subject_catalog import get_catalog
+
+
+class SpecialtyMatcher:
+    """
+    Same rule as a `keyword.lower() in name.lower()` loop over every keyword
+    of every specialite (substring match, case-insensitive), in
+    O(len(name) + matches) per subject.
+    """
+
+    def __init__(self, specialite_keywords: Optional[Dict[str, List[str]]] = None):
+        if specialite_keywords is None:
+            specialite_keywords = get_catalog().specialite_keywords
+
+        # Trie: transitions, failure links and specialites ending at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+        for specialite, keywords in specialite_keywords.items():
+            for keyword in keywords:
+                if keyword:
+                    self._insert(keyword.lower(), specialite)
+        self._link()
+        self._cache: Dict[str, frozenset] = {}
+
+    def _insert(self, keyword: str, specialite: str):
+        state = 0
+        for char in keyword:
+            following = self._goto[state].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = following
+        self._output[state].add(specialite)
+
+    def _link(self):
+        """Breadth-first failure links; outputs inherit those of their failure state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[following] = target if target != following else 0
+                self._output[following] |= self._output[self._fail[following]]
+
+    # ═══════════════════════════════════════════════════════════
+    # MATCHING
+    # ═══════════════════════════════════════════════════════════
+
+    def specialites(self, name: str) -> frozenset:
+        """Specialites having at least one keyword contained in the subject name"""
+        found = self._cache.get(name)
+        if found is not None:
+            return found
+        state, matched = 0, set()
+        for char in name.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                matched |= self._output[state]
+        found = frozenset(matched)
+        self._cache[name] = found
+        return found
+
+    def matches(self, name: str, specialite: str) -> bool:
+        return specialite in self.specialites(name)
+
+    def subjects_by_specialite(self, names: Iterable[str]) -> Dict[str, List[str]]:
+        """{specialite: subject names}, one pass over the subjects"""
+        by_specialite: Dict[str, List[str]] = {}
+        for name in names:
+            for specialite in self.specialites(name):
+                by_specialite.setdefault(specialite, []).append(name)
+        return by_specialite
+
+
+def plan_associations(enseignants: Iterable[Dict], subjects: Iterable[Dict],
+                      matcher: Optional[SpecialtyMatcher] = None) -> List[Tuple[Dict, Dict]]:
+    """
+    (enseignant, subject) pairs: every subject matching the teacher's
+    specialite, in order, while the teacher's daily load stays within
+    duree_max_jour (a subject of N hours spread over 15 weeks of 5 days
+    weighs N / 15 * 60 / 5 minutes per day).
+
+    Args:
+        enseignants: Dicts with id, specialite, duree_max_jour
+        subjects: Dicts with nom and nb_heures_total
+    """
+    matcher = matcher or SpecialtyMatcher()
+    subjects = list(subjects)
+
+    # Subjects of each specialite, computed once for all teachers
+    by_specialite: Dict[str, List[Dict]] = {}
+    for subject in subjects:
+        for specialite in matcher.specialites(subject['nom']):
+            by_specialite.setdefault(specialite, []).append(subject)
+
+    associations = []
+    for enseignant in enseignants:
+        duree_max_jour = enseignant.get('duree_max_jour')
+        if duree_max_jour is None:
+            duree_max_jour = 480
+        duree_totale = 0.0
+        for subject in by_specialite.get(enseignant.get('specialite'), []):
+            minutes_par_jour = (subject['nb_heures_total'] / 15 * 60) / 5
+            if duree_totale + minutes_par_jour <= duree_max_jour:
+                associations.append((enseignant, subject))
+                duree_totale += minutes_par_jour
+    return associations
@@ -0,0 +1,170 @@
+# src/logic/subject_catalog.py
+"""
+Subject catalogue (config_matieres.MATIERES_COMPLETES and SPECIALITE_KEYWORDS)
+Loaded on first use only, indexed by cycle, filiere, semestre and subject
+code, and kept compiled on disk so that later runs skip building it
+"""
+
+import importlib.util
+import marshal
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+import config
+
+# (code, nom, type, heures cours, heures TD, heures TP)
+Subject = Tuple[str, str, str, int, int, int]
+
+_SOURCE = config.BASE_DIR / 'config_matieres.py'
+
+# Bumped when the layout of the compiled cache changes
+_CACHE_FORMAT = 1
+
+
+class SubjectCatalog:
+    """
+    Read-only view of the curriculum with its indexes.
+
+    Programme keys are "CYCLE_FILIERE_SEMESTRE" (e.g. "DEUST_TC-GI_S1",
+    "MST_BCMB_S3-V"): the cycle is before the first underscore, the
+    semestre after the last one and the filiere in between.
+    """
+
+    def __init__(self, matieres: Dict[str, List[Subject]], keywords: Dict[str, List[str]],
+                 indexes: Optional[Dict] = None):
+        self.matieres_completes = matieres
+        self.specialite_keywords = keywords
+        indexes = indexes or self.build_indexes(matieres)
+        self._by_cycle: Dict[str, List[str]] = indexes['cycle']
+        self._by_filiere: Dict[str, List[str]] = indexes['filiere']
+        self._by_semestre: Dict[str, List[str]] = indexes['semestre']
+        self._by_code: Dict[str, List[Tuple[str, int]]] = indexes['code']
+
+    @staticmethod
+    def split_key(key: str) -> Tuple[str, str, str]:
+        """(cycle, filiere, semestre) of a programme key"""
+        parts = key.split('_')
+        return parts[0], '_'.join(parts[1:-1]), parts[-1]
+
+    @classmethod
+    def build_indexes(cls, matieres: Dict[str, List[Subject]]) -> Dict:
+        indexes = {'cycle': {}, 'filiere': {}, 'semestre': {}, 'code': {}}
+        for key, subjects in matieres.items():
+            cycle, filiere, semestre = cls.split_key(key)
+            indexes['cycle'].setdefault(cycle, []).append(key)
+            indexes['filiere'].setdefault(filiere, []).append(key)
+            indexes['semestre'].setdefault(semestre, []).append(key)
+            for position, subject in enumerate(subjects):
+                indexes['code'].setdefault(subject[0], []).append((key, position))
+        return indexes
+
+    # ═══════════════════════════════════════════════════════════
+    # LOOKUPS
+    # ═══════════════════════════════════════════════════════════
+
+    def programme(self, key: str) -> List[Subject]:
+        """Subjects of one programme, e.g. programme("DEUST_TC-GI_S1")"""
+        return self.matieres_completes.get(key, [])
+
+    def programmes(self, cycle: str = None, filiere: str = None,
+                   semestre: str = None) -> List[str]:
+        """Programme keys matching every criterion given (all keys without criteria)"""
+        selected = None
+        for index, value in ((self._by_cycle, cycle), (self._by_filiere, filiere),
+                             (self._by_semestre, semestre)):
+            if value is None:
+                continue
+            keys = index.get(value, [])
+            if selected is None:
+                selected = keys
+            else:
+                wanted = set(keys)
+                selected = [key for key in selected if key in wanted]
+        return list(self.matieres_completes) if selected is None else list(selected)
+
+    def subjects(self, cycle: str = None, filiere: str = None,
+                 semestre: str = None) -> Dict[str, List[Subject]]:
+        """{programme key: subjects} of the matching programmes"""
+        return {key: self.matieres_completes[key]
+                for key in self.programmes(cycle, filiere, semestre)}
+
+    def by_code(self, code: str) -> List[Tuple[str, Subject]]:
+        """(programme key, subject) of every programme teaching this subject code"""
+        return [(key, self.matieres_completes[key][position])
+                for key, position in self._by_code.get(code, [])]
+
+    def keywords(self, specialite: str) -> List[str]:
+        return self.specialite_keywords.get(specialite, [])
+
+    def subject_count(self) -> int:
+        """Number of subjects over all programmes"""
+        return sum(len(subjects) for subjects in self.matieres_completes.values())
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOADING AND COMPILED CACHE
+# ═══════════════════════════════════════════════════════════════
+
+_catalog: Optional[SubjectCatalog] = None
+_lock = threading.Lock()
+
+
+def _signature() -> Tuple:
+    """Identifies the source file and the Python version (marshal format)"""
+    stat = os.stat(_SOURCE)
+    return (_CACHE_FORMAT, sys.version_info[:2], stat.st_mtime_ns, stat.st_size)
+
+
+def _read_cache(signature: Tuple) -> Optional[SubjectCatalog]:
+    try:
+        with open(config.CATALOGUE_CACHE_PATH, 'rb') as f:
+            payload = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get('signature') != signature:
+        return None
+    return SubjectCatalog(payload['matieres'], payload['keywords'], payload['indexes'])
+
+
+def _write_cache(signature: Tuple, catalog: SubjectCatalog, indexes: Dict):
+    """Best effort: a read-only installation simply rebuilds every time"""
+    path = str(config.CATALOGUE_CACHE_PATH)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary, 'wb') as f:
+            marshal.dump({'signature': signature, 'matieres': catalog.matieres_completes,
+                          'keywords': catalog.specialite_keywords, 'indexes': indexes}, f)
+        os.replace(temporary, path)
+    except (OSError, ValueError):
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def _load_source() -> Tuple[Dict, Dict]:
+    """Executes config_matieres.py (not kept in sys.modules)"""
+    spec = importlib.util.spec_from_file_location('config_matieres', _SOURCE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MATIERES_COMPLETES, module.SPECIALITE_KEYWORDS
+
+
+def get_catalog() -> SubjectCatalog:
+    """The catalogue, loaded on first call (compiled cache first, then source)"""
+    global _catalog
+    if _catalog is not None:
+        return _catalog
+    with _lock:
+        if _catalog is None:
+            signature = _signature()
+            catalog = _read_cache(signature)
+            if catalog is None:
+                matieres, keywords = _load_source()
+                indexes = SubjectCatalog.build_indexes(matieres)
+                catalog = SubjectCatalog(matieres, keywords, indexes)
+                _write_cache(signature, catalog, indexes)
+            _catalog = catalog
+    return _catalog
@@ -1,12 +1,77 @@
 # logic/time_utils.py
 from datetime import datetime, time
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Union
+
+
+@lru_cache(maxsize=4096)
+def _parse_minutes(time_str: str) -> Optional[int]:
+    """"HH:MM" -> minutes since midnight, same rules as time(hour, minute)"""
+    parts = time_str.split(':')
+    if len(parts) != 2:
+        return None
+    try:
+        hour = int(parts[0])
+        minute = int(parts[1])
+    except ValueError:
+        return None
+    if 0 <= hour <= 23 and 0 <= minute <= 59:
+        return hour * 60 + minute
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_day(date: str) -> Union[int, str]:
+    """"YYYY-MM-DD" -> date ordinal (the string itself if it is not a date)"""
+    try:
+        return datetime.strptime(date, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return date
+
+
+class CompactSlot:
+    """
+    Pre-parsed time slot: date ordinal + start/end in minutes.
+    Built once when sessions are loaded, then compared as plain integers.
+    """
+
+    __slots__ = ('day', 'start', 'end')
+
+    def __init__(self, day: Union[int, str], start: int, end: int):
+        self.day = day
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_strings(cls, date: str, heure_debut: str, heure_fin: str) -> Optional['CompactSlot']:
+        """None if a time cannot be parsed (such slots never overlap)"""
+        start = TimeUtils.time_to_minutes(heure_debut)
+        end = TimeUtils.time_to_minutes(heure_fin)
+        if start is None or end is None:
+            return None
+        return cls(TimeUtils.date_to_ordinal(date), start, end)
+
+    @classmethod
+    def from_seance(cls, seance: Dict) -> Optional['CompactSlot']:
+        return cls.from_strings(seance.get('date', ''), seance.get('heure_debut', ''),
+                                seance.get('heure_fin', ''))
+
+    def overlaps(self, other: 'CompactSlot', min_pause: int = 0) -> bool:
+        return (self.day == other.day
+                and self.start < other.end + min_pause
+                and other.start < self.end + min_pause)
+
+    def __repr__(self):
+        return f"CompactSlot({self.day!r}, {self.start}, {self.end})"
+
 
 class TimeSlot:
     def __init__(self, date: str, heure_debut: str, heure_fin: str):
         self.date = date
         self.heure_debut = heure_debut
         self.heure_fin = heure_fin
+        # Parsed once, reused by every overlaps_with() call
+        self.compact = CompactSlot.from_strings(date, heure_debut, heure_fin)
     
     def __str__(self):
         return f"{self.date} {self.heure_debut}-{self.heure_fin}"
@@ -17,14 +82,11 @@ class TimeSlot:
         Check if time slots overlap considering a minimum pause.
         min_pause: Minutes de pause requises entre les séances (ex: 10)
         """
-        if self.date != other.date:
+        if self.date != other.date or self.compact is None or other.compact is None:
             return False
         
-        return TimeUtils.times_overlap(
-            self.heure_debut, self.heure_fin,
-            other.heure_debut, other.heure_fin,
-            min_pause # <-- Hna kan-passiw l-pause
-        )
+        # Comparaison d'entiers (min_pause ajoutée à la fin de chaque créneau)
+        return self.compact.overlaps(other.compact, min_pause)
     
     # ... (B9i l-code khellih kif ma howa: contains, get_duration_minutes...)
     def get_duration_minutes(self) -> int:
@@ -46,10 +108,16 @@ class TimeUtils:
     
     @staticmethod
     def time_to_minutes(time_str: str) -> Optional[int]:
-        t = TimeUtils.parse_time(time_str)
-        if t:
-            return t.hour * 60 + t.minute
-        return None
+        # Cached: the same few "HH:MM" strings come back in every conflict scan
+        if not isinstance(time_str, str):
+            return None
+        return _parse_minutes(time_str)
+
+    @staticmethod
+    def date_to_ordinal(date: str) -> Union[int, str]:
+        if not isinstance(date, str):
+            return date
+        return _parse_day(date)
 
     # [MODIFICATION IMPORTANTE ICI] 👇
     @staticmethod
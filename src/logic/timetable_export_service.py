@@ -1,13 +1,25 @@
 # src/logic/timetable_export_service.py
 """
 Timetable Export Service - Backend logic for exporting timetables
-Supports PDF, Excel, and Image (PNG/JPG) formats
+Supports PDF, Excel (.xlsx), and Image (PNG/JPG) formats
 """
 
 import os
-from typing import List, Dict, Optional, Tuple
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from config import EXPORT_FOLDER, ETABLISSEMENT, ANNEE_UNIVERSITAIRE
+from config import EXPORT_FOLDER, EXPORT_CONFIG, ETABLISSEMENT, ANNEE_UNIVERSITAIRE
+from src.logic.export_cache import ExportCache
+from src.logic.pdf_writer import StreamingPdfWriter
+from src.logic.xlsx_writer import StreamingXlsxWriter
+
+
+def _render_timetable(task: Tuple[Dict, str, str, str]) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Worker entry point of the batch export: renders one timetable file"""
+    data, filename, format_type, output_dir = task
+    return TimetableExportService.render(data, filename, format_type, output_dir)
 
 
 class TimetableExportService:
@@ -22,6 +34,8 @@ class TimetableExportService:
         self.db = db
         # Ensure export folder exists
         os.makedirs(EXPORT_FOLDER, exist_ok=True)
+        # Reuse of files whose content did not change
+        self.cache = ExportCache() if EXPORT_CONFIG.get('cache_actif', True) else None
     
     def export_group_timetable(self, groupe_id: int, format_type: str = "pdf",
                               semaine_debut: str = None, semaine_fin: str = None) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -53,6 +67,7 @@ class TimetableExportService:
                 seances = self.db.get_seances_by_groupe(groupe_id, semaine_debut, semaine_fin)
             else:
                 seances = self.db.get_seances_by_groupe(groupe_id)
+            seances = [dict(row) for row in seances]
             
             conn.close()
             
@@ -60,14 +75,7 @@ class TimetableExportService:
             export_data = self._prepare_timetable_data(seances, groupe_nom, None)
             
             # Export based on format
-            if format_type.lower() == "pdf":
-                return self._export_pdf(export_data, f"emploi_du_temps_groupe_{groupe_nom}")
-            elif format_type.lower() in ["excel", "xlsx"]:
-                return self._export_excel(export_data, f"emploi_du_temps_groupe_{groupe_nom}")
-            elif format_type.lower() in ["png", "jpg", "jpeg"]:
-                return self._export_image(export_data, f"emploi_du_temps_groupe_{groupe_nom}", format_type)
-            else:
-                return False, None, f"Format non supporté: {format_type}"
+            return self._render_cached(export_data, f"emploi_du_temps_groupe_{groupe_nom}", format_type)
                 
         except Exception as e:
             return False, None, f"Erreur lors de l'export: {e}"
@@ -102,6 +110,7 @@ class TimetableExportService:
                 seances = self.db.get_seances_by_enseignant(enseignant_id, semaine_debut, semaine_fin)
             else:
                 seances = self.db.get_seances_by_enseignant(enseignant_id)
+            seances = [dict(row) for row in seances]
             
             # Get approved reservations for the teacher
             cursor.execute('''
@@ -111,18 +120,7 @@ class TimetableExportService:
             reservations = [dict(row) for row in cursor.fetchall()]
             
             # Convert reservations to seance format for display
-            for res in reservations:
-                seances.append({
-                    'id': res['id'],
-                    'titre': f"Réservation - {res.get('motif', '')}",
-                    'type_seance': 'Réservation',
-                    'date': res['date'],
-                    'heure_debut': res['heure_debut'],
-                    'heure_fin': res['heure_fin'],
-                    'salle_id': res['salle_id'],
-                    'enseignant_id': res['enseignant_id'],
-                    'groupe_id': None
-                })
+            seances.extend(self._reservations_as_seances(reservations))
             
             conn.close()
             
@@ -130,32 +128,238 @@ class TimetableExportService:
             export_data = self._prepare_timetable_data(seances, None, enseignant_nom)
             
             # Export based on format
-            if format_type.lower() == "pdf":
-                return self._export_pdf(export_data, f"emploi_du_temps_{enseignant_nom.replace(' ', '_')}")
-            elif format_type.lower() in ["excel", "xlsx"]:
-                return self._export_excel(export_data, f"emploi_du_temps_{enseignant_nom.replace(' ', '_')}")
-            elif format_type.lower() in ["png", "jpg", "jpeg"]:
-                return self._export_image(export_data, f"emploi_du_temps_{enseignant_nom.replace(' ', '_')}", format_type)
-            else:
-                return False, None, f"Format non supporté: {format_type}"
+            return self._render_cached(export_data, f"emploi_du_temps_{enseignant_nom.replace(' ', '_')}", format_type)
                 
         except Exception as e:
             return False, None, f"Erreur lors de l'export: {e}"
     
+    # ═══════════════════════════════════════════════════════════
+    # BATCH EXPORT
+    # ═══════════════════════════════════════════════════════════
+    
+    # Output directory of each format in the batch export
+    BATCH_DIRS = {
+        'pdf': EXPORT_CONFIG['pdf_dir'],
+        'excel': EXPORT_CONFIG['excel_dir'],
+        'xlsx': EXPORT_CONFIG['excel_dir'],
+        'png': EXPORT_CONFIG['images_dir'],
+        'jpg': EXPORT_CONFIG['images_dir'],
+        'jpeg': EXPORT_CONFIG['images_dir']
+    }
+    
+    def export_all_timetables(self, formats: List[str] = ("pdf",),
+                              semaine_debut: str = None, semaine_fin: str = None,
+                              groupe_ids: Optional[List[int]] = None,
+                              enseignant_ids: Optional[List[int]] = None,
+                              progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                              max_workers: Optional[int] = None) -> Dict:
+        """
+        Exports every group and teacher timetable (semester publication)
+        Data is loaded once (prepare_many_timetables), files are rendered by
+        a process pool into EXPORT_CONFIG['pdf_dir'] / 'excel_dir' / 'images_dir'.
+        Args:
+            formats: Export formats ("pdf", "excel", "png", "jpg")
+            semaine_debut: Start week date (optional)
+            semaine_fin: End week date (optional)
+            groupe_ids: Groups to export (None = every group)
+            enseignant_ids: Teachers to export (None = every teacher)
+            progress_callback: Called after each file with (done, total, message)
+            max_workers: Worker processes (default: number of cores)
+        Returns:
+            Dict with 'total', 'exported' (file paths), 'cached' (files reused
+            without rendering, see ExportCache) and 'errors' (file name, message)
+        """
+        unknown = [f for f in formats if f.lower() not in self.BATCH_DIRS]
+        if unknown:
+            return {'total': 0, 'exported': [], 'cached': 0,
+                    'errors': [(f, f"Format non supporté: {f}") for f in unknown]}
+        
+        prepared = self.prepare_many_timetables(groupe_ids, enseignant_ids, semaine_debut, semaine_fin)
+        filenames = {}
+        for (kind, entity_id), data in prepared.items():
+            if kind == 'groupe':
+                filename = f"emploi_du_temps_groupe_{data['groupe_nom']}"
+            else:
+                filename = f"emploi_du_temps_{data['enseignant_nom'].replace(' ', '_')}"
+            filenames[(kind, entity_id)] = self._safe_filename(filename)
+        # Same name in several filieres (Gr_01...): the id keeps files apart
+        counts = {}
+        for filename in filenames.values():
+            counts[filename] = counts.get(filename, 0) + 1
+        
+        tasks = []
+        for (kind, entity_id), data in prepared.items():
+            filename = filenames[(kind, entity_id)]
+            if counts[filename] > 1:
+                filename = f"{filename}_{entity_id}"
+            for format_type in formats:
+                output_dir = str(self.BATCH_DIRS[format_type.lower()])
+                os.makedirs(output_dir, exist_ok=True)
+                tasks.append((data, filename, format_type, output_dir))
+        
+        report = {'total': len(tasks), 'exported': [], 'cached': 0, 'errors': []}
+        finished = set()
+        digests = {}
+        
+        def record(index, outcome):
+            task = tasks[index]
+            finished.add(index)
+            success, filepath, error = outcome
+            if success:
+                report['exported'].append(filepath)
+                if index in digests:
+                    self.cache.store(filepath, digests[index])
+            else:
+                report['errors'].append((f"{task[1]}.{task[2]}", error))
+            if progress_callback:
+                progress_callback(len(finished), len(tasks), filepath if success else error)
+        
+        # Files already up to date are not rendered again
+        pending = []
+        for index, (data, filename, format_type, output_dir) in enumerate(tasks):
+            if self.cache is not None:
+                digest = ExportCache.content_hash(data, format_type)
+                filepath = os.path.join(output_dir, f"{filename}.{self._extension(format_type)}")
+                if self.cache.lookup(filepath, digest):
+                    report['cached'] += 1
+                    record(index, (True, filepath, None))
+                    continue
+                digests[index] = digest
+            pending.append(index)
+        
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(pending) < 2:
+            for index in pending:
+                record(index, _render_timetable(tasks[index]))
+            return report
+        
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                futures = {pool.submit(_render_timetable, tasks[index]): index
+                           for index in pending}
+                for future in as_completed(futures):
+                    try:
+                        outcome = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        outcome = (False, None, f"Erreur lors de l'export: {e}")
+                    record(futures[future], outcome)
+        except (OSError, BrokenProcessPool) as e:
+            # No usable process pool here: render what is left in this process
+            print(f"Export parallèle indisponible ({e}), export séquentiel")
+            for index in pending:
+                if index not in finished:
+                    record(index, _render_timetable(tasks[index]))
+        
+        return report
+    
+    @staticmethod
+    def _safe_filename(name: str) -> str:
+        """File name without path separators or characters refused by Windows"""
+        return re.sub(r'[\\/:*?"<>|\s]+', '_', name).strip('_') or "emploi_du_temps"
+    
+    def prepare_many_timetables(self, groupe_ids: Optional[List[int]] = None,
+                                enseignant_ids: Optional[List[int]] = None,
+                                semaine_debut: str = None,
+                                semaine_fin: str = None) -> Dict[Tuple[str, int], Dict]:
+        """
+        Prepares the timetables of many groups and teachers in one pass:
+        one query for the sessions, one for the approved reservations,
+        names resolved from the reference data
+        Args:
+            groupe_ids: Groups to prepare (None = every group)
+            enseignant_ids: Teachers to prepare (None = every teacher)
+            semaine_debut: Start week date (optional)
+            semaine_fin: End week date (optional)
+        Returns:
+            {('groupe', id) or ('enseignant', id): export data}
+        """
+        noms = self._name_maps()
+        if groupe_ids is None:
+            groupe_ids = list(noms['groupes'])
+        if enseignant_ids is None:
+            enseignant_ids = [u['id'] for u in self.db.get_tous_utilisateurs('enseignant')]
+        
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        period_filter, params = "", ()
+        if semaine_debut and semaine_fin:
+            period_filter, params = " AND date BETWEEN ? AND ?", (semaine_debut, semaine_fin)
+        cursor.execute(f"SELECT * FROM seances WHERE 1 = 1{period_filter} ORDER BY date, heure_debut",
+                       params)
+        seances = [dict(row) for row in cursor.fetchall()]
+        cursor.execute(f"SELECT * FROM reservations WHERE statut = 'validee'{period_filter}", params)
+        reservations = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        by_group = {groupe_id: [] for groupe_id in groupe_ids}
+        by_teacher = {enseignant_id: [] for enseignant_id in enseignant_ids}
+        for seance in seances:
+            if seance['groupe_id'] in by_group:
+                by_group[seance['groupe_id']].append(seance)
+            if seance['enseignant_id'] in by_teacher:
+                by_teacher[seance['enseignant_id']].append(seance)
+        for seance in self._reservations_as_seances(reservations):
+            if seance['enseignant_id'] in by_teacher:
+                by_teacher[seance['enseignant_id']].append(seance)
+        
+        prepared = {}
+        for groupe_id, group_seances in by_group.items():
+            groupe_nom = noms['groupes'].get(groupe_id)
+            if groupe_nom is not None:
+                prepared[('groupe', groupe_id)] = self._prepare_timetable_data(
+                    group_seances, groupe_nom, None, noms
+                )
+        for enseignant_id, teacher_seances in by_teacher.items():
+            enseignant_nom = noms['enseignants'].get(enseignant_id)
+            if enseignant_nom is not None:
+                prepared[('enseignant', enseignant_id)] = self._prepare_timetable_data(
+                    teacher_seances, None, enseignant_nom, noms
+                )
+        return prepared
+    
+    @staticmethod
+    def _reservations_as_seances(reservations: List[Dict]) -> List[Dict]:
+        """Approved reservations in seance format for display"""
+        return [
+            {
+                'id': res['id'],
+                'titre': f"Réservation - {res.get('motif', '')}",
+                'type_seance': 'Réservation',
+                'date': res['date'],
+                'heure_debut': res['heure_debut'],
+                'heure_fin': res['heure_fin'],
+                'salle_id': res['salle_id'],
+                'enseignant_id': res['enseignant_id'],
+                'groupe_id': None
+            }
+            for res in reservations
+        ]
+    
+    def _name_maps(self) -> Dict[str, Dict[int, str]]:
+        """id -> display name of rooms, users and groups (reference data cache)"""
+        return {
+            'salles': {s['id']: s['nom'] for s in self.db.get_toutes_salles()},
+            'enseignants': {u['id']: f"{u['prenom']} {u['nom']}" for u in self.db.get_tous_utilisateurs()},
+            'groupes': {g['id']: g['nom'] for g in self.db.get_tous_groupes()}
+        }
+    
     def _prepare_timetable_data(self, seances: List, groupe_nom: Optional[str],
-                               enseignant_nom: Optional[str]) -> Dict:
+                               enseignant_nom: Optional[str],
+                               noms: Optional[Dict[str, Dict[int, str]]] = None) -> Dict:
         """
         Prepares timetable data for export
         Args:
             seances: List of sessions
             groupe_nom: Group name (for student export)
             enseignant_nom: Teacher name (for teacher export)
+            noms: Name maps from _name_maps() (built if not given)
         Returns:
             Dictionary with formatted data
         """
-        # Get room names
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        if noms is None:
+            noms = self._name_maps()
         
         # Organize by day and time
         weekly_schedule = {}
@@ -172,44 +376,16 @@ class TimetableExportService:
             except (ValueError, IndexError):
                 continue
             
-            # Get room name
-            salle_id = seance.get('salle_id')
-            salle_nom = "N/A"
-            if salle_id:
-                cursor.execute("SELECT nom FROM salles WHERE id = ?", (salle_id,))
-                salle = cursor.fetchone()
-                if salle:
-                    salle_nom = salle['nom']
-            
-            # Get teacher name (for group timetable)
-            enseignant_id = seance.get('enseignant_id')
-            enseignant_nom_seance = "N/A"
-            if enseignant_id:
-                cursor.execute("SELECT nom, prenom FROM utilisateurs WHERE id = ?", (enseignant_id,))
-                enseignant = cursor.fetchone()
-                if enseignant:
-                    enseignant_nom_seance = f"{enseignant['prenom']} {enseignant['nom']}"
-            
-            # Get group name (for teacher timetable)
-            groupe_id = seance.get('groupe_id')
-            groupe_nom_seance = "N/A"
-            if groupe_id:
-                cursor.execute("SELECT nom FROM groupes WHERE id = ?", (groupe_id,))
-                groupe = cursor.fetchone()
-                if groupe:
-                    groupe_nom_seance = groupe['nom']
-            
+            # Room, teacher (for group timetable) and group (for teacher timetable)
             weekly_schedule[day_name].append({
                 'time': f"{seance.get('heure_debut', '')} - {seance.get('heure_fin', '')}",
                 'course': seance.get('titre', ''),
                 'type': seance.get('type_seance', ''),
-                'room': salle_nom,
-                'teacher': enseignant_nom_seance,
-                'group': groupe_nom_seance
+                'room': noms['salles'].get(seance.get('salle_id'), "N/A"),
+                'teacher': noms['enseignants'].get(seance.get('enseignant_id'), "N/A"),
+                'group': noms['groupes'].get(seance.get('groupe_id'), "N/A")
             })
         
-        conn.close()
-        
         # Sort by time for each day
         for day in days:
             weekly_schedule[day].sort(key=lambda x: x['time'])
@@ -243,93 +419,303 @@ class TimetableExportService:
         
         return "Période non spécifiée"
     
-    def _export_pdf(self, data: Dict, filename: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    @staticmethod
+    def render(data: Dict, filename: str, format_type: str,
+               output_dir: str = EXPORT_FOLDER) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Writes prepared timetable data in the given format"""
+        if format_type.lower() == "pdf":
+            return TimetableExportService._export_pdf(data, filename, output_dir)
+        elif format_type.lower() in ["excel", "xlsx"]:
+            return TimetableExportService._export_excel(data, filename, output_dir)
+        elif format_type.lower() in ["png", "jpg", "jpeg"]:
+            return TimetableExportService._export_image(data, filename, format_type, output_dir)
+        else:
+            return False, None, f"Format non supporté: {format_type}"
+    
+    @staticmethod
+    def _extension(format_type: str) -> str:
+        return "xlsx" if format_type.lower() in ["excel", "xlsx"] else format_type.lower()
+    
+    def _render_cached(self, data: Dict, filename: str, format_type: str,
+                       output_dir: str = EXPORT_FOLDER) -> Tuple[bool, Optional[str], Optional[str]]:
+        """render(), unless the file already exists for the same content (ExportCache)"""
+        if self.cache is None:
+            return self.render(data, filename, format_type, output_dir)
+        
+        digest = ExportCache.content_hash(data, format_type)
+        filepath = os.path.join(output_dir, f"{filename}.{self._extension(format_type)}")
+        if self.cache.lookup(filepath, digest):
+            return True, filepath, None
+        
+        success, filepath, error = self.render(data, filename, format_type, output_dir)
+        if success:
+            self.cache.store(filepath, digest)
+        return success, filepath, error
+    
+    # Columns of the PDF table: (header, share of the width)
+    PDF_COLUMNS = [
+        ("Jour", 0.10), ("Horaire", 0.13), ("Cours", 0.30),
+        ("Type", 0.10), ("Salle", 0.14), ("Enseignant / Groupe", 0.23)
+    ]
+    PDF_MARGIN = 36
+    PDF_HEADER_FILL = (0.85, 0.89, 0.95)
+    
+    @staticmethod
+    def _new_pdf(filepath: str) -> StreamingPdfWriter:
+        return StreamingPdfWriter(
+            filepath,
+            EXPORT_CONFIG.get('pdf_format', 'A4'),
+            EXPORT_CONFIG.get('pdf_orientation', 'portrait'),
+            EXPORT_CONFIG.get('pdf_police', 'Helvetica')
+        )
+    
+    @staticmethod
+    def _draw_pdf_timetable(pdf: StreamingPdfWriter, data: Dict):
+        """Draws one timetable as a table, on as many pages as needed"""
+        size = EXPORT_CONFIG.get('pdf_taille_police', 10)
+        margin = TimetableExportService.PDF_MARGIN
+        table_width = pdf.width - 2 * margin
+        row_height = size * 1.8
+        padding = size * 0.4
+        columns = []
+        x = margin
+        for header, share in TimetableExportService.PDF_COLUMNS:
+            columns.append((header, x, table_width * share))
+            x += table_width * share
+        
+        def draw_row(y, values, bold=False, fill=None):
+            for (_, col_x, col_width), value in zip(columns, values):
+                pdf.rect(col_x, y, col_width, row_height, fill=fill)
+                pdf.text(col_x + padding, y + (row_height - size) / 2,
+                         pdf.fit_text(value, col_width - 2 * padding, size, bold), size, bold)
+        
+        def start_page(continued):
+            pdf.begin_page()
+            title = data['title'] + (" (suite)" if continued else "")
+            pdf.text(margin, margin, title, size + 6, bold=True)
+            pdf.text(margin, margin + size * 2.2, data['subtitle'], size)
+            pdf.text(margin, margin + size * 3.6, f"Période: {data['period']}", size)
+            y = margin + size * 5.5
+            draw_row(y, [header for header, _ in TimetableExportService.PDF_COLUMNS],
+                     bold=True, fill=TimetableExportService.PDF_HEADER_FILL)
+            return y + row_height
+        
+        # Group timetable: show the teacher; teacher timetable: show the group
+        other_key = 'teacher' if data.get('groupe_nom') else 'group'
+        y = start_page(False)
+        for day, sessions in data['schedule'].items():
+            for index, session in enumerate(sessions):
+                if y + row_height > pdf.height - margin:
+                    y = start_page(True)
+                    index = 0
+                draw_row(y, [
+                    day if index == 0 else "",
+                    session['time'], session['course'], session['type'],
+                    session['room'], session[other_key]
+                ])
+                y += row_height
+        pdf.end_page()
+    
+    @staticmethod
+    def _export_pdf(data: Dict, filename: str,
+                    output_dir: str = EXPORT_FOLDER) -> Tuple[bool, Optional[str], Optional[str]]:
         """
-        Exports timetable to PDF
-        Note: This is a placeholder - actual PDF generation would require a library like reportlab
+        Exports timetable to PDF (EXPORT_CONFIG pdf_format, pdf_orientation,
+        pdf_police, pdf_taille_police)
         """
         try:
-            # Placeholder for PDF export
-            # In real implementation, would use reportlab or similar
-            filepath = os.path.join(EXPORT_FOLDER, f"{filename}.pdf")
-            
-            # For now, create a text file as placeholder
-            with open(filepath.replace('.pdf', '_placeholder.txt'), 'w', encoding='utf-8') as f:
-                f.write(f"{data['title']}\n")
-                f.write(f"{data['subtitle']}\n")
-                f.write(f"Période: {data['period']}\n\n")
-                for day, sessions in data['schedule'].items():
-                    if sessions:
-                        f.write(f"\n{day}:\n")
-                        for session in sessions:
-                            f.write(f"  {session['time']} - {session['course']} ({session['type']})\n")
-                            f.write(f"    Salle: {session['room']}\n")
-            
+            filepath = os.path.join(output_dir, f"{filename}.pdf")
+            with TimetableExportService._new_pdf(filepath) as pdf:
+                TimetableExportService._draw_pdf_timetable(pdf, data)
             return True, filepath, None
         except Exception as e:
             return False, None, f"Erreur export PDF: {e}"
     
-    def _export_excel(self, data: Dict, filename: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    def export_pdf_booklet(self, groupe_ids: Optional[List[int]] = None,
+                           semaine_debut: str = None, semaine_fin: str = None,
+                           filename: str = None) -> Tuple[bool, Optional[str], Optional[str]]:
         """
-        Exports timetable to Excel
-        Note: This is a placeholder - actual Excel generation would require openpyxl or xlsxwriter
+        Exports the timetables of many groups as one PDF, one page per group
+        (more if a timetable does not fit). Pages are written to disk one by one.
+        Args:
+            groupe_ids: Groups to include (None = every group)
+            semaine_debut: Start week date (optional)
+            semaine_fin: End week date (optional)
+            filename: File name without extension (default: dated name)
+        Returns:
+            (success, file_path, error_message)
         """
         try:
-            # Placeholder for Excel export
-            # In real implementation, would use openpyxl or xlsxwriter
-            filepath = os.path.join(EXPORT_FOLDER, f"{filename}.xlsx")
+            prepared = self.prepare_many_timetables(groupe_ids, [], semaine_debut, semaine_fin)
+            if not prepared:
+                return False, None, "Aucun groupe à exporter"
             
-            # For now, create a CSV file as placeholder
-            csv_path = filepath.replace('.xlsx', '_placeholder.csv')
-            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-                import csv
-                writer = csv.writer(f)
-                writer.writerow([data['title']])
-                writer.writerow([data['subtitle']])
-                writer.writerow([f"Période: {data['period']}"])
-                writer.writerow([])
-                writer.writerow(['Jour', 'Horaire', 'Cours', 'Type', 'Salle', 'Enseignant/Groupe'])
-                
+            filename = filename or f"emploi_du_temps_groupes_{datetime.now():%Y%m%d_%H%M%S}"
+            output_dir = str(EXPORT_CONFIG['pdf_dir'])
+            os.makedirs(output_dir, exist_ok=True)
+            filepath = os.path.join(output_dir, f"{filename}.pdf")
+            
+            with self._new_pdf(filepath) as pdf:
+                for data in sorted(prepared.values(), key=lambda d: d['groupe_nom']):
+                    self._draw_pdf_timetable(pdf, data)
+            return True, filepath, None
+        except Exception as e:
+            return False, None, f"Erreur export PDF: {e}"
+    
+    # Columns of the Excel sheets: (header, width in characters)
+    EXCEL_COLUMNS = [
+        ("Jour", 11), ("Horaire", 14), ("Cours", 36),
+        ("Type", 12), ("Salle", 16), ("Enseignant / Groupe", 28)
+    ]
+    REPORT_COLUMNS = [
+        ("Date", 12), ("Jour", 11), ("Horaire", 14), ("Cours", 36),
+        ("Type", 12), ("Salle", 16), ("Groupe", 16), ("Enseignant", 26)
+    ]
+    
+    @staticmethod
+    def _export_excel(data: Dict, filename: str,
+                      output_dir: str = EXPORT_FOLDER) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Exports timetable to Excel (.xlsx, one sheet)"""
+        try:
+            filepath = os.path.join(output_dir, f"{filename}.xlsx")
+            # Group timetable: show the teacher; teacher timetable: show the group
+            other_key = 'teacher' if data.get('groupe_nom') else 'group'
+            columns = TimetableExportService.EXCEL_COLUMNS
+            
+            with StreamingXlsxWriter(filepath) as xlsx:
+                xlsx.add_sheet(data.get('groupe_nom') or data.get('enseignant_nom') or "Emploi du temps",
+                               [width for _, width in columns])
+                xlsx.write_row([data['title']], header=True)
+                xlsx.write_row([data['subtitle']])
+                xlsx.write_row([f"Période: {data['period']}"])
+                xlsx.write_row([])
+                xlsx.write_row([header for header, _ in columns], header=True)
                 for day, sessions in data['schedule'].items():
-                    if sessions:
-                        for session in sessions:
-                            teacher_or_group = session.get('teacher') or session.get('group', '')
-                            writer.writerow([
-                                day,
-                                session['time'],
-                                session['course'],
-                                session['type'],
-                                session['room'],
-                                teacher_or_group
-                            ])
+                    for session in sessions:
+                        xlsx.write_row([
+                            day, session['time'], session['course'], session['type'],
+                            session['room'], session[other_key]
+                        ])
             
             return True, filepath, None
         except Exception as e:
             return False, None, f"Erreur export Excel: {e}"
     
-    def _export_image(self, data: Dict, filename: str, format_type: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    # Full report: one query per sheet grouping, rows ordered sheet by sheet
+    _REPORT_SELECT = """
+        SELECT s.date, s.heure_debut, s.heure_fin, s.titre, s.type_seance,
+               sa.nom AS salle, g.nom AS groupe, u.prenom || ' ' || u.nom AS enseignant, {sheet}
+        FROM seances s
+        LEFT JOIN salles sa ON s.salle_id = sa.id
+        LEFT JOIN groupes g ON s.groupe_id = g.id
+        LEFT JOIN filieres f ON g.filiere_id = f.id
+        LEFT JOIN utilisateurs u ON s.enseignant_id = u.id
+        WHERE 1 = 1{period}
+    """
+    _REPORT_SHEETS = {
+        'filiere': "f.id AS cle, f.niveau || ' ' || f.nom AS feuille",
+        'groupe': "g.id AS cle, g.nom || ' - ' || f.niveau || ' ' || f.nom AS feuille",
+        'enseignant': "u.id AS cle, u.prenom || ' ' || u.nom AS feuille"
+    }
+    
+    def export_excel_report(self, feuille_par: str = None,
+                            semaine_debut: str = None, semaine_fin: str = None,
+                            filename: str = None) -> Tuple[bool, Optional[str], Optional[str]]:
         """
-        Exports timetable to Image (PNG/JPG)
-        Note: This is a placeholder - actual image generation would require PIL/Pillow
+        Exports every session of the faculty as one workbook, one sheet per
+        filiere, group or teacher. Rows go from the database cursor to the
+        file one by one: memory use does not depend on the number of sessions.
+        Args:
+            feuille_par: 'filiere', 'groupe' or 'enseignant'
+                         (default: EXPORT_CONFIG['excel_feuille_par'])
+            semaine_debut: Start week date (optional)
+            semaine_fin: End week date (optional)
+            filename: File name without extension
+                      (default: rapport_complet_FSTT_<date>)
+        Returns:
+            (success, file_path, error_message)
         """
+        feuille_par = feuille_par or EXPORT_CONFIG.get('excel_feuille_par', 'filiere')
+        if feuille_par not in self._REPORT_SHEETS:
+            return False, None, f"Regroupement non supporté: {feuille_par}"
+        
         try:
-            # Placeholder for Image export
-            # In real implementation, would use PIL/Pillow to create image
-            filepath = os.path.join(EXPORT_FOLDER, f"{filename}.{format_type.lower()}")
+            period_filter, params = "", ()
+            if semaine_debut and semaine_fin:
+                period_filter, params = " AND s.date BETWEEN ? AND ?", (semaine_debut, semaine_fin)
+            query = self._REPORT_SELECT.format(sheet=self._REPORT_SHEETS[feuille_par], period=period_filter)
+            if feuille_par == 'enseignant':
+                # A teacher's sheet also lists their approved reservations
+                query += """
+                    UNION ALL
+                    SELECT r.date, r.heure_debut, r.heure_fin, 'Réservation - ' || COALESCE(r.motif, ''),
+                           'Réservation', sa.nom, NULL, u.prenom || ' ' || u.nom,
+                           u.id, u.prenom || ' ' || u.nom
+                    FROM reservations r
+                    LEFT JOIN salles sa ON r.salle_id = sa.id
+                    JOIN utilisateurs u ON r.enseignant_id = u.id
+                    WHERE r.statut = 'validee'{period}
+                """.format(period=period_filter.replace('s.date', 'r.date'))
+                params = params * 2
+            query += " ORDER BY feuille, cle, date, heure_debut"
             
-            # For now, create a text file as placeholder
-            with open(filepath.replace(f'.{format_type}', '_placeholder.txt'), 'w', encoding='utf-8') as f:
-                f.write(f"{data['title']}\n")
-                f.write(f"{data['subtitle']}\n")
-                f.write(f"Période: {data['period']}\n\n")
-                for day, sessions in data['schedule'].items():
-                    if sessions:
-                        f.write(f"\n{day}:\n")
-                        for session in sessions:
-                            f.write(f"  {session['time']} - {session['course']} ({session['type']})\n")
-                            f.write(f"    Salle: {session['room']}\n")
+            filename = filename or f"rapport_complet_FSTT_{datetime.now():%Y%m%d_%H%M%S}"
+            output_dir = str(EXPORT_CONFIG['excel_dir'])
+            os.makedirs(output_dir, exist_ok=True)
+            filepath = os.path.join(output_dir, f"{filename}.xlsx")
+            period = (f"Période: {semaine_debut} - {semaine_fin}"
+                      if semaine_debut and semaine_fin else "Période: toutes les séances")
+            columns = self.REPORT_COLUMNS
             
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            with StreamingXlsxWriter(filepath) as xlsx:
+                current = object()
+                for row in cursor:
+                    if row['cle'] != current:
+                        current = row['cle']
+                        sheet = row['feuille'] or "Non affecté"
+                        xlsx.add_sheet(sheet, [width for _, width in columns])
+                        xlsx.write_row([f"Emploi du Temps - {sheet}"], header=True)
+                        xlsx.write_row([f"{ETABLISSEMENT} - {ANNEE_UNIVERSITAIRE}"])
+                        xlsx.write_row([period])
+                        xlsx.write_row([])
+                        xlsx.write_row([header for header, _ in columns], header=True)
+                    xlsx.write_row([
+                        row['date'], self._day_name(row['date']),
+                        f"{row['heure_debut']} - {row['heure_fin']}",
+                        row['titre'], row['type_seance'], row['salle'] or "N/A",
+                        row['groupe'] or "", row['enseignant'] or "N/A"
+                    ])
+            conn.close()
+            return True, filepath, None
+        except Exception as e:
+            return False, None, f"Erreur export Excel: {e}"
+    
+    @staticmethod
+    def _day_name(date_str: str) -> str:
+        days = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
+        try:
+            return days[datetime.strptime(date_str, "%Y-%m-%d").weekday()]
+        except (TypeError, ValueError):
+            return ""
+    
+    @staticmethod
+    def _export_image(data: Dict, filename: str, format_type: str,
+                      output_dir: str = EXPORT_FOLDER) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Exports timetable to Image (PNG/JPG), EXPORT_CONFIG image_largeur,
+        image_hauteur and image_dpi. The grid background is rendered once per
+        process and reused by every timetable.
+        """
+        try:
+            # PyQt6 is only loaded when an image is actually exported
+            from src.logic.image_renderer import TimetableImageRenderer
+            
+            filepath = os.path.join(output_dir, f"{filename}.{format_type.lower()}")
+            if not TimetableImageRenderer().save(data, filepath, format_type):
+                return False, None, f"Erreur export Image: écriture impossible de {filepath}"
             return True, filepath, None
         except Exception as e:
             return False, None, f"Erreur export Image: {e}"
-
@@ -1,7 +1,9 @@
 # src/logic/unavailability_service.py
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from src.logic.time_utils import TimeUtils
 from src.logic.conflict_detector import ConflictDetector
+from src.logic.schedule_generator import ScheduleGenerator
 
 class UnavailabilityService:
     """
@@ -13,10 +15,13 @@ class UnavailabilityService:
         self.db = db
 
     def add_unavailability(self, enseignant_id: int, date: str, 
-                          heure_debut: str, heure_fin: str, motif: str = "") -> Tuple[bool, str]:
+                          heure_debut: str, heure_fin: str, motif: str = "",
+                          replanifier: bool = False) -> Tuple[bool, str]:
         """
         Déclarer une indisponibilité pour un enseignant.
         Vérifie d'abord s'il n'a pas DÉJÀ cours pendant cette période avant de valider.
+        Avec replanifier=True, les cours concernés sont déplacés (réparation
+        incrémentale de la semaine) au lieu de refuser l'indisponibilité.
         """
         # 1. Validation de la plage horaire (Début < Fin)
         if not TimeUtils.is_valid_time_range(heure_debut, heure_fin):
@@ -37,19 +42,83 @@ class UnavailabilityService:
         detector = ConflictDetector(existing_seances)
         conflict = detector.detect_teacher_conflict(date, heure_debut, heure_fin, enseignant_id)
         
-        if conflict:
+        if conflict and not replanifier:
             return False, f"Impossible : L'enseignant a déjà un cours prévu sur ce créneau : {conflict}"
 
+        generator, reparation = None, None
+        if conflict:
+            generator, reparation = self._replanifier_cours(enseignant_id, date, heure_debut, heure_fin)
+            if not reparation['success']:
+                return False, (f"Impossible : {len(reparation['unscheduled'])} cours ne peuvent pas "
+                               f"être déplacés dans la semaine.")
+
         # 3. Insertion de l'indisponibilité dans la base de données
+        # (avec les déplacements éventuels, dans une seule transaction)
         try:
-            self.db.ajouter_disponibilite(enseignant_id, date, heure_debut, heure_fin, motif)
+            with self.db.transaction():
+                if reparation:
+                    generator.save_repaired_schedule(reparation)
+                self.db.ajouter_disponibilite(enseignant_id, date, heure_debut, heure_fin, motif)
             return True, "Indisponibilité ajoutée avec succès."
         except Exception as e:
             return False, f"Erreur Base de Données : {str(e)}"
 
+    def _replanifier_cours(self, enseignant_id: int, date: str,
+                           heure_debut: str, heure_fin: str) -> Tuple[ScheduleGenerator, Dict]:
+        """Calcule le déplacement des cours de l'enseignant pendant l'indisponibilité"""
+        jour = datetime.strptime(date, "%Y-%m-%d")
+        lundi = jour - timedelta(days=jour.weekday())
+        dimanche = lundi + timedelta(days=6)
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM seances WHERE date BETWEEN ? AND ?",
+                       (lundi.strftime("%Y-%m-%d"), dimanche.strftime("%Y-%m-%d")))
+        seances_semaine = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        reservations = [dict(row) for row in self.db.get_reservations_by_statut('validee')]
+
+        generator = ScheduleGenerator(self.db, seances_semaine, reservations)
+        reparation = generator.repair_schedule(seances_semaine, {
+            'type': 'indisponibilite',
+            'enseignant_id': enseignant_id,
+            'date': date,
+            'heure_debut': heure_debut,
+            'heure_fin': heure_fin,
+            # Les cours déplacés ne doivent pas tomber sur une autre absence déclarée
+            'indisponibilites': self._creneaux_indisponibles(
+                enseignant_id, lundi.strftime("%Y-%m-%d"), dimanche.strftime("%Y-%m-%d"))
+        })
+        return generator, reparation
+
+    def _creneaux_indisponibles(self, enseignant_id: int, lundi: str, dimanche: str) -> List[Dict]:
+        """
+        Indisponibilités déjà déclarées sur la semaine, découpées jour par jour
+        (date_debut/date_fin sans heure = journées entières)
+        """
+        creneaux = []
+        for dispo in self.db.get_indisponibilites_periode(enseignant_id, lundi, dimanche):
+            date_debut, _, heure_debut = dispo['date_debut'].partition(' ')
+            date_fin, _, heure_fin = dispo['date_fin'].partition(' ')
+            try:
+                jour = max(datetime.strptime(date_debut, "%Y-%m-%d"), datetime.strptime(lundi, "%Y-%m-%d"))
+                dernier = min(datetime.strptime(date_fin, "%Y-%m-%d"), datetime.strptime(dimanche, "%Y-%m-%d"))
+            except ValueError:
+                continue
+            while jour <= dernier:
+                date = jour.strftime("%Y-%m-%d")
+                creneaux.append({
+                    'enseignant_id': enseignant_id,
+                    'date': date,
+                    'heure_debut': heure_debut if date == date_debut and heure_debut else "00:00",
+                    'heure_fin': heure_fin if date == date_fin and heure_fin else "23:59"
+                })
+                jour += timedelta(days=1)
+        return creneaux
+
     def get_teacher_unavailabilities(self, enseignant_id: int) -> List[Dict]:
         """Récupérer toutes les indisponibilités d'un enseignant spécifique."""
-        return self.db.get_dispo_prof(enseignant_id)
+        return [dict(dispo) for dispo in self.db.get_dispo_prof(enseignant_id)]
 
     def delete_unavailability(self, dispo_id: int) -> bool:
         """Supprimer une indisponibilité par son ID."""
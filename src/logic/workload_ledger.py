@@ -0,0 +1,107 @@
+# src/logic/workload_ledger.py
+"""
+Teacher workload ledger
+Minutes taught per teacher, per day and per ISO week, kept up to date as
+sessions are added and removed so that every total is a dictionary lookup
+"""
+
+import threading
+from datetime import date as Date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+import config
+from src.logic.time_utils import CompactSlot
+
+
+@lru_cache(maxsize=4096)
+def _iso_week(date: str) -> Optional[Tuple[int, int]]:
+    """(ISO year, ISO week number) of a "YYYY-MM-DD" date"""
+    try:
+        iso_year, iso_week, _ = Date.fromisoformat(date).isocalendar()
+    except (TypeError, ValueError):
+        return None
+    return iso_year, iso_week
+
+
+class WorkloadLedger:
+    """
+    Minutes of every teacher by day and by ISO week.
+
+    Fed with sessions and approved reservations (any dict with enseignant_id,
+    date, heure_debut and heure_fin). Entries without a teacher or with
+    invalid times are ignored, and so are teacher unavailability blocks
+    (flagged 'indisponibilite'), which occupy the teacher without teaching.
+    """
+
+    def __init__(self, seances: Optional[Iterable[Dict]] = None):
+        self._lock = threading.Lock()
+        # {(enseignant_id, date): minutes}
+        self._days: Dict[Tuple[int, str], int] = {}
+        # {(enseignant_id, (iso_year, iso_week)): minutes}
+        self._weeks: Dict[Tuple[int, Tuple[int, int]], int] = {}
+        for seance in seances or []:
+            self.add(seance)
+
+    @staticmethod
+    def duration(seance: Dict) -> int:
+        slot = CompactSlot.from_seance(seance)
+        return max(0, slot.end - slot.start) if slot is not None else 0
+
+    def _apply(self, seance: Dict, sign: int):
+        enseignant_id = seance.get('enseignant_id')
+        date = seance.get('date')
+        week = _iso_week(date)
+        minutes = self.duration(seance)
+        if enseignant_id is None or week is None or not minutes or seance.get('indisponibilite'):
+            return
+        with self._lock:
+            for totals, key in ((self._days, (enseignant_id, date)),
+                                (self._weeks, (enseignant_id, week))):
+                total = totals.get(key, 0) + sign * minutes
+                if total > 0:
+                    totals[key] = total
+                else:
+                    totals.pop(key, None)
+
+    def add(self, seance: Dict):
+        self._apply(seance, 1)
+
+    def remove(self, seance: Dict):
+        self._apply(seance, -1)
+
+    # ═══════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════
+
+    def day_minutes(self, enseignant_id: int, date: str) -> int:
+        return self._days.get((enseignant_id, date), 0)
+
+    def week_minutes(self, enseignant_id: int, date: str) -> int:
+        """Minutes of the ISO week (Monday to Sunday) containing date"""
+        return self._weeks.get((enseignant_id, _iso_week(date)), 0)
+
+    def period_minutes(self, enseignant_id: int, date_debut: str, date_fin: str) -> int:
+        """Minutes from date_debut to date_fin included, whatever the weekday"""
+        try:
+            day = Date.fromisoformat(date_debut)
+            last = Date.fromisoformat(date_fin)
+        except (TypeError, ValueError):
+            return 0
+        total = 0
+        while day <= last:
+            total += self._days.get((enseignant_id, day.isoformat()), 0)
+            day += timedelta(days=1)
+        return total
+
+    def fits(self, enseignant_id: int, date: str, minutes: int,
+             max_day: Optional[int] = None, max_week: Optional[int] = None) -> bool:
+        """
+        True if `minutes` more on that date keep the teacher within the limits
+        (defaults: CONTRAINTES duree_max_jour_enseignant / duree_max_semaine_enseignant)
+        """
+        if max_day is None:
+            max_day = config.CONTRAINTES['duree_max_jour_enseignant']
+        if max_week is None:
+            max_week = config.CONTRAINTES['duree_max_semaine_enseignant']
+        return (self.day_minutes(enseignant_id, date) + minutes <= max_day
+                and self.week_minutes(enseignant_id, date) + minutes <= max_week)
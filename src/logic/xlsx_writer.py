@@ -0,0 +1,188 @@
+# src/logic/xlsx_writer.py
+"""
+Minimal streaming XLSX writer (no external dependency)
+Rows are compressed into the archive as they are written, with inline
+strings (no shared string table): memory use does not grow with the data
+"""
+
+import re
+import zipfile
+from typing import List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+
+class StreamingXlsxWriter:
+    """
+    Writes an .xlsx workbook sheet after sheet, row after row.
+
+    Usage:
+        with StreamingXlsxWriter(path) as xlsx:
+            xlsx.add_sheet("GI", column_widths=[12, 30])
+            xlsx.write_row(["Date", "Cours"], header=True)
+            xlsx.write_row(["2024-02-05", "Analyse"])
+    """
+
+    # Style indexes in styles.xml
+    STYLE_DEFAULT = 0
+    STYLE_HEADER = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        self._sheet_names: List[str] = []
+        self._stream = None
+        self._row = 0
+
+    # ═══════════════════════════════════════════════════════════
+    # SHEETS AND ROWS
+    # ═══════════════════════════════════════════════════════════
+
+    def _unique_sheet_name(self, name: str) -> str:
+        """Excel sheet names: 31 characters max, no []:*?/\\ and unique"""
+        base = re.sub(r'[\[\]:*?/\\]', '_', name or "Feuille").strip("'")[:31] or "Feuille"
+        candidate, counter = base, 2
+        while candidate.lower() in (existing.lower() for existing in self._sheet_names):
+            suffix = f" ({counter})"
+            candidate = base[:31 - len(suffix)] + suffix
+            counter += 1
+        return candidate
+
+    def add_sheet(self, name: str, column_widths: Optional[Sequence[float]] = None) -> str:
+        """Starts a new sheet (the previous one is finished). Returns the name used"""
+        self._end_sheet()
+        name = self._unique_sheet_name(name)
+        self._sheet_names.append(name)
+        self._stream = self._zip.open(f"xl/worksheets/sheet{len(self._sheet_names)}.xml", 'w')
+        self._row = 0
+
+        self._write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        )
+        if column_widths:
+            self._write('<cols>' + ''.join(
+                f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+                for i, width in enumerate(column_widths, start=1)
+            ) + '</cols>')
+        self._write('<sheetData>')
+        return name
+
+    def write_row(self, values: Sequence, header: bool = False):
+        """Appends one row to the current sheet (numbers stay numbers)"""
+        if self._stream is None:
+            self.add_sheet("Feuille1")
+        self._row += 1
+        style = f' s="{self.STYLE_HEADER}"' if header else ''
+        cells = []
+        for column, value in enumerate(values, start=1):
+            ref = f"{self._column_letter(column)}{self._row}"
+            if value is None or value == "":
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c r="{ref}"{style}><v>{value}</v></c>')
+            else:
+                text = escape(self._clean(str(value)))
+                cells.append(f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        self._write(f'<row r="{self._row}">{"".join(cells)}</row>')
+
+    @staticmethod
+    def _column_letter(column: int) -> str:
+        letters = ""
+        while column:
+            column, remainder = divmod(column - 1, 26)
+            letters = chr(65 + remainder) + letters
+        return letters
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        """Removes the control characters XML does not allow"""
+        return re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
+
+    def _write(self, text: str):
+        self._stream.write(text.encode('utf-8'))
+
+    def _end_sheet(self):
+        if self._stream is not None:
+            self._write('</sheetData></worksheet>')
+            self._stream.close()
+            self._stream = None
+
+    # ═══════════════════════════════════════════════════════════
+    # END OF WORKBOOK
+    # ═══════════════════════════════════════════════════════════
+
+    def close(self):
+        """Finishes the last sheet and writes the workbook parts"""
+        if self._zip.fp is None:
+            return
+        if not self._sheet_names:
+            self.add_sheet("Feuille1")
+        self._end_sheet()
+
+        sheets = range(1, len(self._sheet_names) + 1)
+        self._zip.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + ''.join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for i in sheets
+            ) + '</Types>'
+        ))
+        self._zip.writestr('_rels/.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/></Relationships>'
+        ))
+        self._zip.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + ''.join(
+                f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+                for i, name in zip(sheets, self._sheet_names)
+            ) + '</sheets></workbook>'
+        ))
+        self._zip.writestr('xl/_rels/workbook.xml.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + ''.join(
+                f'<Relationship Id="rId{i}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                f'Target="worksheets/sheet{i}.xml"/>'
+                for i in sheets
+            )
+            + f'<Relationship Id="rId{len(self._sheet_names) + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/></Relationships>'
+        ))
+        self._zip.writestr('xl/styles.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+            '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="3"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill>'
+            '<fill><patternFill patternType="solid"><fgColor rgb="FFD9E2F3"/></patternFill></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+            '</cellXfs></styleSheet>'
+        ))
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,48 @@
+# src/reference_cache.py
+"""
+Cache en mémoire des données de référence (salles, groupes, filières, utilisateurs)
+Ces tables ne changent qu'à l'import CSV ou via les méthodes CRUD de Database
+"""
+
+import threading
+
+
+class CacheReference:
+    """
+    Résultats des lectures de tables de référence, avec une version par table.
+    Chaque écriture incrémente la version de sa table : une entrée lue
+    avec une version plus ancienne est ignorée et relue en base.
+    """
+
+    TABLES = ('salles', 'groupes', 'filieres', 'utilisateurs')
+
+    def __init__(self):
+        self._verrou = threading.Lock()
+        self._versions = {table: 0 for table in self.TABLES}
+        # {(table, clé): (version, lignes)}
+        self._entrees = {}
+
+    def version(self, table):
+        return self._versions[table]
+
+    def invalider(self, *tables):
+        """Invalide les tables données (toutes si aucune n'est précisée)"""
+        with self._verrou:
+            for table in tables or self.TABLES:
+                self._versions[table] += 1
+                for cle in [cle for cle in self._entrees if cle[0] == table]:
+                    del self._entrees[cle]
+
+    def lire(self, table, cle, version):
+        """Lignes en cache pour (table, clé), ou None si absentes ou périmées"""
+        entree = self._entrees.get((table, cle))
+        if entree is None or entree[0] != version:
+            return None
+        return entree[1]
+
+    def stocker(self, table, cle, version, lignes):
+        """Enregistre une lecture faite alors que la table était à `version`"""
+        with self._verrou:
+            # Une écriture a eu lieu pendant la lecture : ne rien garder
+            if self._versions[table] == version:
+                self._entrees[(table, cle)] = (version, tuple(lignes))
@@ -14,7 +14,9 @@ from PyQt6.QtCore import Qt, QSize, QRectF, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap, QColor, QPainter, QBrush, QPen
 
 from configUI import WINDOW_CONFIG, COLORS, FST_LOGO_IMAGE
-from config import FILIERES_LST, FILIERES_MST, FILIERES_INGENIEUR, MATIERES_COMPLETES
+from config import FILIERES_LST, FILIERES_MST, FILIERES_INGENIEUR
+from src.logic.subject_catalog import get_catalog
+from src.ui.workers import TaskRunner
 from src.ui.styles import (
     GLOBAL_STYLE, SIDEBAR_STYLE, SIDEBAR_BUTTON_STYLE, 
     SIDEBAR_USER_INFO_STYLE,
@@ -126,6 +128,9 @@ class AdminWindow(QWidget):
             
         self.db = db
         
+        # Requêtes et imports hors du thread de l'interface
+        self.tasks = TaskRunner(self)
+        
         # Configuration de la fenêtre
         self.setWindowTitle(WINDOW_CONFIG['admin']['title'])
         # Suppression de setFixedSize pour permettre le plein écran
@@ -154,7 +159,7 @@ class AdminWindow(QWidget):
         self.switch_page("Dashboard")
         
     def calculate_stats(self):
-        """Calcule les statistiques dynamiques"""
+        """Calcule les statistiques dynamiques (exécuté en arrière-plan)"""
         stats = {}
         
         # 1. Utilisateurs (DB)
@@ -170,12 +175,8 @@ class AdminWindow(QWidget):
         nb_filieres = len(FILIERES_LST) + len(FILIERES_MST) + len(FILIERES_INGENIEUR)
         stats['filieres'] = nb_filieres
         
-        # 3. Matières (Config)
-        # MATIERES_COMPLETES is dict: 'CODE_PROG': [list of subjects]
-        nb_matieres = 0
-        for prog, subjects in MATIERES_COMPLETES.items():
-            nb_matieres += len(subjects)
-        stats['matieres'] = nb_matieres
+        # 3. Matières (Config, catalogue chargé au premier affichage)
+        stats['matieres'] = get_catalog().subject_count()
         
         # 4. Groupes (DB)
         try:
@@ -186,9 +187,13 @@ class AdminWindow(QWidget):
         return stats
 
     def refresh_dashboard(self):
-        """Met à jour les compteurs du dashboard"""
-        stats = self.calculate_stats()
-        
+        """Met à jour les compteurs du dashboard (calcul en arrière-plan)"""
+        self.tasks.run('stats', lambda worker: self.calculate_stats(),
+                       on_result=self.show_stats,
+                       on_error=lambda e: print(f"Stats error: {e}"))
+    
+    def show_stats(self, stats):
+        """Affiche les compteurs calculés par calculate_stats"""
         # Update Labels if they exist
         # We need to access the labels. In create_dashboard_page, we should store them.
         # If not stored, we might re-create the page or store references.
@@ -326,15 +331,12 @@ class AdminWindow(QWidget):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(20)
         
-        # Initial Calc
-        current_stats = self.calculate_stats()
-        
-        # Define KPI structure
+        # Valeurs calculées en arrière-plan (refresh_dashboard ci-dessous)
         kpis = [
-            ("Enseignants", current_stats['enseignants']),
-            ("Étudiants", current_stats['etudiants']),
-            ("Filières", current_stats['filieres']),
-            ("Matières", current_stats['matieres'])
+            ("Enseignants", "…"),
+            ("Étudiants", "…"),
+            ("Filières", "…"),
+            ("Matières", "…")
         ]
         
         self.stat_labels = {}
@@ -356,6 +358,7 @@ class AdminWindow(QWidget):
             stats_layout.addWidget(card)
             
         layout.addLayout(stats_layout)
+        self.refresh_dashboard()
         
         # === GRAPHIQUES (REAL DATA) ===
         charts_layout = QHBoxLayout()
@@ -413,6 +416,7 @@ class AdminWindow(QWidget):
             ("Importer Groupes", "groupes")
         ]
         
+        self.import_buttons = []
         row, col = 0, 0
         for label, type_imp in imports:
             btn = QPushButton(label)
@@ -420,6 +424,7 @@ class AdminWindow(QWidget):
             btn.setStyleSheet(SOBER_BUTTON_STYLE)
             btn.setFixedHeight(50) # Uniform height
             btn.clicked.connect(lambda _, t=type_imp: self.run_import(t))
+            self.import_buttons.append(btn)
             
             buttons_layout.addWidget(btn, row, col)
             col += 1
@@ -455,9 +460,7 @@ class AdminWindow(QWidget):
         return page
 
     def run_import(self, type_import):
-        """Exécute l'import via ImportManager"""
-        from src.import_manager import ImportManager
-        from config import CSV_TEMPLATES
+        """Exécute l'import via ImportManager (en arrière-plan, la fenêtre reste utilisable)"""
         from PyQt6.QtWidgets import QFileDialog
         
         file_path, _ = QFileDialog.getOpenFileName(
@@ -469,19 +472,44 @@ class AdminWindow(QWidget):
         
         if not file_path:
             return
-            
-        manager = ImportManager()
-        success = False
         
+        # Un seul import à la fois
+        self.set_import_enabled(False)
+        self.tasks.run(
+            'import', self._import_file, type_import, file_path, self.admin_id(),
+            on_result=lambda success: self.show_import_result(type_import, success),
+            on_error=lambda e: self.show_import_result(type_import, False),
+            on_finished=lambda: self.set_import_enabled(True)
+        )
+    
+    def admin_id(self):
+        """Id de l'administrateur connecté (ligne de la base ou UserWrapper)"""
+        try:
+            return self.user['id']
+        except (TypeError, IndexError, KeyError):
+            return getattr(self.user, 'id', None)
+    
+    def set_import_enabled(self, enabled):
+        for btn in self.import_buttons:
+            btn.setEnabled(enabled)
+    
+    @staticmethod
+    def _import_file(worker, type_import, file_path, admin_id):
+        """Import CSV (thread du pool : ImportManager ouvre sa propre connexion)"""
+        from src.import_manager import ImportManager
+        
+        manager = ImportManager(admin_id=admin_id)
         if type_import == "salles":
-            success = manager.import_salles(file_path)
+            return manager.import_salles(file_path)
         elif type_import == "enseignants":
-            success = manager.import_enseignants(file_path)
+            return manager.import_enseignants(file_path)
         elif type_import == "etudiants":
-            success = manager.import_etudiants(file_path)
+            return manager.import_etudiants(file_path)
         elif type_import == "groupes":
-            success = manager.import_groupes(file_path)
-            
+            return manager.import_groupes(file_path)
+        return False
+    
+    def show_import_result(self, type_import, success):
         if success:
             QMessageBox.information(self, "Succès", f"Import {type_import} réussi !")
             self.refresh_dashboard()
@@ -20,6 +20,7 @@ from src.ui.styles import (
     PRIMARY_BUTTON_STYLE, SECONDARY_BUTTON_STYLE,
     TABLE_STYLE, INPUT_STYLE, DANGER_BUTTON_STYLE
 )
+from src.ui.workers import TaskRunner
 
 class UserWrapper:
     def __init__(self, user_tuple):
@@ -42,6 +43,9 @@ class EnseignantWindow(QWidget):
             
         self.db = db
         
+        # Requêtes hors du thread de l'interface
+        self.tasks = TaskRunner(self)
+        
         self.setWindowTitle(WINDOW_CONFIG['enseignant']['title'])
         self.setMinimumSize(1024, 768)
         self.showMaximized()
@@ -170,45 +174,43 @@ class EnseignantWindow(QWidget):
         return page
 
     def load_schedule(self):
-        """Charge l'emploi du temps de l'enseignant"""
+        """Charge l'emploi du temps de l'enseignant en arrière-plan (affiché par lots)"""
         self.schedule_table.clearContents()
-        
-        # Mapping jours/heures
-        days_map = {'Lundi': 0, 'Mardi': 1, 'Mercredi': 2, 'Jeudi': 3, 'Vendredi': 4, 'Samedi': 5}
-        # Time mapping (Simplified)
-        def get_row(time_str):
-            if "08" in time_str or "09" in time_str: return 0
-            if "10" in time_str or "11" in time_str: return 1
-            if "12" in time_str or "13" in time_str: return 2
-            if "14" in time_str or "15" in time_str: return 3
-            if "16" in time_str or "17" in time_str: return 4
-            return -1
+        self.tasks.run('schedule', self._fetch_schedule, self.user.id,
+                       on_batch=self.show_schedule_batch,
+                       on_error=lambda e: print(f"Schedule load error: {e}"))
 
-        try:
-            # Assuming get_seances_by_enseignant exists in DB
-            seances = self.db.get_seances_by_enseignant(self.user.id)
-            for s in seances:
-                # s: id, titre, type, date, h_debut, h_fin, salle_id...
-                # We need day of week from date
-                date_str = s[3]
-                qdate = QDate.fromString(date_str, "yyyy-MM-dd")
-                day_idx = qdate.dayOfWeek() - 1 # 1=Mon, 7=Sun
-                
-                if 0 <= day_idx <= 5:
-                    row = get_row(s[4]) # h_debut
-                    if row != -1:
-                        # Fetch Room Name
-                        salle_name = "Salle ?"
-                        if s[6]: # salle_id
-                            # Need to fetch salle name. ideally JOIN in get_seances_by_enseignant
-                            # Hack: do query or cache.
-                            pass
-                        
-                        txt = f"{s[1]}\n{s[2]}"
-                        self.set_course(self.schedule_table, row, day_idx, s[1], s[2], COLORS['primary_blue'])
-                        
-        except Exception as e:
-            print(f"Schedule load error: {e}")
+    def _fetch_schedule(self, worker, enseignant_id):
+        """Séances de l'enseignant (thread du pool)"""
+        # Assuming get_seances_by_enseignant exists in DB
+        seances = [tuple(s) for s in self.db.get_seances_by_enseignant(enseignant_id)]
+        for start in range(0, len(seances), TaskRunner.BATCH_SIZE):
+            if worker.cancelled:
+                return
+            worker.emit_batch(seances[start:start + TaskRunner.BATCH_SIZE])
+
+    # Time mapping (Simplified)
+    @staticmethod
+    def get_row(time_str):
+        if "08" in time_str or "09" in time_str: return 0
+        if "10" in time_str or "11" in time_str: return 1
+        if "12" in time_str or "13" in time_str: return 2
+        if "14" in time_str or "15" in time_str: return 3
+        if "16" in time_str or "17" in time_str: return 4
+        return -1
+
+    def show_schedule_batch(self, seances):
+        for s in seances:
+            # s: id, titre, type, date, h_debut, h_fin, salle_id...
+            # We need day of week from date
+            date_str = s[3]
+            qdate = QDate.fromString(date_str, "yyyy-MM-dd")
+            day_idx = qdate.dayOfWeek() - 1 # 1=Mon, 7=Sun
+            
+            if 0 <= day_idx <= 5:
+                row = self.get_row(s[4]) # h_debut
+                if row != -1:
+                    self.set_course(self.schedule_table, row, day_idx, s[1], s[2], COLORS['primary_blue'])
 
     def set_course(self, table, row, col, subject, room, color):
         item = QLabel(f"{subject}\n{room}")
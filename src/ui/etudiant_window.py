@@ -14,12 +14,15 @@ from PyQt6.QtCore import Qt, pyqtSignal, QDate, QTime
 from PyQt6.QtGui import QIcon, QPixmap, QColor
 
 from configUI import WINDOW_CONFIG, COLORS, FST_LOGO_IMAGE
+from config import CRENEAUX_HORAIRES
 from src.ui.styles import (
     GLOBAL_STYLE, SIDEBAR_STYLE, SIDEBAR_BUTTON_STYLE, 
     SIDEBAR_USER_INFO_STYLE, CARD_STYLE, CARD_TITLE_STYLE,
     PRIMARY_BUTTON_STYLE, SECONDARY_BUTTON_STYLE,
     TABLE_STYLE, INPUT_STYLE
 )
+from src.ui.workers import TaskRunner, fetch_in_batches
+from src.logic.room_availability_service import RoomAvailabilityService
 import os
 
 class UserWrapper:
@@ -41,6 +44,9 @@ class EtudiantWindow(QWidget):
             
         self.db = db
         
+        # Requêtes hors du thread de l'interface
+        self.tasks = TaskRunner(self)
+        
         self.setWindowTitle(WINDOW_CONFIG['etudiant']['title'])
         self.setMinimumSize(1024, 768)
         self.showMaximized()
@@ -188,42 +194,47 @@ class EtudiantWindow(QWidget):
         return page
 
     def load_schedule(self):
+        """Charge l'emploi du temps du groupe en arrière-plan (affiché par lots)"""
         self.schedule_table.clearContents()
-        try:
-             if hasattr(self.user, 'groupe_id') and self.user.groupe_id:
-                 conn = self.db.get_connection()
-                 cursor = conn.cursor()
-                 cursor.execute('''
-                    SELECT s.date, s.heure_debut, s.titre, s.type_seance, sa.nom, u.nom
-                    FROM seances s
-                    LEFT JOIN salles sa ON s.salle_id = sa.id
-                    LEFT JOIN utilisateurs u ON s.enseignant_id = u.id
-                    WHERE s.groupe_id = ?
-                 ''', (self.user.groupe_id,))
-                 seances = cursor.fetchall()
-                 conn.close()
-                 
-                 def get_row(time_str):
-                    if "08" in time_str or "09" in time_str: return 0
-                    if "10" in time_str or "11" in time_str: return 1
-                    if "12" in time_str or "13" in time_str: return 2
-                    if "14" in time_str or "15" in time_str: return 3
-                    if "16" in time_str or "17" in time_str: return 4
-                    return -1
+        if hasattr(self.user, 'groupe_id') and self.user.groupe_id:
+            self.tasks.run('schedule', self._fetch_schedule, self.user.groupe_id,
+                           on_batch=self.show_schedule_batch,
+                           on_error=lambda e: print(f"Student schedule error: {e}"))
 
-                 for s in seances:
-                    date_str = s[0]
-                    qdate = QDate.fromString(date_str, "yyyy-MM-dd")
-                    day_idx = qdate.dayOfWeek() - 1 
-                    
-                    if 0 <= day_idx <= 5:
-                        row = get_row(s[1])
-                        if row != -1:
-                            txt = f"{s[2]}\n{s[4] if s[4] else '?'}"
-                            color = COLORS['primary_blue'] if s[3] == 'Cours' else COLORS['secondary_blue']
-                            self.set_course(self.schedule_table, row, day_idx, s[2], s[4] if s[4] else "?", color)
-        except Exception as e:
-            print(f"Student schedule error: {e}")
+    def _fetch_schedule(self, worker, groupe_id):
+        """Séances du groupe (thread du pool)"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT s.date, s.heure_debut, s.titre, s.type_seance,
+                   sa.nom AS salle, u.nom AS enseignant
+            FROM seances s
+            LEFT JOIN salles sa ON s.salle_id = sa.id
+            LEFT JOIN utilisateurs u ON s.enseignant_id = u.id
+            WHERE s.groupe_id = ?
+        ''', (groupe_id,))
+        fetch_in_batches(worker, cursor)
+        conn.close()
+
+    @staticmethod
+    def get_row(time_str):
+        if "08" in time_str or "09" in time_str: return 0
+        if "10" in time_str or "11" in time_str: return 1
+        if "12" in time_str or "13" in time_str: return 2
+        if "14" in time_str or "15" in time_str: return 3
+        if "16" in time_str or "17" in time_str: return 4
+        return -1
+
+    def show_schedule_batch(self, seances):
+        for s in seances:
+            qdate = QDate.fromString(s['date'], "yyyy-MM-dd")
+            day_idx = qdate.dayOfWeek() - 1 
+            
+            if 0 <= day_idx <= 5:
+                row = self.get_row(s['heure_debut'])
+                if row != -1:
+                    color = COLORS['primary_blue'] if s['type_seance'] == 'Cours' else COLORS['secondary_blue']
+                    self.set_course(self.schedule_table, row, day_idx, s['titre'], s['salle'] if s['salle'] else "?", color)
 
     def set_course(self, table, row, col, subject, room, color):
         item = QLabel(f"{subject}\n{room}")
@@ -254,6 +265,9 @@ class EtudiantWindow(QWidget):
         btn_search = QPushButton("Trouver Salles Libres")
         btn_search.setStyleSheet(SECONDARY_BUTTON_STYLE)
         btn_search.clicked.connect(self.find_available_rooms)
+        # Changer la date ou l'heure relance la recherche (la précédente est annulée)
+        self.search_date.dateChanged.connect(self.find_available_rooms)
+        self.search_time.timeChanged.connect(self.find_available_rooms)
         f_layout.addWidget(btn_search, 1, 3)
         
         layout.addWidget(filters_frame)
@@ -273,38 +287,46 @@ class EtudiantWindow(QWidget):
         return page
 
     def find_available_rooms(self):
+        """Recherche en arrière-plan ; une nouvelle recherche annule la précédente"""
         date_Val = self.search_date.date().toString("yyyy-MM-dd")
-        time_Val = self.search_time.time().toString("HH:mm")
-        
-        # 1. Get all rooms
-        try:
-             all_rooms = self.db.get_toutes_salles()
-             conn = self.db.get_connection()
-             cursor = conn.cursor()
-             
-             # 2. Get occupied rooms
-             query = """
-                SELECT DISTINCT salle_id FROM seances 
-                WHERE date = ? 
-                AND ? BETWEEN heure_debut AND heure_fin
-             """
-             cursor.execute(query, (date_Val, time_Val))
-             occupied_ids = [row[0] for row in cursor.fetchall()]
-             conn.close()
-             
-             available = [r for r in all_rooms if r[0] not in occupied_ids]
-             
-             self.rooms_table.setRowCount(len(available))
-             for i, r in enumerate(available):
-                 self.rooms_table.setItem(i, 0, QTableWidgetItem(r[1]))
-                 self.rooms_table.setItem(i, 1, QTableWidgetItem(r[3]))
-                 self.rooms_table.setItem(i, 2, QTableWidgetItem(str(r[2])))
-                 item_state = QTableWidgetItem("LIBRE")
-                 item_state.setForeground(QColor("green"))
-                 self.rooms_table.setItem(i, 3, item_state)
-                 
-        except Exception as e:
-            print(f"Room search error: {e}")
+        heure = self.search_time.time()
+        time_Val = heure.toString("HH:mm")
+        
+        # Fin du créneau contenant l'heure choisie, sinon une séance standard
+        fin = heure.addSecs(CRENEAUX_HORAIRES[0][2] * 60)
+        for debut_creneau, fin_creneau, _ in CRENEAUX_HORAIRES:
+            if debut_creneau <= time_Val < fin_creneau:
+                fin = QTime.fromString(fin_creneau, "HH:mm")
+                break
+        if fin <= heure:
+            fin = QTime(23, 59)
+        end_Val = fin.toString("HH:mm")
+        
+        self.rooms_table.setRowCount(0)
+        self.tasks.run('rooms', self._fetch_available_rooms, date_Val, time_Val, end_Val,
+                       on_batch=self.show_rooms_batch,
+                       on_error=lambda e: print(f"Room search error: {e}"))
+
+    def _fetch_available_rooms(self, worker, date_Val, time_Val, end_Val):
+        """Salles libres sur le créneau (séances, réservations validées et pause) - thread du pool"""
+        rooms = RoomAvailabilityService(self.db).find_available_rooms(date_Val, time_Val, end_Val)
+        
+        available = [tuple(r) for r in rooms]
+        for start in range(0, len(available), TaskRunner.BATCH_SIZE):
+            if worker.cancelled:
+                return
+            worker.emit_batch(available[start:start + TaskRunner.BATCH_SIZE])
+
+    def show_rooms_batch(self, rooms):
+        for r in rooms:
+            i = self.rooms_table.rowCount()
+            self.rooms_table.insertRow(i)
+            self.rooms_table.setItem(i, 0, QTableWidgetItem(r[1]))
+            self.rooms_table.setItem(i, 1, QTableWidgetItem(r[3]))
+            self.rooms_table.setItem(i, 2, QTableWidgetItem(str(r[2])))
+            item_state = QTableWidgetItem("LIBRE")
+            item_state.setForeground(QColor("green"))
+            self.rooms_table.setItem(i, 3, item_state)
 
     def create_updates_page(self):
         page = QWidget()
@@ -0,0 +1,126 @@
+# src/ui/workers.py
+"""
+Tâches de fond pour les fenêtres PyQt
+Les requêtes SQLite et les imports s'exécutent dans le QThreadPool : la
+fenêtre reste réactive, les résultats arrivent par signaux (thread GUI)
+"""
+
+import traceback
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signaux d'une tâche (créés dans le thread GUI, émis depuis le pool)"""
+    batch = pyqtSignal(object)      # résultats partiels (liste de lignes)
+    result = pyqtSignal(object)     # valeur de retour de la fonction
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """
+    Exécute fonction(worker, *args, **kwargs) dans un thread du pool.
+
+    La fonction peut envoyer des lots avec worker.emit_batch(lignes) et doit
+    s'arrêter dès que worker.cancelled est vrai (requête devenue obsolète).
+    Ne jamais toucher aux widgets depuis la fonction : seulement les données.
+    """
+
+    def __init__(self, fonction, *args, **kwargs):
+        super().__init__()
+        self.fonction = fonction
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self.cancelled = False
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def emit_batch(self, lignes):
+        if not self.cancelled and lignes:
+            self.signals.batch.emit(list(lignes))
+
+    def run(self):
+        try:
+            resultat = self.fonction(self, *self.args, **self.kwargs)
+            if not self.cancelled:
+                self.signals.result.emit(resultat)
+        except Exception as e:
+            traceback.print_exc()
+            if not self.cancelled:
+                self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+class TaskRunner(QObject):
+    """
+    Lance les tâches d'une fenêtre, une seule par clé : relancer une clé
+    (ex. l'utilisateur change de date) annule la requête précédente et
+    ignore ses résultats s'ils arrivent encore.
+    """
+
+    # Lignes envoyées par lot aux tableaux
+    BATCH_SIZE = 200
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._courants = {}     # {clé: worker en cours}
+        self._actifs = set()    # références gardées jusqu'à la fin des tâches
+
+    def run(self, cle, fonction, *args, on_batch=None, on_result=None,
+            on_error=None, on_finished=None, **kwargs):
+        """Exécute fonction(worker, *args, **kwargs) en remplaçant la tâche `cle`"""
+        self.cancel(cle)
+        worker = Worker(fonction, *args, **kwargs)
+        self._courants[cle] = worker
+        self._actifs.add(worker)
+
+        # Les résultats d'une tâche remplacée entre-temps sont ignorés
+        def actuel(callback):
+            def relais(*valeurs):
+                if self._courants.get(cle) is worker and not worker.cancelled:
+                    callback(*valeurs)
+            return relais
+
+        if on_batch:
+            worker.signals.batch.connect(actuel(on_batch))
+        if on_result:
+            worker.signals.result.connect(actuel(on_result))
+        if on_error:
+            worker.signals.error.connect(actuel(on_error))
+
+        def fin():
+            if on_finished and self._courants.get(cle) is worker:
+                on_finished()
+            if self._courants.get(cle) is worker:
+                del self._courants[cle]
+            self._actifs.discard(worker)
+        worker.signals.finished.connect(fin)
+
+        self.pool.start(worker)
+        return worker
+
+    def cancel(self, cle):
+        worker = self._courants.pop(cle, None)
+        if worker is not None:
+            worker.cancel()
+
+    def cancel_all(self):
+        for cle in list(self._courants):
+            self.cancel(cle)
+
+    def is_running(self, cle):
+        return cle in self._courants
+
+
+def fetch_in_batches(worker, cursor, taille=TaskRunner.BATCH_SIZE):
+    """Envoie les lignes d'un curseur par lots (dict) jusqu'à épuisement ou annulation"""
+    while not worker.cancelled:
+        lignes = cursor.fetchmany(taille)
+        if not lignes:
+            break
+        worker.emit_batch([dict(ligne) for ligne in lignes])
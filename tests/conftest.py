@@ -0,0 +1,28 @@
+# tests/conftest.py
+import pytest
+import src.database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Base vide dans un dossier temporaire (la base du projet n'est pas touchée)"""
+    monkeypatch.setattr(src.database, 'DATABASE_PATH', tmp_path / 'emploi_du_temps.db')
+    base = src.database.Database()
+    yield base
+    base.fermer_connexion()
+
+
+@pytest.fixture
+def faculte(db):
+    """Une filière, deux groupes, trois salles et deux enseignants"""
+    filiere_id = db.ajouter_filiere('Génie Informatique', 'L3')
+    groupes = [db.ajouter_groupe(nom, 30, filiere_id) for nom in ('Gr_01', 'Gr_02')]
+    salles = [db.ajouter_salle(nom, 40, 'Salle') for nom in ('B01', 'B02', 'B03')]
+    enseignants = [
+        db.ajouter_utilisateur('ALAMI', 'Mohammed', 'm.alami@uae.ac.ma', 'prof123',
+                               'enseignant', 'Informatique', None, 480),
+        db.ajouter_utilisateur('BENNIS', 'Fatima', 'f.bennis@uae.ac.ma', 'prof123',
+                               'enseignant', 'Mathématiques', None, 480),
+    ]
+    return {'filiere_id': filiere_id, 'groupes': groupes, 'salles': salles,
+            'enseignants': enseignants}
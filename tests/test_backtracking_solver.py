@@ -0,0 +1,127 @@
+# tests/test_backtracking_solver.py
+import random
+from itertools import combinations
+
+from src.logic.backtracking_solver import BacktrackingSolver
+from src.logic.conflict_detector import ConflictDetector
+from src.logic.time_utils import TimeUtils
+
+DATES = ['2025-01-06', '2025-01-07', '2025-01-08', '2025-01-09', '2025-01-10']
+SLOTS = [("08:00", "09:30"), ("09:40", "11:10"), ("11:20", "12:50"),
+         ("14:00", "15:30"), ("15:40", "17:10"), ("17:20", "18:50")]
+PAUSE = ConflictDetector.PAUSE_MINUTES
+
+
+def _minutes(seance):
+    return (TimeUtils.time_to_minutes(seance['heure_debut']),
+            TimeUtils.time_to_minutes(seance['heure_fin']))
+
+
+def _se_chevauchent(a, b):
+    if a['date'] != b['date']:
+        return False
+    debut_a, fin_a = _minutes(a)
+    debut_b, fin_b = _minutes(b)
+    return debut_a < fin_b + PAUSE and debut_b < fin_a + PAUSE
+
+
+def _violations(sessions, existing, rooms, courses, day_limits):
+    """Vérification naïve (toutes les paires) de chaque contrainte du solveur"""
+    erreurs = []
+    capacites = {room['id']: room['capacite'] for room in rooms}
+    effectifs = {(c['groupe_id'], c['matiere']): c['effectif'] for c in courses}
+    for a, b in combinations(sessions + existing, 2):
+        if not _se_chevauchent(a, b):
+            continue
+        for cle in ('salle_id', 'enseignant_id', 'groupe_id'):
+            if a.get(cle) is not None and a.get(cle) == b.get(cle):
+                erreurs.append((cle, a, b))
+    jours = {}
+    for s in sessions:
+        cours = (s['groupe_id'], s['titre'])
+        if s['date'] in jours.setdefault(cours, set()):
+            erreurs.append(('meme_jour', s))
+        jours[cours].add(s['date'])
+        if capacites[s['salle_id']] < effectifs[cours]:
+            erreurs.append(('capacite', s))
+    charge = {}
+    for s in sessions + existing:
+        if s.get('enseignant_id') is None:
+            continue
+        debut, fin = _minutes(s)
+        cle = (s['enseignant_id'], s['date'])
+        charge[cle] = charge.get(cle, 0) + fin - debut
+    for (enseignant_id, date), minutes in charge.items():
+        if minutes > day_limits.get(enseignant_id, 480):
+            erreurs.append(('charge', enseignant_id, date, minutes))
+    return erreurs
+
+
+def _cours(groupe_id, enseignant_id, matiere, nb, duree=1.5, effectif=30, type_seance='Cours'):
+    return {'groupe_id': groupe_id, 'enseignant_id': enseignant_id, 'matiere': matiere,
+            'type_seance': type_seance, 'duree_heures': duree, 'nb_seances_semaine': nb,
+            'effectif': effectif}
+
+
+def _salles(*capacites):
+    return [{'id': i + 1, 'capacite': c, 'type_salle': 'Salle'} for i, c in enumerate(capacites)]
+
+
+def test_instance_complete_sans_violation():
+    rooms = _salles(40, 40, 120)
+    courses = [_cours(g, 10 + (g + m) % 4, f"M{m}", 2, effectif=35 if m else 100)
+               for g in range(1, 5) for m in range(3)]
+    solver = BacktrackingSolver(rooms, DATES, SLOTS, prefer_room_types=False)
+
+    result = solver.solve(courses)
+
+    assert result['success'] and not result['unscheduled']
+    assert len(result['sessions']) == sum(c['nb_seances_semaine'] for c in courses)
+    assert _violations(result['sessions'], [], rooms, courses, {}) == []
+
+
+def test_seances_existantes_et_limite_journaliere():
+    rooms = _salles(40)
+    existing = [{'date': d, 'heure_debut': '08:00', 'heure_fin': '12:50',
+                 'salle_id': 1, 'enseignant_id': 7, 'groupe_id': 99} for d in DATES[:4]]
+    courses = [_cours(1, 7, 'Analyse', 1, duree=3.0)]
+    # 4h50 déjà faites du lundi au jeudi : seul le vendredi laisse 3h sous 6h
+    solver = BacktrackingSolver(rooms, DATES, SLOTS, existing_seances=existing,
+                                prefer_room_types=False, teacher_day_limits={7: 360})
+
+    result = solver.solve(courses)
+
+    assert [s['date'] for s in result['sessions']] == [DATES[4]]
+    assert _violations(result['sessions'], existing, rooms, courses, {7: 360}) == []
+
+
+def test_cours_impossible_signale():
+    # Aucune salle assez grande : rien n'est placé, la séance est rapportée
+    courses = [_cours(1, 1, 'Amphi', 1, effectif=200)]
+    result = BacktrackingSolver(_salles(40), DATES, SLOTS).solve(courses)
+
+    assert result['sessions'] == []
+    assert result['unscheduled'][0]['sessions_manquantes'] == 1
+
+
+def test_jamais_de_violation_sur_instances_aleatoires():
+    rng = random.Random(2025)
+    for _ in range(25):
+        rooms = _salles(*(rng.choice([30, 40, 60]) for _ in range(rng.randint(1, 3))))
+        limits = {e: rng.choice([180, 270, 480]) for e in range(1, 4)}
+        courses = [
+            _cours(rng.randint(1, 4), rng.randint(1, 3), f"M{i}", rng.randint(1, 3),
+                   duree=rng.choice([1.5, 2.0, 3.0]), effectif=rng.choice([25, 35, 50]))
+            for i in range(rng.randint(3, 10))
+        ]
+        existing = [{'date': rng.choice(DATES), 'heure_debut': '14:00', 'heure_fin': '15:30',
+                     'salle_id': rooms[0]['id'], 'enseignant_id': rng.randint(1, 3), 'groupe_id': 50}]
+        solver = BacktrackingSolver(rooms, DATES, SLOTS, existing_seances=existing,
+                                    max_iterations=2000, teacher_day_limits=limits)
+
+        result = solver.solve(courses)
+
+        assert _violations(result['sessions'], existing, rooms, courses, limits) == []
+        places = len(result['sessions'])
+        manquantes = sum(c['sessions_manquantes'] for c in result['unscheduled'])
+        assert places + manquantes == sum(min(c['nb_seances_semaine'], len(DATES)) for c in courses)
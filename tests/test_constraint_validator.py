@@ -0,0 +1,79 @@
+# tests/test_constraint_validator.py
+import random
+
+from src.logic.constraint_validator import ConstraintValidator
+
+DATES = ['2025-01-06', '2025-01-07']
+SALLES = [{'id': i, 'capacite': c} for i, c in ((1, 30), (2, 40), (3, 120))]
+GROUPES = [{'id': i, 'effectif': e} for i, e in ((1, 25), (2, 35), (3, 100))]
+
+
+def _heure(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _seance(rng, seance_id=None):
+    debut = rng.randrange(8 * 60, 18 * 60, 5)
+    seance = {
+        'date': rng.choice(DATES),
+        'heure_debut': _heure(debut),
+        'heure_fin': _heure(debut + rng.choice([60, 90, 120])),
+        'salle_id': rng.choice([1, 2, 3, None]),
+        'enseignant_id': rng.choice([10, 11, 12]),
+        'groupe_id': rng.choice([1, 2, 3]),
+    }
+    if seance_id is not None:
+        seance['id'] = seance_id
+    return seance
+
+
+def _une_par_une(existing, reservations, seance):
+    """Référence : validate_seance, la séance proposée ignorant son propre id"""
+    validator = ConstraintValidator(existing, reservations, SALLES, GROUPES)
+    return validator.validate_seance(
+        seance['date'], seance['heure_debut'], seance['heure_fin'], seance.get('salle_id'),
+        seance.get('enseignant_id'), seance.get('groupe_id'), seance.get('id'))[1]
+
+
+def test_une_proposition_equivaut_a_validate_seance():
+    rng = random.Random(10)
+    for _ in range(300):
+        existing = [_seance(rng, i) for i in range(rng.randint(0, 12))]
+        reservations = [dict(_seance(rng), statut=rng.choice(['validee', 'en_attente']), groupe_id=None)
+                        for _ in range(rng.randint(0, 3))]
+        # Tantôt une nouvelle séance, tantôt le déplacement d'une existante
+        seance = _seance(rng, rng.choice([None] + [s['id'] for s in existing]))
+
+        validator = ConstraintValidator(existing, reservations, SALLES, GROUPES)
+        assert validator.validate_many([seance]) == [_une_par_une(existing, reservations, seance)]
+
+
+def test_lot_equivaut_a_validate_seance_contre_les_autres_propositions():
+    rng = random.Random(11)
+    for _ in range(200):
+        existing = [_seance(rng, i) for i in range(rng.randint(0, 10))]
+        lot = [_seance(rng) for _ in range(rng.randint(1, 6))]
+
+        validator = ConstraintValidator(existing, [], SALLES, GROUPES)
+        attendu = [_une_par_une(existing + lot[:i] + lot[i + 1:], [], seance)
+                   for i, seance in enumerate(lot)]
+        assert validator.validate_many(lot) == attendu
+
+
+def test_conflit_entre_deux_propositions_signale_des_deux_cotes():
+    a = {'date': DATES[0], 'heure_debut': '09:00', 'heure_fin': '10:30',
+         'salle_id': 2, 'enseignant_id': 10, 'groupe_id': 1}
+    b = dict(a, heure_debut='10:35', heure_fin='12:00', enseignant_id=11, groupe_id=2)
+
+    erreurs = ConstraintValidator([], [], SALLES, GROUPES).validate_many([a, b])
+
+    # 5 minutes d'écart < pause de 10 minutes : même salle
+    assert len(erreurs[0]) == 1 and erreurs[0][0].startswith("Salle occupée")
+    assert len(erreurs[1]) == 1 and erreurs[1][0].startswith("Salle occupée")
+
+
+def test_plage_horaire_invalide():
+    seance = {'date': DATES[0], 'heure_debut': '11:00', 'heure_fin': '10:00',
+              'salle_id': 1, 'enseignant_id': 10, 'groupe_id': 1}
+    assert ConstraintValidator([]).validate_many([seance]) == [
+        ["L'heure de début doit être avant l'heure de fin."]]
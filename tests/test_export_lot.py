@@ -0,0 +1,111 @@
+# tests/test_export_lot.py
+import os
+import zipfile
+
+import pytest
+
+from config import EXPORT_CONFIG
+from src.logic.export_cache import ExportCache
+from src.logic.timetable_export_service import TimetableExportService
+
+
+@pytest.fixture
+def service(db, faculte, tmp_path, monkeypatch):
+    """Exports et manifeste du cache dans le dossier temporaire"""
+    dossiers = {'pdf': tmp_path / 'pdf', 'excel': tmp_path / 'excel', 'xlsx': tmp_path / 'excel'}
+    for format_type, dossier in dossiers.items():
+        monkeypatch.setitem(TimetableExportService.BATCH_DIRS, format_type, dossier)
+
+    g1, g2 = faculte['groupes']
+    s1, s2, _ = faculte['salles']
+    e1, e2 = faculte['enseignants']
+    db.ajouter_seance('Analyse', 'Cours', '2024-02-06', '10:15', '11:45', s1, e1, g1)
+    db.ajouter_seance('Analyse', 'TD', '2024-02-05', '08:30', '10:00', s2, e1, g1)
+    db.ajouter_seance('Algèbre', 'Cours', '2024-02-05', '08:30', '10:00', s1, e2, g2)
+    reservation = db.ajouter_reservation(e1, s2, '2024-02-07', '14:00', '16:00', 'Soutenance')
+    db.modifier_statut_reservation(reservation, 'validee')
+
+    export = TimetableExportService(db)
+    export.cache = ExportCache(tmp_path)
+    return export
+
+
+def test_preparation_groupee_identique_aux_exports_individuels(service, faculte, monkeypatch):
+    """prepare_many_timetables = les données de export_group/teacher_timetable"""
+    individuelles = {}
+    monkeypatch.setattr(service, '_render_cached',
+                        lambda data, filename, format_type: individuelles.setdefault(filename, data))
+    for groupe_id in faculte['groupes']:
+        service.export_group_timetable(groupe_id)
+    for enseignant_id in faculte['enseignants']:
+        service.export_teacher_timetable(enseignant_id)
+
+    groupees = service.prepare_many_timetables()
+    assert len(groupees) == len(individuelles) == 4
+    for (kind, entity_id), data in groupees.items():
+        if kind == 'groupe':
+            filename = f"emploi_du_temps_groupe_{data['groupe_nom']}"
+        else:
+            filename = f"emploi_du_temps_{data['enseignant_nom'].replace(' ', '_')}"
+        assert data == individuelles[filename]
+    assert groupees[('enseignant', faculte['enseignants'][0])]['schedule']['Mercredi'][0]['course'] == \
+        "Réservation - Soutenance"
+
+
+def _contenu_xlsx(chemin):
+    with zipfile.ZipFile(chemin) as archive:
+        return {nom: archive.read(nom) for nom in archive.namelist()}
+
+
+def test_export_lot_puis_cache(service, faculte, tmp_path):
+    rapport = service.export_all_timetables(formats=['pdf', 'excel'], max_workers=1)
+    assert rapport['total'] == 8
+    assert rapport['errors'] == [] and rapport['cached'] == 0
+    assert sorted(os.path.relpath(p, tmp_path) for p in rapport['exported']) == sorted(
+        os.path.join(dossier, f"{nom}.{ext}")
+        for dossier, ext in (('pdf', 'pdf'), ('excel', 'xlsx'))
+        for nom in ('emploi_du_temps_groupe_Gr_01', 'emploi_du_temps_groupe_Gr_02',
+                    'emploi_du_temps_Mohammed_ALAMI', 'emploi_du_temps_Fatima_BENNIS')
+    )
+
+    # Rien n'a changé : tout est repris du cache
+    progression = []
+    rapport = service.export_all_timetables(formats=['pdf', 'excel'], max_workers=1,
+                                            progress_callback=lambda *p: progression.append(p))
+    assert rapport['cached'] == rapport['total'] == 8
+    assert [p[:2] for p in progression] == [(i, 8) for i in range(1, 9)]
+
+    # Une séance ajoutée : seuls les fichiers concernés sont refaits
+    service.db.ajouter_seance('Physique', 'TP', '2024-02-08', '08:30', '10:00', faculte['salles'][2],
+                              faculte['enseignants'][1], faculte['groupes'][1])
+    rapport = service.export_all_timetables(formats=['pdf'], max_workers=1)
+    assert rapport['cached'] == 2
+
+
+def test_export_lot_parallele_identique_au_sequentiel(service, tmp_path):
+    sequentiel = service.export_all_timetables(formats=['excel'], max_workers=1)
+    contenus = {p: _contenu_xlsx(p) for p in sequentiel['exported']}
+    service.cache = None
+
+    parallele = service.export_all_timetables(formats=['excel'], max_workers=2)
+    assert parallele['errors'] == [] and parallele['cached'] == 0
+    assert sorted(parallele['exported']) == sorted(contenus)
+    for chemin, contenu in contenus.items():
+        assert _contenu_xlsx(chemin) == contenu
+
+
+def test_noms_en_double_distingues_par_id(service, db, faculte):
+    autre_filiere = db.ajouter_filiere('Génie Civil', 'L3')
+    doublon = db.ajouter_groupe('Gr_01', 25, autre_filiere)
+
+    rapport = service.export_all_timetables(formats=['pdf'], groupe_ids=[faculte['groupes'][0], doublon],
+                                            enseignant_ids=[], max_workers=1)
+    assert sorted(os.path.basename(p) for p in rapport['exported']) == [
+        f"emploi_du_temps_groupe_Gr_01_{faculte['groupes'][0]}.pdf",
+        f"emploi_du_temps_groupe_Gr_01_{doublon}.pdf",
+    ]
+
+
+def test_format_non_supporte(service):
+    assert service.export_all_timetables(formats=['pdf', 'docx']) == {
+        'total': 0, 'exported': [], 'cached': 0, 'errors': [('docx', "Format non supporté: docx")]}
@@ -0,0 +1,123 @@
+# tests/test_import_en_masse.py
+import csv
+
+import pytest
+
+from src.import_manager import ImportManager
+from src.logic.csv_import_service import CSVImportService
+
+SALLES = [
+    {'nom': 'B01', 'capacite': '35', 'type_salle': 'Salle', 'equipements': 'videoprojecteur'},
+    {'nom': 'Amphi A', 'capacite': '200', 'type_salle': 'Amphithéâtre', 'equipements': ''},
+    {'nom': 'B01', 'capacite': '40', 'type_salle': 'Salle', 'equipements': ''},        # doublon
+]
+# Lignes que seul le mode en masse sait écarter (le mode ligne par ligne lève une exception)
+SALLES_INVALIDES = [
+    {'nom': 'Labo 1', 'capacite': 'vingt', 'type_salle': 'Laboratoire', 'equipements': ''},
+    {'nom': 'C02', 'capacite': '30', 'type_salle': 'Garage', 'equipements': ''},
+]
+GROUPES = [
+    {'nom': 'Gr_01', 'effectif': '25', 'filiere': 'Génie Informatique'},
+    {'nom': 'Gr_03', 'effectif': '20', 'filiere': 'Filière inconnue'},
+]
+ENSEIGNANTS = [
+    {'nom': 'ALAMI', 'prenom': 'Mohammed', 'email': 'm.alami@uae.ac.ma',
+     'specialite': 'Génie Civil', 'duree_max_jour': '420'},
+    {'nom': 'BENNIS', 'prenom': 'Fatima', 'email': 'f.bennis@uae.ac.ma',
+     'specialite': 'Énergies Renouvelables', 'duree_max_jour': '480'},
+    {'nom': 'ALAMI', 'prenom': 'Double', 'email': 'm.alami@uae.ac.ma',
+     'specialite': 'Génie Civil', 'duree_max_jour': '480'},
+]
+ETUDIANTS = [
+    {'nom': 'HAFIDI', 'prenom': 'Yassine', 'email': 'y.hafidi@etu.uae.ac.ma', 'groupe': 'Gr_01'},
+    {'nom': 'AMRANI', 'prenom': 'Salma', 'email': 's.amrani@etu.uae.ac.ma', 'groupe': 'Gr_99'},
+]
+
+
+def _csv(path, lignes):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(lignes[0]))
+        writer.writeheader()
+        writer.writerows(lignes)
+    return str(path)
+
+
+def _contenu(db):
+    conn = db.get_connection()
+    return {
+        'salles': sorted(tuple(r) for r in conn.execute(
+            'SELECT nom, capacite, type_salle, equipements FROM salles')),
+        'groupes': sorted(tuple(r) for r in conn.execute(
+            'SELECT g.nom, g.effectif, f.nom FROM groupes g JOIN filieres f ON f.id = g.filiere_id')),
+        'utilisateurs': sorted(tuple(r) for r in conn.execute(
+            'SELECT u.nom, u.prenom, u.email, u.mot_de_passe, u.type_user, u.specialite, '
+            'g.nom, u.duree_max_jour FROM utilisateurs u LEFT JOIN groupes g ON g.id = u.groupe_id')),
+    }
+
+
+@pytest.fixture
+def fichiers(tmp_path):
+    return {nom: _csv(tmp_path / f"{nom}.csv", lignes) for nom, lignes in
+            (('salles', SALLES), ('groupes', GROUPES), ('enseignants', ENSEIGNANTS),
+             ('etudiants', ETUDIANTS))}
+
+
+def _importer(manager, fichiers):
+    manager.db.ajouter_filiere('Génie Informatique', 'L3')
+    assert manager.import_salles(fichiers['salles'])
+    assert manager.import_groupes(fichiers['groupes'])
+    assert manager.import_enseignants(fichiers['enseignants'])
+    assert manager.import_etudiants(fichiers['etudiants'])
+    return _contenu(manager.db)
+
+
+def test_import_manager_en_masse_identique_ligne_par_ligne(db, fichiers):
+    ligne_par_ligne = _importer(ImportManager(en_masse=False), fichiers)
+    # Même base : les imports remplacent entièrement les données
+    en_masse = _importer(ImportManager(en_masse=True), fichiers)
+
+    assert en_masse == ligne_par_ligne
+    assert [s[0] for s in en_masse['salles']] == ['Amphi A', 'B01']
+    assert en_masse['groupes'] == [('Gr_01', 25, 'Génie Informatique')]
+    assert [(u[2], u[7]) for u in en_masse['utilisateurs']] == [
+        ('m.alami@uae.ac.ma', 420), ('f.bennis@uae.ac.ma', 480), ('y.hafidi@etu.uae.ac.ma', 480)]
+
+
+def test_service_en_masse_identique_ligne_par_ligne(db, fichiers):
+    def importer(bulk):
+        service = CSVImportService(db, bulk=bulk)
+        resultat = service.import_all_csv_files(fichiers['etudiants'], fichiers['enseignants'],
+                                                fichiers['groupes'], fichiers['salles'],
+                                                auto_generate_timetable=False)
+        return resultat['imported'], _contenu(db)
+
+    imported_lignes, contenu_lignes = importer(False)
+    imported_masse, contenu_masse = importer(True)
+
+    assert imported_masse == imported_lignes
+    assert contenu_masse == contenu_lignes
+    assert contenu_masse['utilisateurs'][0][7] == 420
+    # Le service crée les filières manquantes
+    assert [g[0] for g in contenu_masse['groupes']] == ['Gr_01', 'Gr_03']
+
+def test_import_en_masse_ecarte_les_lignes_invalides(db, tmp_path):
+    manager = ImportManager(en_masse=True)
+    assert manager.import_salles(_csv(tmp_path / 'salles.csv', SALLES + SALLES_INVALIDES))
+
+    assert [s[0] for s in _contenu(db)['salles']] == ['Amphi A', 'B01']
+    assert len(manager.service.warnings) == 3
+
+
+def test_import_en_masse_remplace_dans_une_seule_transaction(db, fichiers, monkeypatch):
+    manager = ImportManager(en_masse=True)
+    manager.import_salles(fichiers['salles'])
+    avant = _contenu(db)['salles']
+
+    def echec(lignes):
+        raise RuntimeError("disque plein")
+    monkeypatch.setattr(manager.db, 'ajouter_salles_en_masse', echec)
+
+    with pytest.raises(RuntimeError):
+        manager.import_salles(fichiers['salles'])
+    # La suppression des anciennes salles a été annulée avec l'insertion
+    assert _contenu(db)['salles'] == avant
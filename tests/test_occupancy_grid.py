@@ -0,0 +1,101 @@
+# tests/test_occupancy_grid.py
+import random
+
+from src.logic.conflict_detector import ConflictDetector
+from src.logic.occupancy_grid import OccupancyGrid
+
+DATES = ['2025-01-06', '2025-01-07']
+PAUSE = ConflictDetector.PAUSE_MINUTES
+RESSOURCES = (('salle', 'salle_id'), ('enseignant', 'enseignant_id'), ('groupe', 'groupe_id'))
+
+
+def _heure(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _seance(rng, pas):
+    debut = rng.randrange(8 * 60, 18 * 60, pas)
+    return {
+        'date': rng.choice(DATES),
+        'heure_debut': _heure(debut),
+        'heure_fin': _heure(debut + rng.randrange(30, 181, pas)),
+        'salle_id': rng.choice([1, 2, 3]),
+        'enseignant_id': rng.choice([10, 11]),
+        'groupe_id': rng.choice([1, 2, None]),
+    }
+
+
+def _minutes(heure):
+    h, m = heure.split(':')
+    return int(h) * 60 + int(m)
+
+
+def _libre_naif(seances, date, debut, fin, ressources):
+    """Référence : comparaison de chaque séance existante, pause comprise"""
+    for s in seances:
+        if s['date'] != date:
+            continue
+        if not (_minutes(s['heure_debut']) < _minutes(fin) + PAUSE
+                and _minutes(debut) < _minutes(s['heure_fin']) + PAUSE):
+            continue
+        for kind, cle in RESSOURCES:
+            if ressources.get(kind) is not None and s.get(cle) == ressources[kind]:
+                return False
+    return True
+
+
+def test_equivaut_a_la_comparaison_naive_sur_des_horaires_multiples_de_5():
+    rng = random.Random(6)
+    for _ in range(100):
+        seances = [_seance(rng, 5) for _ in range(rng.randint(0, 15))]
+        grid = OccupancyGrid(seances)
+        detector = ConflictDetector(list(seances))
+        for _ in range(20):
+            p = _seance(rng, 5)
+            ressources = {'salle': p['salle_id'], 'enseignant': p['enseignant_id'], 'groupe': p['groupe_id']}
+            attendu = _libre_naif(seances, p['date'], p['heure_debut'], p['heure_fin'], ressources)
+
+            assert grid.is_slot_free(p['date'], p['heure_debut'], p['heure_fin'],
+                                     p['salle_id'], p['enseignant_id'], p['groupe_id']) == attendu
+            assert (detector.detect_all_conflicts(p['date'], p['heure_debut'], p['heure_fin'],
+                                                  p['salle_id'], p['enseignant_id'], p['groupe_id'])
+                    == []) == attendu
+
+
+def test_horaires_quelconques_jamais_de_conflit_manque():
+    rng = random.Random(7)
+    for _ in range(100):
+        seances = [_seance(rng, 1) for _ in range(rng.randint(0, 15))]
+        grid = OccupancyGrid(seances)
+        for _ in range(20):
+            p = _seance(rng, 1)
+            ressources = {'salle': p['salle_id'], 'enseignant': p['enseignant_id'], 'groupe': p['groupe_id']}
+            if grid.is_slot_free(p['date'], p['heure_debut'], p['heure_fin'],
+                                 p['salle_id'], p['enseignant_id'], p['groupe_id']):
+                assert _libre_naif(seances, p['date'], p['heure_debut'], p['heure_fin'], ressources)
+
+
+def test_pause_entre_deux_seances():
+    grid = OccupancyGrid([{'date': DATES[0], 'heure_debut': '08:00', 'heure_fin': '09:30',
+                           'salle_id': 1, 'enseignant_id': 10, 'groupe_id': 1}])
+
+    assert not grid.is_slot_free(DATES[0], '09:35', '11:00', salle_id=1)
+    assert grid.is_slot_free(DATES[0], '09:40', '11:10', salle_id=1)
+    assert grid.is_slot_free(DATES[0], '09:00', '10:00', salle_id=2, enseignant_id=11, groupe_id=2)
+    assert grid.is_slot_free(DATES[1], '08:00', '09:30', salle_id=1)
+    # Horaires illisibles : jamais considérés libres
+    assert not grid.is_slot_free(DATES[0], 'xx', '10:00', salle_id=2)
+
+
+def test_salles_libres_et_occupees():
+    rng = random.Random(8)
+    seances = [_seance(rng, 5) for _ in range(30)]
+    grid = OccupancyGrid(seances)
+    for date in DATES:
+        mask = grid.mask_for('10:00', '12:00')
+        libres = grid.free_resources('salle', date, mask, [1, 2, 3, 4])
+        occupees = grid.busy_resources('salle', date, mask)
+
+        assert set(libres) == {1, 2, 3, 4} - occupees
+        for salle_id in [1, 2, 3, 4]:
+            assert (salle_id in libres) == _libre_naif(seances, date, '10:00', '12:00', {'salle': salle_id})
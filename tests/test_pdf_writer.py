@@ -0,0 +1,101 @@
+# tests/test_pdf_writer.py
+import re
+import zlib
+
+import pytest
+
+from config import EXPORT_CONFIG
+from src.logic.pdf_writer import StreamingPdfWriter
+from src.logic.timetable_export_service import TimetableExportService
+
+
+def _lire_pdf(path):
+    """(nombre de pages, textes de chaque page) d'un PDF écrit par StreamingPdfWriter"""
+    contenu = open(path, 'rb').read()
+
+    # Chaque entrée de la table xref pointe sur le début de son objet
+    xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", contenu).group(1))
+    entrees = re.findall(rb"(\d{10}) 00000 n ", contenu[xref:])
+    for numero, offset in enumerate(entrees, start=1):
+        assert contenu[int(offset):].startswith(f"{numero} 0 obj\n".encode())
+
+    pages = int(re.search(rb"/Type /Pages /Kids \[[^\]]*\] /Count (\d+)", contenu).group(1))
+    textes = []
+    for flux in re.findall(rb"stream\n(.*?)\nendstream", contenu, re.S):
+        page = zlib.decompress(flux).decode('cp1252')
+        textes.append([re.sub(r'\\(.)', r'\1', t)
+                       for t in re.findall(r'\(((?:\\.|[^\\)])*)\) Tj', page)])
+    return pages, textes
+
+
+def _donnees(nombre_seances, groupe_nom='Gr_01'):
+    seances = [{'time': f"{8 + i % 10:02d}:00 - {9 + i % 10:02d}:30",
+                'course': f"Cours {i} (TD)", 'type': 'TD', 'room': 'B01',
+                'teacher': 'Mohammed ALAMI', 'group': groupe_nom}
+               for i in range(nombre_seances)]
+    schedule = {jour: [] for jour in ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi")}
+    schedule['Lundi'] = seances
+    return {'title': f"Emploi du Temps - {groupe_nom}", 'subtitle': "FSTT - 2024/2025",
+            'groupe_nom': groupe_nom, 'enseignant_nom': None,
+            'schedule': schedule, 'period': "05/02/2024 - 10/02/2024"}
+
+
+def test_pdf_valide_avec_accents_et_parentheses(tmp_path):
+    chemin = tmp_path / 'test.pdf'
+    with StreamingPdfWriter(str(chemin), 'A4', 'landscape') as pdf:
+        pdf.begin_page()
+        pdf.text(40, 40, "Génie Électrique (S2) \\ Période")
+        pdf.rect(40, 60, 100, 20, fill=(0.9, 0.9, 0.9))
+        pdf.begin_page()            # termine la page précédente
+        pdf.text(40, 40, "Page 2")
+
+    pages, textes = _lire_pdf(chemin)
+    assert pages == 2
+    assert textes == [["Génie Électrique (S2) \\ Période"], ["Page 2"]]
+    assert pdf.width > pdf.height
+
+
+def test_pdf_vide_a_une_page(tmp_path):
+    chemin = tmp_path / 'vide.pdf'
+    StreamingPdfWriter(str(chemin)).close()
+    assert _lire_pdf(chemin)[0] == 1
+
+
+@pytest.mark.parametrize('police', ['Helvetica', 'Courier'])
+def test_fit_text_respecte_la_largeur(tmp_path, police):
+    with StreamingPdfWriter(str(tmp_path / 'f.pdf'), police=police) as pdf:
+        texte = "Programmation orientée objet avancée"
+        assert pdf.fit_text(texte, 1000, 10) == texte
+        court = pdf.fit_text(texte, 80, 10)
+        assert court.endswith("...") and pdf.text_width(court, 10) <= 80
+        assert pdf.fit_text(texte, 1, 10) == ""
+
+
+def test_emploi_du_temps_sur_plusieurs_pages(tmp_path):
+    """Toutes les séances sont dessinées, l'en-tête est répété à chaque page"""
+    donnees = _donnees(80)
+    ok, chemin, erreur = TimetableExportService._export_pdf(donnees, 'gr', str(tmp_path))
+    assert ok, erreur
+
+    pages, textes = _lire_pdf(chemin)
+    assert pages == len(textes) > 1
+    assert textes[0][0] == "Emploi du Temps - Gr_01"
+    assert all(page[0] == "Emploi du Temps - Gr_01 (suite)" for page in textes[1:])
+    tous = [t for page in textes for t in page]
+    assert [t for t in tous if t.startswith("Cours ")] == [f"Cours {i} (TD)" for i in range(80)]
+    # Le jour n'est écrit qu'en tête de chaque page
+    assert tous.count("Lundi") == pages
+
+
+def test_livret_une_page_par_groupe(db, faculte, tmp_path, monkeypatch):
+    monkeypatch.setitem(EXPORT_CONFIG, 'pdf_dir', tmp_path)
+    db.ajouter_seance('Analyse', 'Cours', '2024-02-05', '08:30', '10:00',
+                      faculte['salles'][0], faculte['enseignants'][0], faculte['groupes'][1])
+    service = TimetableExportService(db)
+    ok, chemin, erreur = service.export_pdf_booklet(filename='livret')
+    assert ok, erreur
+
+    pages, textes = _lire_pdf(chemin)
+    assert pages == 2
+    assert [page[0] for page in textes] == ["Emploi du Temps - Gr_01", "Emploi du Temps - Gr_02"]
+    assert "Analyse" in textes[1] and "Analyse" not in textes[0]
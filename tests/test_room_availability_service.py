@@ -0,0 +1,34 @@
+# tests/test_room_availability_service.py
+from src.logic.room_availability_service import RoomAvailabilityService
+
+
+def _noms(salles):
+    return sorted(salle['nom'] for salle in salles)
+
+
+def test_salles_libres_avec_pause_et_reservations(db, faculte):
+    b01, b02, b03 = faculte['salles']
+    alami = faculte['enseignants'][0]
+    db.ajouter_seance('Analyse', 'Cours', '2024-02-05', '09:00', '10:30', b01, alami, faculte['groupes'][0])
+    reservation = db.ajouter_reservation(alami, b02, '2024-02-05', '11:00', '12:00', 'Soutenance')
+    db.modifier_statut_reservation(reservation, 'validee')
+    db.ajouter_reservation(alami, b03, '2024-02-05', '11:00', '12:00', 'En attente')
+    service = RoomAvailabilityService(db)
+
+    # 10:35 : après la séance mais pendant la pause obligatoire
+    assert _noms(service.find_available_rooms('2024-02-05', '10:35', '10:40')) == ['B02', 'B03']
+    # Pause respectée ; réservation validée bloquante, réservation en attente ignorée
+    assert _noms(service.find_available_rooms('2024-02-05', '10:45', '12:15')) == ['B01', 'B03']
+    assert _noms(service.find_available_rooms('2024-02-06', '10:45', '12:15')) == ['B01', 'B02', 'B03']
+
+
+def test_recherche_par_creneau_identique_a_la_recherche_simple(db, faculte):
+    b01, b02, _ = faculte['salles']
+    alami, bennis = faculte['enseignants']
+    db.ajouter_seance('Analyse', 'Cours', '2024-02-05', '09:00', '10:30', b01, alami, faculte['groupes'][0])
+    db.ajouter_seance('Algèbre', 'TD', '2024-02-05', '12:00', '13:00', b02, bennis, faculte['groupes'][1])
+    service = RoomAvailabilityService(db)
+
+    par_creneau = service.find_available_rooms_by_slot('2024-02-05')
+    for (debut, fin), salles in par_creneau.items():
+        assert _noms(salles) == _noms(service.find_available_rooms('2024-02-05', debut, fin))
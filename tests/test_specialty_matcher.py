@@ -0,0 +1,95 @@
+# tests/test_specialty_matcher.py
+import random
+
+from src.logic.specialty_matcher import SpecialtyMatcher, plan_associations
+from src.logic.subject_catalog import get_catalog
+
+
+def _specialites_boucle(keywords, nom):
+    """Ancienne règle : un mot-clé de la spécialité contenu dans le nom (sans casse)"""
+    nom = nom.lower()
+    return frozenset(specialite for specialite, mots in keywords.items()
+                     if any(mot and mot.lower() in nom for mot in mots))
+
+
+def _associations_boucle(keywords, enseignants, matieres):
+    """Ancienne boucle enseignants x matières x mots-clés d'init_data.py"""
+    associations = []
+    for enseignant in enseignants:
+        mots = keywords.get(enseignant.get('specialite'), [])
+        if not mots:
+            continue
+        duree_max_jour = enseignant['duree_max_jour']   # valeur stockée telle quelle
+        if duree_max_jour is None:
+            duree_max_jour = 480
+        duree_totale = 0
+        for matiere in matieres:
+            if not any(mot.lower() in matiere['nom'].lower() for mot in mots):
+                continue
+            minutes_par_jour = (matiere['nb_heures_total'] / 15 * 60) / 5
+            if duree_totale + minutes_par_jour <= duree_max_jour:
+                associations.append((enseignant['id'], matiere['id']))
+                duree_totale += minutes_par_jour
+    return associations
+
+
+def test_catalogue_complet_identique_a_la_boucle():
+    catalog = get_catalog()
+    matcher = SpecialtyMatcher(catalog.specialite_keywords)
+    noms = {subject[1] for subjects in catalog.matieres_completes.values() for subject in subjects}
+
+    assert noms
+    for nom in noms:
+        assert matcher.specialites(nom) == _specialites_boucle(catalog.specialite_keywords, nom)
+
+
+def test_mots_cles_aleatoires_qui_se_recouvrent():
+    rng = random.Random(24)
+    alphabet = 'abAB é'
+    for _ in range(200):
+        keywords = {
+            f"S{i}": [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                      for _ in range(rng.randint(0, 3))]
+            for i in range(rng.randint(1, 5))
+        }
+        matcher = SpecialtyMatcher(keywords)
+        for _ in range(20):
+            nom = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 15)))
+            assert matcher.specialites(nom) == _specialites_boucle(keywords, nom), (keywords, nom)
+
+
+def test_plan_associations_identique_a_la_boucle():
+    rng = random.Random(25)
+    catalog = get_catalog()
+    keywords = catalog.specialite_keywords
+    specialites = list(keywords) + [None, 'Inconnue']
+    noms = sorted({s[1] for subjects in catalog.matieres_completes.values() for s in subjects})
+    matieres = [{'id': i, 'nom': nom, 'nb_heures_total': rng.choice([21, 42, 45, 60])}
+                for i, nom in enumerate(rng.sample(noms, min(300, len(noms))))]
+    enseignants = [{'id': i, 'specialite': rng.choice(specialites),
+                    'duree_max_jour': rng.choice([None, 0, 30, 120, 480])} for i in range(60)]
+
+    plan = plan_associations(enseignants, matieres, SpecialtyMatcher(keywords))
+
+    assert [(e['id'], m['id']) for e, m in plan] == _associations_boucle(keywords, enseignants, matieres)
+
+
+def test_duree_max_nulle_explicite_respectee():
+    keywords = {'Informatique': ['programmation']}
+    matieres = [{'id': 1, 'nom': 'Programmation C', 'nb_heures_total': 42}]
+    enseignants = [{'id': 1, 'specialite': 'Informatique', 'duree_max_jour': 0},
+                   {'id': 2, 'specialite': 'Informatique', 'duree_max_jour': None}]
+
+    plan = plan_associations(enseignants, matieres, SpecialtyMatcher(keywords))
+
+    assert [(e['id'], m['id']) for e, m in plan] == [(2, 1)]
+
+
+def test_subjects_by_specialite():
+    matcher = SpecialtyMatcher({'Info': ['program', 'algo'], 'Math': ['analyse', 'algèbre']})
+
+    assert matcher.subjects_by_specialite(['Algorithmique', 'Analyse 1', 'Chimie', 'Algèbre et PROGRAMmation']) == {
+        'Info': ['Algorithmique', 'Algèbre et PROGRAMmation'],
+        'Math': ['Analyse 1', 'Algèbre et PROGRAMmation'],
+    }
+    assert matcher.matches('Chimie', 'Info') is False
@@ -0,0 +1,53 @@
+# tests/test_unavailability_service.py
+from src.logic.unavailability_service import UnavailabilityService
+
+LUNDI = '2025-01-06'
+MARDI = '2025-01-07'
+
+
+def test_ajout_sans_replanification_refuse_le_conflit(db, faculte):
+    prof = faculte['enseignants'][0]
+    db.ajouter_seance('Algorithmique', 'Cours', LUNDI, '09:00', '10:30',
+                      faculte['salles'][0], prof, faculte['groupes'][0])
+
+    ok, _ = UnavailabilityService(db).add_unavailability(prof, LUNDI, '08:00', '12:00', 'Jury')
+
+    assert not ok
+    assert db.get_dispo_prof(prof) == []
+
+
+def test_ajout_avec_replanification_deplace_le_cours(db, faculte):
+    prof = faculte['enseignants'][0]
+    seance_id = db.ajouter_seance('Algorithmique', 'Cours', LUNDI, '09:00', '10:30',
+                                  faculte['salles'][0], prof, faculte['groupes'][0])
+    # Absences déjà déclarées : lundi après-midi, et mardi en journée entière
+    # (saisie de l'espace enseignant, sans heure)
+    db.ajouter_disponibilite(prof, LUNDI, '13:00', '19:00', 'Soutenances')
+    conn = db.get_connection()
+    conn.execute("INSERT INTO disponibilites (enseignant_id, date_debut, date_fin, motif) "
+                 "VALUES (?, ?, ?, 'Congrès')", (prof, MARDI, MARDI))
+    conn.commit()
+
+    ok, message = UnavailabilityService(db).add_unavailability(
+        prof, LUNDI, '08:00', '12:00', 'Jury', replanifier=True)
+
+    assert ok, message
+    seance = dict(db.get_connection().execute('SELECT * FROM seances WHERE id = ?', (seance_id,)).fetchone())
+    assert '2025-01-08' <= seance['date'] <= '2025-01-10'
+
+    dispos = UnavailabilityService(db).get_teacher_unavailabilities(prof)
+    assert [(d['date_debut'], d['date_fin']) for d in dispos] == [
+        (LUNDI + ' 08:00', LUNDI + ' 12:00'), (LUNDI + ' 13:00', LUNDI + ' 19:00'), (MARDI, MARDI)]
+    # La charge suit le déplacement
+    assert db.calculer_duree_journee_enseignant(prof, seance['date']) == 90
+
+
+def test_suppression(db, faculte):
+    prof = faculte['enseignants'][1]
+    service = UnavailabilityService(db)
+    ok, _ = service.add_unavailability(prof, LUNDI, '14:00', '16:00')
+    assert ok
+
+    dispo_id = service.get_teacher_unavailabilities(prof)[0]['id']
+    assert service.delete_unavailability(dispo_id)
+    assert service.get_teacher_unavailabilities(prof) == []
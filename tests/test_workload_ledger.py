@@ -0,0 +1,130 @@
+# tests/test_workload_ledger.py
+import random
+import sqlite3
+from datetime import date as Date, timedelta
+
+import pytest
+
+from src.logic.workload_ledger import WorkloadLedger
+
+LUNDI = Date(2025, 1, 6)
+JOURS = [(LUNDI + timedelta(days=i)).isoformat() for i in range(14)]
+
+
+def _heure(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _seance(rng):
+    debut = rng.randrange(8 * 60, 18 * 60, 10)
+    return {'enseignant_id': rng.choice([1, 2, 3]), 'date': rng.choice(JOURS),
+            'heure_debut': _heure(debut), 'heure_fin': _heure(debut + rng.choice([60, 90, 120]))}
+
+
+def _duree(s):
+    h1, m1 = map(int, s['heure_debut'].split(':'))
+    h2, m2 = map(int, s['heure_fin'].split(':'))
+    return h2 * 60 + m2 - h1 * 60 - m1
+
+
+def _total(seances, enseignant_id, jours):
+    """Référence : parcours complet des séances (ancien calcul, une requête par appel)"""
+    return sum(_duree(s) for s in seances if s['enseignant_id'] == enseignant_id and s['date'] in jours)
+
+
+def _semaine(date):
+    jour = Date.fromisoformat(date)
+    lundi = jour - timedelta(days=jour.weekday())
+    return {(lundi + timedelta(days=i)).isoformat() for i in range(7)}
+
+
+def test_totaux_egaux_au_recalcul_complet():
+    rng = random.Random(21)
+    ledger = WorkloadLedger()
+    seances = []
+    for _ in range(400):
+        if seances and rng.random() < 0.3:
+            seance = seances.pop(rng.randrange(len(seances)))
+            ledger.remove(seance)
+        else:
+            seance = _seance(rng)
+            seances.append(seance)
+            ledger.add(seance)
+
+        enseignant_id, date = rng.choice([1, 2, 3]), rng.choice(JOURS)
+        assert ledger.day_minutes(enseignant_id, date) == _total(seances, enseignant_id, {date})
+        assert ledger.week_minutes(enseignant_id, date) == _total(seances, enseignant_id, _semaine(date))
+        debut = rng.randrange(len(JOURS))
+        fin = rng.randrange(debut, len(JOURS))
+        assert (ledger.period_minutes(enseignant_id, JOURS[debut], JOURS[fin])
+                == _total(seances, enseignant_id, set(JOURS[debut:fin + 1])))
+
+
+def test_entrees_ignorees():
+    ledger = WorkloadLedger([
+        {'enseignant_id': None, 'date': JOURS[0], 'heure_debut': '08:00', 'heure_fin': '10:00'},
+        {'enseignant_id': 1, 'date': 'pas une date', 'heure_debut': '08:00', 'heure_fin': '10:00'},
+        {'enseignant_id': 1, 'date': JOURS[0], 'heure_debut': '??', 'heure_fin': '10:00'},
+        {'enseignant_id': 1, 'date': JOURS[0], 'heure_debut': '08:00', 'heure_fin': '12:00',
+         'indisponibilite': True},
+    ])
+    assert ledger.day_minutes(1, JOURS[0]) == 0
+    assert ledger.week_minutes(1, JOURS[0]) == 0
+
+
+def test_fits_limites_jour_et_semaine():
+    ledger = WorkloadLedger([{'enseignant_id': 1, 'date': JOURS[i], 'heure_debut': '08:00',
+                              'heure_fin': '12:00'} for i in range(4)])
+    # 4h par jour du lundi au jeudi
+    assert ledger.fits(1, JOURS[0], 120, max_day=360, max_week=1200)
+    assert not ledger.fits(1, JOURS[0], 150, max_day=360, max_week=1200)
+    assert not ledger.fits(1, JOURS[4], 300, max_day=480, max_week=1200)
+    assert ledger.fits(1, JOURS[7], 300, max_day=480, max_week=1200)
+
+
+def _charge_en_base(db, enseignant_id, jours):
+    lignes = db.get_connection().execute('''
+        SELECT enseignant_id, date, heure_debut, heure_fin FROM seances
+        UNION ALL
+        SELECT enseignant_id, date, heure_debut, heure_fin FROM reservations WHERE statut = 'validee'
+    ''').fetchall()
+    return _total([dict(l) for l in lignes], enseignant_id, jours)
+
+
+def test_registre_de_la_base_suit_toutes_les_ecritures(db, faculte):
+    rng = random.Random(22)
+    profs, salles, groupes = faculte['enseignants'], faculte['salles'], faculte['groupes']
+    seances, reservations = [], []
+    for etape in range(120):
+        s = dict(_seance(rng), enseignant_id=rng.choice(profs))
+        action = rng.random()
+        if action < 0.35 or not seances:
+            seances.append(db.ajouter_seance('Cours', 'Cours', s['date'], s['heure_debut'], s['heure_fin'],
+                                             rng.choice(salles), s['enseignant_id'], rng.choice(groupes)))
+        elif action < 0.55:
+            db.deplacer_seance(rng.choice(seances), s['date'], s['heure_debut'], s['heure_fin'],
+                               rng.choice(salles))
+        elif action < 0.75:
+            reservations.append(db.ajouter_reservation(s['enseignant_id'], rng.choice(salles), s['date'],
+                                                       s['heure_debut'], s['heure_fin']))
+            db.modifier_statut_reservation(reservations[-1], rng.choice(['validee', 'rejetee']))
+        elif action < 0.85:
+            # Transaction annulée : rien ne doit rester dans le registre
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.ajouter_seance('Annulé', 'TD', s['date'], s['heure_debut'], s['heure_fin'],
+                                      rng.choice(salles), s['enseignant_id'], rng.choice(groupes))
+                    raise RuntimeError
+        else:
+            # Écriture par une autre connexion (autre processus)
+            autre = sqlite3.connect(db.db_path)
+            autre.execute('INSERT INTO seances (titre, type_seance, date, heure_debut, heure_fin, '
+                          'salle_id, enseignant_id, groupe_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                          ('Externe', 'TP', s['date'], s['heure_debut'], s['heure_fin'],
+                           rng.choice(salles), s['enseignant_id'], rng.choice(groupes)))
+            autre.commit()
+            autre.close()
+
+        prof, date = rng.choice(profs), rng.choice(JOURS)
+        assert db.calculer_duree_journee_enseignant(prof, date) == _charge_en_base(db, prof, {date}), etape
+        assert db.calculer_duree_semaine_enseignant(prof, date) == _charge_en_base(db, prof, _semaine(date))
@@ -0,0 +1,160 @@
+# tests/test_xlsx_writer.py
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date
+
+import pytest
+
+from config import EXPORT_CONFIG
+from src.logic.timetable_export_service import TimetableExportService
+from src.logic.xlsx_writer import StreamingXlsxWriter
+
+NS = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+JOURS = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
+
+
+def _colonne(ref):
+    numero = 0
+    for lettre in ref.rstrip('0123456789'):
+        numero = numero * 26 + ord(lettre) - 64
+    return numero
+
+
+def _lire_xlsx(path):
+    """{nom de feuille: lignes} ; les cellules vides redeviennent ''"""
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        classeur = ET.fromstring(archive.read('xl/workbook.xml'))
+        noms = [f.get('name') for f in classeur.find('x:sheets', NS)]
+        feuilles = {}
+        for index, nom in enumerate(noms, start=1):
+            feuille = ET.fromstring(archive.read(f'xl/worksheets/sheet{index}.xml'))
+            lignes = []
+            for ligne in feuille.find('x:sheetData', NS):
+                valeurs = {}
+                for cellule in ligne:
+                    if cellule.get('t') == 'inlineStr':
+                        valeur = cellule.find('x:is/x:t', NS).text or ''
+                    else:
+                        texte = cellule.find('x:v', NS).text
+                        valeur = float(texte) if '.' in texte else int(texte)
+                    valeurs[_colonne(cellule.get('r'))] = valeur
+                lignes.append([valeurs.get(c, '') for c in range(1, max(valeurs, default=0) + 1)])
+            feuilles[nom] = lignes
+    return feuilles
+
+
+def test_relecture_identique_aux_lignes_ecrites(tmp_path):
+    lignes = [
+        ["Date", "Cours", "Effectif"],
+        ["2024-02-05", "Résistance des matériaux <TP> & \"projet\"", 35],
+        ["", "cellule vide avant", 2.5],
+        ["contrôle\x07supprimé", None, 0],
+    ] + [[f"ligne {i}", i] for i in range(500)]
+    chemin = tmp_path / 'test.xlsx'
+    with StreamingXlsxWriter(str(chemin)) as xlsx:
+        xlsx.add_sheet("GI", column_widths=[12, 30])
+        for i, ligne in enumerate(lignes):
+            xlsx.write_row(ligne, header=(i == 0))
+
+    attendu = [[('' if v is None else v) for v in ligne] for ligne in lignes]
+    attendu[3][0] = "contrôlesupprimé"
+    assert _lire_xlsx(chemin) == {'GI': attendu}
+
+
+def test_noms_de_feuilles_valides_et_uniques(tmp_path):
+    chemin = tmp_path / 'noms.xlsx'
+    with StreamingXlsxWriter(str(chemin)) as xlsx:
+        noms = [xlsx.add_sheet(nom) for nom in
+                ("L3 Génie/Informatique", "gi", "GI", "x" * 40, "x" * 40, "")]
+    assert noms == ["L3 Génie_Informatique", "gi", "GI (2)", "x" * 31,
+                    "x" * 27 + " (2)", "Feuille"]
+    assert list(_lire_xlsx(chemin)) == noms
+
+
+def test_classeur_vide_a_une_feuille(tmp_path):
+    chemin = tmp_path / 'vide.xlsx'
+    StreamingXlsxWriter(str(chemin)).close()
+    assert _lire_xlsx(chemin) == {'Feuille1': []}
+
+
+@pytest.fixture
+def seances(db, faculte):
+    g1, g2 = faculte['groupes']
+    s1, s2, _ = faculte['salles']
+    e1, e2 = faculte['enseignants']
+    for args in [
+        ('Analyse', 'Cours', '2024-02-06', '10:15', '11:45', s1, e1, g1),
+        ('Analyse', 'TD', '2024-02-05', '08:30', '10:00', s2, e1, g1),
+        ('Algèbre', 'Cours', '2024-02-05', '08:30', '10:00', s1, e2, g2),
+        ('Hors période', 'TP', '2024-03-04', '08:30', '10:00', s1, e2, g2),
+    ]:
+        db.ajouter_seance(*args)
+    reservation = db.ajouter_reservation(e1, s2, '2024-02-07', '14:00', '16:00', 'Soutenance')
+    db.modifier_statut_reservation(reservation, 'validee')
+    return faculte
+
+
+def _ligne_rapport(jour, debut, fin, titre, type_seance, salle, groupe, enseignant):
+    return [jour, JOURS[date.fromisoformat(jour).weekday()],
+            f"{debut} - {fin}", titre, type_seance, salle, groupe, enseignant]
+
+
+def test_rapport_par_groupe_identique_aux_seances_de_chaque_groupe(db, seances, tmp_path, monkeypatch):
+    """Une requête triée pour tout le rapport = les séances lues groupe par groupe"""
+    monkeypatch.setitem(EXPORT_CONFIG, 'excel_dir', tmp_path)
+    ok, chemin, erreur = TimetableExportService(db).export_excel_report(
+        'groupe', '2024-02-05', '2024-02-10', filename='rapport')
+    assert ok, erreur
+
+    salles = {s['id']: s['nom'] for s in db.get_toutes_salles()}
+    enseignants = {u['id']: f"{u['prenom']} {u['nom']}" for u in db.get_tous_utilisateurs()}
+    attendu = {}
+    for groupe in db.get_tous_groupes():
+        feuille = f"{groupe['nom']} - L3 Génie Informatique"
+        lignes = sorted(
+            (dict(s) for s in db.get_seances_by_groupe(groupe['id'], '2024-02-05', '2024-02-10')),
+            key=lambda s: (s['date'], s['heure_debut']))
+        attendu[feuille] = [
+            _ligne_rapport(s['date'], s['heure_debut'], s['heure_fin'], s['titre'], s['type_seance'],
+                           salles[s['salle_id']], groupe['nom'], enseignants[s['enseignant_id']])
+            for s in lignes
+        ]
+
+    feuilles = _lire_xlsx(chemin)
+    assert list(feuilles) == list(attendu)
+    for nom, lignes in feuilles.items():
+        assert lignes[0] == [f"Emploi du Temps - {nom}"]
+        assert lignes[2] == ["Période: 2024-02-05 - 2024-02-10"]
+        assert lignes[4] == [entete for entete, _ in TimetableExportService.REPORT_COLUMNS]
+        assert lignes[5:] == attendu[nom]
+
+
+def test_rapport_par_enseignant_inclut_les_reservations(db, seances, tmp_path, monkeypatch):
+    monkeypatch.setitem(EXPORT_CONFIG, 'excel_dir', tmp_path)
+    ok, chemin, erreur = TimetableExportService(db).export_excel_report('enseignant', filename='rapport')
+    assert ok, erreur
+
+    feuilles = _lire_xlsx(chemin)
+    assert list(feuilles) == ["Fatima BENNIS", "Mohammed ALAMI"]
+    assert [ligne[3] for ligne in feuilles["Mohammed ALAMI"][5:]] == [
+        "Analyse", "Analyse", "Réservation - Soutenance"]
+    assert [ligne[3] for ligne in feuilles["Fatima BENNIS"][5:]] == ["Algèbre", "Hors période"]
+
+
+def test_rapport_regroupement_inconnu(db):
+    assert TimetableExportService(db).export_excel_report('salle') == (
+        False, None, "Regroupement non supporté: salle")
+
+
+def test_emploi_du_temps_excel_contient_chaque_seance(tmp_path):
+    donnees = {'title': "Emploi du Temps - Mohammed ALAMI", 'subtitle': "FSTT",
+               'groupe_nom': None, 'enseignant_nom': "Mohammed ALAMI", 'period': "p",
+               'schedule': {"Lundi": [{'time': "08:30 - 10:00", 'course': "Analyse", 'type': "TD",
+                                       'room': "B01", 'teacher': "Mohammed ALAMI", 'group': "Gr_01"}],
+                            "Mardi": []}}
+    ok, chemin, erreur = TimetableExportService._export_excel(donnees, 'prof', str(tmp_path))
+    assert ok, erreur
+    # Emploi du temps d'un enseignant : la dernière colonne est le groupe
+    assert _lire_xlsx(chemin)["Mohammed ALAMI"][5:] == [
+        ["Lundi", "08:30 - 10:00", "Analyse", "TD", "B01", "Gr_01"]]